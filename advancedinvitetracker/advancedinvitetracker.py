@@ -1,8 +1,16 @@
+import asyncio
 import discord
+import logging
+from collections import defaultdict, deque
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 from datetime import datetime
 
+log = logging.getLogger("red.advancedinvitetracker")
+
+# Joins arriving within this many seconds of each other share one invite refetch.
+INVITE_REFRESH_DELAY = 1.0
+
 class AdvancedInviteTracker(commands.Cog):
     """Advanced Invite Tracker Cog"""
 
@@ -12,59 +20,121 @@ class AdvancedInviteTracker(commands.Cog):
         default_guild = {
             "invites": {},
             "invite_counts": {},
+            "invited_by": {},
             "log_channel": None,
             "variables": {}
         }
         self.config.register_guild(**default_guild)
-        self.invites_cache = {}
+        self.invites_cache = {}  # guild_id -> {code: (uses, inviter)}
+        self.invite_refreshes = {}  # guild_id -> pending refetch task shared by a burst of joins
+        # Write-through copies of the ``invited_by`` and ``invite_counts`` Config values.
+        self.invited_by = {}  # guild_id -> {member_id: inviter_id}
+        self.invite_counts = {}  # guild_id -> {inviter_id: {"joined": int, "left": int}}
+        # guild_id -> lock held while the guild's invite data is read and written back.
+        self.invite_locks = defaultdict(asyncio.Lock)
+
+    async def load_invite_index(self):
+        for guild_id, data in (await self.config.all_guilds()).items():
+            # Counters written one key at a time may lack "joined" or "left".
+            self.invite_counts[guild_id] = {
+                inviter_id: {"joined": 0, "left": 0, **counts} for inviter_id, counts in data["invite_counts"].items()
+            }
+            invited_by = {int(member_id): inviter_id for member_id, inviter_id in data["invited_by"].items()}
+            if not invited_by and data["invites"]:
+                # Build the index once from the inviter -> invitees lists tracked before it existed.
+                for inviter_id, invitees in data["invites"].items():
+                    invited_by.update({invitee: inviter_id for invitee in invitees if isinstance(invitee, int)})
+                await self.config.guild_from_id(guild_id).invited_by.set({str(member_id): inviter_id for member_id, inviter_id in invited_by.items()})
+            self.invited_by[guild_id] = invited_by
+
+    async def increment_count(self, guild, inviter_id, field):
+        """Increment one invite counter, writing only that inviter's counters back to Config.
+
+        Callers hold ``invite_locks[guild.id]`` so the writes reach Config in order.
+        """
+        counts = self.invite_counts.setdefault(guild.id, {}).setdefault(inviter_id, {"joined": 0, "left": 0})
+        counts[field] += 1
+        await self.config.guild(guild).set_raw("invite_counts", inviter_id, value=counts)
 
     async def initialize(self):
         await self.bot.wait_until_ready()
-        for guild in self.bot.guilds:
-            try:
-                self.invites_cache[guild.id] = await guild.invites()
-            except discord.Forbidden:
-                print(f"Missing permissions to fetch invites for guild: {guild.name} ({guild.id})")
+        await asyncio.gather(*(self.cache_invites(guild) for guild in self.bot.guilds))
+
+    async def cache_invites(self, guild):
+        try:
+            self.invites_cache[guild.id] = self.index_invites(await guild.invites())
+        except discord.Forbidden:
+            log.warning("Missing permissions to fetch invites for guild: %s (%s)", guild.name, guild.id)
+        except discord.HTTPException as e:
+            # One guild failing must not stop the others, or the cog, from loading.
+            log.warning("Failed to fetch invites for guild: %s (%s): %s", guild.name, guild.id, e)
+
+    @staticmethod
+    def index_invites(invites):
+        return {invite.code: (invite.uses or 0, invite.inviter) for invite in invites}
+
+    async def resolve_inviter(self, guild):
+        """Return the inviter credited for a member who just joined ``guild``, or ``None``."""
+        task = self.invite_refreshes.get(guild.id)
+        if task is None:
+            task = self.invite_refreshes[guild.id] = asyncio.create_task(self.refresh_invites(guild))
+        credits = await asyncio.shield(task)
+        return credits.popleft() if credits else None
+
+    async def refresh_invites(self, guild):
+        """Refetch the guild's invites once for a burst of joins and diff the use counts.
+
+        Returns one inviter per gained use, consumed by the joins that share this refetch.
+        """
+        await asyncio.sleep(INVITE_REFRESH_DELAY)
+        # Joins from now on may postdate the request below, so they start a new refetch.
+        self.invite_refreshes.pop(guild.id, None)
+        credits = deque()
+        try:
+            invites = await guild.invites()
+        except discord.HTTPException:
+            return credits
+        cached = self.invites_cache.get(guild.id, {})
+        for invite in invites:
+            uses = invite.uses or 0
+            gained = uses - cached.get(invite.code, (uses, None))[0]
+            if gained > 0 and invite.inviter is not None:
+                credits.extend([invite.inviter] * gained)
+        self.invites_cache[guild.id] = self.index_invites(invites)
+        return credits
 
     @commands.Cog.listener()
     async def on_member_join(self, member):
-        invites_before = self.invites_cache.get(member.guild.id, [])
-        invites_after = await member.guild.invites()
-        self.invites_cache[member.guild.id] = invites_after
-
-        invite_used = None
-        for invite in invites_before:
-            if invite.uses < next((i.uses for i in invites_after if i.code == invite.code), invite.uses):
-                invite_used = invite
-                break
-
-        if invite_used:
-            inviter_id = str(invite_used.inviter.id)
-            async with self.config.guild(member.guild).invites() as invites:
-                if inviter_id not in invites:
-                    invites[inviter_id] = []
-                invites[inviter_id].append(member.id)
-
-            async with self.config.guild(member.guild).invite_counts() as invite_counts:
-                if inviter_id not in invite_counts:
-                    invite_counts[inviter_id] = {"joined": 0, "left": 0}
-                invite_counts[inviter_id]["joined"] += 1
-
-            await self.send_invite_embed(member, invite_used.inviter, "joined")
+        inviter = await self.resolve_inviter(member.guild)
+
+        if inviter:
+            inviter_id = str(inviter.id)
+            guild_config = self.config.guild(member.guild)
+            async with self.invite_locks[member.guild.id]:
+                invitees = await guild_config.get_raw("invites", inviter_id, default=[])
+                invitees.append(member.id)
+                await guild_config.set_raw("invites", inviter_id, value=invitees)
+                self.invited_by.setdefault(member.guild.id, {})[member.id] = inviter_id
+                await guild_config.set_raw("invited_by", str(member.id), value=inviter_id)
+                await self.increment_count(member.guild, inviter_id, "joined")
+
+            await self.send_invite_embed(member, inviter, "joined")
 
     @commands.Cog.listener()
     async def on_member_remove(self, member):
-        async with self.config.guild(member.guild).invites() as invites:
-            for inviter_id, invitees in invites.items():
-                if member.id in invitees:
-                    invitees.remove(member.id)
-                    async with self.config.guild(member.guild).invite_counts() as invite_counts:
-                        if inviter_id not in invite_counts:
-                            invite_counts[inviter_id] = {"joined": 0, "left": 0}
-                        invite_counts[inviter_id]["left"] += 1
-                    inviter = member.guild.get_member(int(inviter_id))
-                    await self.send_invite_embed(member, inviter, "left")
-                    break
+        guild_config = self.config.guild(member.guild)
+        async with self.invite_locks[member.guild.id]:
+            inviter_id = self.invited_by.get(member.guild.id, {}).pop(member.id, None)
+            if inviter_id is None:
+                return
+            await guild_config.clear_raw("invited_by", str(member.id))
+            invitees = await guild_config.get_raw("invites", inviter_id, default=[])
+            if member.id in invitees:
+                invitees.remove(member.id)
+                await guild_config.set_raw("invites", inviter_id, value=invitees)
+            await self.increment_count(member.guild, inviter_id, "left")
+        inviter = member.guild.get_member(int(inviter_id))
+        await self.send_invite_embed(member, inviter, "left")
 
     async def send_invite_embed(self, member, inviter, action):
         if not inviter:
@@ -92,7 +162,7 @@ class AdvancedInviteTracker(commands.Cog):
     @commands.admin_or_permissions(manage_guild=True)
     async def add_invites(self, ctx, inviter: discord.Member, invite_code: str):
         """Add a new invite to the tracker."""
-        async with self.config.guild(ctx.guild).invites() as invites:
+        async with self.invite_locks[ctx.guild.id], self.config.guild(ctx.guild).invites() as invites:
             invites.setdefault(str(inviter.id), []).append(invite_code)
         await ctx.send(f"Invite `{invite_code}` added for {inviter.mention}.")
 
@@ -100,8 +170,12 @@ class AdvancedInviteTracker(commands.Cog):
     @commands.admin_or_permissions(manage_guild=True)
     async def reset_invites(self, ctx):
         """Reset the invite tracker."""
-        await self.config.guild(ctx.guild).invites.clear()
-        await self.config.guild(ctx.guild).invite_counts.clear()
+        async with self.invite_locks[ctx.guild.id]:
+            await self.config.guild(ctx.guild).invites.clear()
+            await self.config.guild(ctx.guild).invite_counts.clear()
+            await self.config.guild(ctx.guild).invited_by.clear()
+            self.invite_counts.pop(ctx.guild.id, None)
+            self.invited_by.pop(ctx.guild.id, None)
         await ctx.send("Invite tracker has been reset.")
 
     @invites.command(name="invites")
@@ -109,7 +183,7 @@ class AdvancedInviteTracker(commands.Cog):
         """View the current invite tracker."""
         member = member or ctx.author
         invites = await self.config.guild(ctx.guild).invites()
-        invite_counts = await self.config.guild(ctx.guild).invite_counts()
+        invite_counts = self.invite_counts.get(ctx.guild.id, {})
         inviter_id = str(member.id)
         if inviter_id in invites:
             embed = discord.Embed(
@@ -127,18 +201,20 @@ class AdvancedInviteTracker(commands.Cog):
     @commands.admin_or_permissions(manage_guild=True)
     async def delete_invite(self, ctx, inviter: discord.Member, invite_code: str):
         """Delete a specific invite from the tracker."""
-        async with self.config.guild(ctx.guild).invites() as invites:
+        async with self.invite_locks[ctx.guild.id], self.config.guild(ctx.guild).invites() as invites:
             inviter_id = str(inviter.id)
-            if inviter_id in invites and invite_code in invites[inviter_id]:
+            removed = inviter_id in invites and invite_code in invites[inviter_id]
+            if removed:
                 invites[inviter_id].remove(invite_code)
-                await ctx.send(f"Invite `{invite_code}` removed for {inviter.mention}.")
-            else:
-                await ctx.send(f"{inviter.mention} does not have invite `{invite_code}` tracked.")
+        if removed:
+            await ctx.send(f"Invite `{invite_code}` removed for {inviter.mention}.")
+        else:
+            await ctx.send(f"{inviter.mention} does not have invite `{invite_code}` tracked.")
 
     @invites.command(name="leaderboard")
     async def invite_leaderboard(self, ctx):
         """View the leaderboard for top inviters in your server."""
-        invite_counts = await self.config.guild(ctx.guild).invite_counts()
+        invite_counts = self.invite_counts.get(ctx.guild.id, {})
         sorted_invites = sorted(invite_counts.items(), key=lambda x: x[1]["joined"] - x[1]["left"], reverse=True)
         pages = []
         page = []
@@ -207,7 +283,7 @@ class AdvancedInviteTracker(commands.Cog):
     async def stats(self, ctx):
         """View statistics about your server, including invite tracking."""
         guild = ctx.guild
-        invite_counts = await self.config.guild(guild).invite_counts()
+        invite_counts = self.invite_counts.get(guild.id, {})
         total_invites = sum(counts["joined"] for counts in invite_counts.values())
         total_left = sum(counts["left"] for counts in invite_counts.values())
         net_invites = total_invites - total_left
@@ -283,10 +359,7 @@ class AdvancedInviteTracker(commands.Cog):
 
     @commands.Cog.listener()
     async def on_guild_join(self, guild):
-        try:
-            self.invites_cache[guild.id] = await guild.invites()
-        except discord.Forbidden:
-            print(f"Missing permissions to fetch invites for guild: {guild.name} ({guild.id})")
+        await self.cache_invites(guild)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild):
@@ -295,20 +368,21 @@ class AdvancedInviteTracker(commands.Cog):
 
     @commands.Cog.listener()
     async def on_invite_create(self, invite):
-        try:
-            self.invites_cache[invite.guild.id] = await invite.guild.invites()
-        except discord.Forbidden:
-            print(f"Missing permissions to fetch invites for guild: {invite.guild.name} ({invite.guild.id})")
+        if invite.guild is None:
+            return
+        self.invites_cache.setdefault(invite.guild.id, {})[invite.code] = (invite.uses or 0, invite.inviter)
 
     @commands.Cog.listener()
     async def on_invite_delete(self, invite):
-        try:
-            self.invites_cache[invite.guild.id] = await invite.guild.invites()
-        except discord.Forbidden:
-            print(f"Missing permissions to fetch invites for guild: {invite.guild.name} ({invite.guild.id})")
+        if invite.guild is None:
+            return
+        self.invites_cache.get(invite.guild.id, {}).pop(invite.code, None)
 
     async def cog_load(self):
+        await self.load_invite_index()
         await self.initialize()
 
     async def cog_unload(self):
+        for task in self.invite_refreshes.values():
+            task.cancel()
         self.invites_cache.clear()
@@ -1,8 +1,15 @@
 from redbot.core import commands, Config
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 from datetime import datetime
 import discord
+import logging
+import typing
+from .audit_log import AuditLogReader, format_moderator
 from .dashboard_integration import DashboardIntegration
+from .webhook_sink import WebhookSink
+
+log = logging.getLogger("red.advancedlogger")
 
 class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``DashboardIntegration``.
     """A cog for advanced logging of various actions in a server"""
@@ -38,25 +45,109 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
             "scheduled_event_log_channel": None,
             "stage_instance_log_channel": None,
             "command_log_channel": None,  # Added for command logging
+            "use_webhooks": False,
+            "log_webhooks": {},  # channel_id -> webhook URL
         }
         self.config.register_guild(**default_guild)
+        # guild_id -> {log_type: channel_id}, only log types with a channel set are present.
+        self.log_routes: typing.Dict[int, typing.Dict[str, int]] = {}
+        self.audit_log = AuditLogReader()
+        self.webhook_guilds: typing.Set[int] = set()
+        self.webhook_urls: typing.Dict[int, str] = {}
+        self.webhook_sink = WebhookSink(
+            cog_data_path(self) / "webhook_spool.json",
+            on_gone=self.reroute_webhook_logs,
+        )
+
+    async def cog_load(self):
+        for guild_id, data in (await self.config.all_guilds()).items():
+            self.log_routes[guild_id] = self._build_routes(data)
+            if data["use_webhooks"]:
+                self.webhook_guilds.add(guild_id)
+            self.webhook_urls.update({int(channel_id): url for channel_id, url in data["log_webhooks"].items()})
+        await self.webhook_sink.start()
+
+    async def cog_unload(self):
+        await self.webhook_sink.stop()
+
+    @staticmethod
+    def _build_routes(data: typing.Dict[str, typing.Any]) -> typing.Dict[str, int]:
+        return {
+            key[: -len("_log_channel")]: channel_id
+            for key, channel_id in data.items()
+            if key.endswith("_log_channel") and channel_id
+        }
+
+    async def set_log_channel(self, guild: discord.Guild, log_type: str, channel_id: typing.Optional[int]):
+        await self.config.guild(guild).set_raw(log_type + "_log_channel", value=channel_id)
+        routes = self.log_routes.setdefault(guild.id, {})
+        if channel_id:
+            routes[log_type] = channel_id
+        else:
+            routes.pop(log_type, None)
+
+    def get_log_channel(self, guild: typing.Optional[discord.Guild], log_type: str) -> typing.Optional[discord.abc.GuildChannel]:
+        if guild is None:
+            return None
+        channel_id = self.log_routes.get(guild.id, {}).get(log_type)
+        return guild.get_channel(channel_id) if channel_id else None
+
+    def is_logging(self, guild: typing.Optional[discord.Guild], log_type: str) -> bool:
+        """Check the routing table so disabled log types skip all further work."""
+        return self.get_log_channel(guild, log_type) is not None
 
     async def log_event(self, guild: discord.Guild, log_type: str, title: str, description: str, color: discord.Color = discord.Color.blue(), author: discord.Member = None):
+        log_channel = self.get_log_channel(guild, log_type)
+        if log_channel is None:
+            return
+        embed = discord.Embed(title=title, description=description, color=color, timestamp=datetime.utcnow())
+        if author:
+            embed.set_thumbnail(url=author.display_avatar.url)
+        if guild.id in self.webhook_guilds:
+            webhook_url = await self.get_webhook_url(log_channel)
+            if webhook_url is not None:
+                self.webhook_sink.put(log_channel.id, webhook_url, embed)
+                return
         try:
-            log_channel_id = await self.config.guild(guild).get_raw(log_type + "_log_channel")
-            if log_channel_id:
-                log_channel = self.bot.get_channel(log_channel_id)
-                if log_channel:
-                    embed = discord.Embed(title=title, description=description, color=color, timestamp=datetime.utcnow())
-                    if author:
-                        embed.set_thumbnail(url=author.display_avatar.url)
-                    await log_channel.send(embed=embed)
-                else:
-                    print(f"Log channel not found for log type: {log_type} in guild {guild.name}")
-            else:
-                print(f"No log channel set for log type: {log_type} in guild {guild.name}")
-        except Exception as e:
-            print(f"Failed to log event in guild {guild.name}: {e}")
+            await log_channel.send(embed=embed)
+        except discord.HTTPException:
+            log.exception("Failed to send %s log in guild %s (%s).", log_type, guild.name, guild.id)
+
+    async def get_webhook_url(self, channel: discord.TextChannel) -> typing.Optional[str]:
+        """Return the URL of the webhook used to log to ``channel``, creating it if needed."""
+        if channel.id in self.webhook_urls:
+            return self.webhook_urls[channel.id]
+        try:
+            webhook = discord.utils.find(
+                lambda w: w.user == channel.guild.me and w.token is not None, await channel.webhooks()
+            ) or await channel.create_webhook(name="AdvancedLogger", reason="AdvancedLogger webhook log sink.")
+        except discord.HTTPException as e:
+            log.warning("Could not get a webhook for channel %s, falling back to regular messages: %s", channel.id, e)
+            return None
+        self.webhook_urls[channel.id] = webhook.url
+        async with self.config.guild(channel.guild).log_webhooks() as log_webhooks:
+            log_webhooks[str(channel.id)] = webhook.url
+        return webhook.url
+
+    async def reroute_webhook_logs(self, channel_id: int, batches: typing.List[typing.List[dict]]):
+        """Send the entries spooled for a deleted webhook as regular messages and forget its URL.
+
+        The next log for the channel creates a new webhook through ``get_webhook_url``.
+        """
+        self.webhook_urls.pop(channel_id, None)
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            return
+        async with self.config.guild(channel.guild).log_webhooks() as log_webhooks:
+            log_webhooks.pop(str(channel_id), None)
+        for batch in batches:
+            try:
+                await channel.send(embeds=[discord.Embed.from_dict(embed) for embed in batch])
+            except (discord.Forbidden, discord.NotFound):
+                log.warning("Cannot send to channel %s, discarding %s rerouted webhook log entries.", channel_id, sum(map(len, batches)))
+                return
+            except discord.HTTPException:
+                log.exception("Failed to reroute %s webhook log entries to channel %s.", len(batch), channel_id)
 
     @commands.group()
     @commands.admin_or_permissions(manage_guild=True)
@@ -103,7 +194,7 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         if log_type not in valid_log_types:
             await ctx.send(f"Invalid log type. Valid log types are: {', '.join(valid_log_types)}")
             return
-        await self.config.guild(ctx.guild).set_raw(log_type + "_log_channel", value=channel.id)
+        await self.set_log_channel(ctx.guild, log_type, channel.id)
         await ctx.send(f"{log_type.capitalize()} logging channel set to {channel.mention}")
 
     @logging.command()
@@ -145,13 +236,38 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         if log_type not in valid_log_types:
             await ctx.send(f"Invalid log type. Valid log types are: {', '.join(valid_log_types)}")
             return
-        await self.config.guild(ctx.guild).set_raw(log_type + "_log_channel", value=None)
+        await self.set_log_channel(ctx.guild, log_type, None)
         await ctx.send(f"{log_type.capitalize()} logging channel removed")
 
+    @logging.command()
+    async def webhooks(self, ctx, enabled: typing.Optional[bool] = None):
+        """Send logs through channel webhooks instead of regular bot messages.
+
+        Webhook logs are sent several embeds at a time, retried when Discord is unavailable and kept on disk until they are delivered.
+        The bot needs the `Manage Webhooks` permission in the log channels.
+
+        **Example**:
+        `[p]logging webhooks true`
+        `[p]logging webhooks false`
+        """
+        if enabled is not None:
+            await self.config.guild(ctx.guild).use_webhooks.set(enabled)
+            if enabled:
+                self.webhook_guilds.add(ctx.guild.id)
+            else:
+                self.webhook_guilds.discard(ctx.guild.id)
+        enabled = ctx.guild.id in self.webhook_guilds
+        await ctx.send(
+            f"Webhook logging is {'enabled' if enabled else 'disabled'}. "
+            f"Pending entries: {self.webhook_sink.pending}, failed deliveries: {self.webhook_sink.failures}, dropped entries: {self.webhook_sink.dropped}."
+        )
+
     @commands.Cog.listener()
     async def on_command(self, ctx):
         """Log command usage."""
         guild = ctx.guild
+        if not self.is_logging(guild, "command"):
+            return
         if guild:
             description = (
                 f"**Command Used:** {ctx.command}\n"
@@ -164,6 +280,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
 
     @commands.Cog.listener()
     async def on_message_edit(self, before, after):
+        if not self.is_logging(before.guild, "message"):
+            return
         if before.author.bot:
             return
         if before.content != after.content:
@@ -185,6 +303,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         if message.author.bot:
             return
         guild = message.guild
+        if not self.is_logging(guild, "message"):
+            return
         description = (
             f"**Message Deleted in {message.channel.mention}**\n"
             f"**Content:** {message.content}\n"
@@ -198,6 +318,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
 
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
+        if not self.is_logging(interaction.guild, "slash"):
+            return
         if interaction.is_expired():
             return
 
@@ -230,6 +352,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_member_join(self, member):
         guild = member.guild
+        if not self.is_logging(guild, "member"):
+            return
         description = (
             f"**Member Joined:** {member.mention} ({member})\n"
             f"**User ID:** {member.id}\n"
@@ -241,6 +365,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_member_remove(self, member):
         guild = member.guild
+        if not self.is_logging(guild, "member"):
+            return
         description = (
             f"**Member Left:** {member.mention} ({member})\n"
             f"**User ID:** {member.id}\n"
@@ -252,85 +378,101 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.ban, limit=1).get()
+        if not self.is_logging(guild, "ban"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.ban, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Banned By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Banned By:** {format_moderator(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "ban", "User Banned", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "ban", "User Banned", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.unban, limit=1).get()
+        if not self.is_logging(guild, "ban"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.unban, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Unbanned By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Unbanned By:** {format_moderator(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "ban", "User Unbanned", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "ban", "User Unbanned", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_kick(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.kick, limit=1).get()
+        if not self.is_logging(guild, "kick"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.kick, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Kicked By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Kicked By:** {format_moderator(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "kick", "User Kicked", description, discord.Color.orange(), entry.user)
+        await self.log_event(guild, "kick", "User Kicked", description, discord.Color.orange(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_warn(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.warn, limit=1).get()
+        if not self.is_logging(guild, "warn"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.warn, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Warned By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Warned By:** {format_moderator(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "warn", "User Warned", description, discord.Color.yellow(), entry.user)
+        await self.log_event(guild, "warn", "User Warned", description, discord.Color.yellow(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_mute(self, guild, user, duration):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.mute, limit=1).get()
+        if not self.is_logging(guild, "mute"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.mute, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Muted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Muted By:** {format_moderator(entry)}\n"
             f"**Duration:** {duration}\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "mute", "User Muted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "mute", "User Muted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_unmute(self, guild, user):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.unmute, limit=1).get()
+        if not self.is_logging(guild, "unmute"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.unmute, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Unmuted By:** {entry.user.mention} ({entry.user.id})\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Unmuted By:** {format_moderator(entry)}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "unmute", "User Unmuted", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "unmute", "User Unmuted", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_member_timeout(self, guild, user, duration):
-        entry = await guild.audit_logs(action=discord.AuditLogAction.timeout, limit=1).get()
+        if not self.is_logging(guild, "timeout"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.timeout, user.id)
         description = (
             f"**User:** {user.mention} ({user.id})\n"
-            f"**Timed Out By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Timed Out By:** {format_moderator(entry)}\n"
             f"**Duration:** {duration}\n"
-            f"**Reason:** {entry.reason if entry.reason else 'No reason provided'}\n"
+            f"**Reason:** {entry.reason if entry and entry.reason else 'No reason provided'}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "timeout", "User Timed Out", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "timeout", "User Timed Out", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_message_attachment(self, message):
+        if not self.is_logging(message.guild, "attachment"):
+            return
         if message.attachments:
             guild = message.guild
             for attachment in message.attachments:
@@ -345,6 +487,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
 
     @commands.Cog.listener()
     async def on_message_link(self, message):
+        if not self.is_logging(message.guild, "link"):
+            return
         if any(word.startswith("http") for word in message.content.split()):
             guild = message.guild
             description = (
@@ -359,6 +503,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_channel_permissions_update(self, channel, before, after):
         guild = channel.guild
+        if not self.is_logging(guild, "channel_permissions"):
+            return
         if before.overwrites != after.overwrites:
             added_permissions = []
             removed_permissions = []
@@ -393,6 +539,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_role_permissions_update(self, role, before, after):
         guild = role.guild
+        if not self.is_logging(guild, "role_permissions"):
+            return
         if before.permissions != after.permissions:
             added_permissions = [perm for perm, value in after.permissions if value and not getattr(before.permissions, perm)]
             removed_permissions = [perm for perm, value in before.permissions if value and not getattr(after.permissions, perm)]
@@ -412,107 +560,125 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_role_create(self, role):
         guild = role.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.role_create, limit=1).get()
+        if not self.is_logging(guild, "role"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.role_create, role.id)
         description = (
             f"**Role Created:** {role.mention} ({role.name})\n"
             f"**Role ID:** {role.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "role", "Role Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "role", "Role Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_role_delete(self, role):
         guild = role.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.role_delete, limit=1).get()
+        if not self.is_logging(guild, "role"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.role_delete, role.id)
         description = (
             f"**Role Deleted:** {role.name}\n"
             f"**Role ID:** {role.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "role", "Role Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "role", "Role Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_role_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.role_update, limit=1).get()
+        if not self.is_logging(guild, "role"):
+            return
         if before.name != after.name:
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.role_update, before.id)
             description = (
                 f"**Role Renamed:** {before.name} -> {after.name}\n"
                 f"**Role ID:** {before.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {format_moderator(entry)}\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "role", "Role Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "role", "Role Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_webhook_create(self, webhook):
         guild = webhook.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.webhook_create, limit=1).get()
+        if not self.is_logging(guild, "webhook"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.webhook_create, webhook.id)
         description = (
             f"**Webhook Created:** {webhook.name}\n"
             f"**Webhook ID:** {webhook.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Channel:** {webhook.channel.mention}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "webhook", "Webhook Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "webhook", "Webhook Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_webhook_update(self, webhook):
         guild = webhook.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.webhook_update, limit=1).get()
+        if not self.is_logging(guild, "webhook"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.webhook_update, webhook.id)
         description = (
             f"**Webhook Updated:** {webhook.name}\n"
             f"**Webhook ID:** {webhook.id}\n"
-            f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Updated By:** {format_moderator(entry)}\n"
             f"**Channel:** {webhook.channel.mention}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "webhook", "Webhook Updated", description, discord.Color.blue(), entry.user)
+        await self.log_event(guild, "webhook", "Webhook Updated", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_webhook_delete(self, webhook):
         guild = webhook.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.webhook_delete, limit=1).get()
+        if not self.is_logging(guild, "webhook"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.webhook_delete, webhook.id)
         description = (
             f"**Webhook Deleted:** {webhook.name}\n"
             f"**Webhook ID:** {webhook.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Channel:** {webhook.channel.mention}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "webhook", "Webhook Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "webhook", "Webhook Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_app_add(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_create, limit=1).get()
+        if not self.is_logging(guild, "app"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_create, integration.id)
         description = (
             f"**App Invited:** {integration.name}\n"
             f"**App ID:** {integration.id}\n"
-            f"**Invited By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Invited By:** {format_moderator(entry)}\n"
             f"**Permissions Level:** {integration.permissions}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "app", "App Invited", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "app", "App Invited", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_app_remove(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_delete, limit=1).get()
+        if not self.is_logging(guild, "app"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_delete, integration.id)
         description = (
             f"**App Removed:** {integration.name}\n"
             f"**App ID:** {integration.id}\n"
-            f"**Removed By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Removed By:** {format_moderator(entry)}\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "app", "App Removed", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "app", "App Removed", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member, before, after):
         guild = member.guild
+        if not self.is_logging(guild, "voice"):
+            return
         if before.channel != after.channel:
             if before.channel is None:
                 description = (
@@ -626,6 +792,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         if user.bot:
             return
         guild = reaction.message.guild
+        if not self.is_logging(guild, "reaction"):
+            return
         description = (
             f"**Reaction Added:** {reaction.emoji}\n"
             f"**Message ID:** {reaction.message.id}\n"
@@ -642,6 +810,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         if user.bot:
             return
         guild = reaction.message.guild
+        if not self.is_logging(guild, "reaction"):
+            return
         description = (
             f"**Reaction Removed:** {reaction.emoji}\n"
             f"**Message ID:** {reaction.message.id}\n"
@@ -655,6 +825,8 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
 
     @commands.Cog.listener()
     async def on_guild_emojis_update(self, guild, before, after):
+        if not self.is_logging(guild, "emoji"):
+            return
         before_emojis = set(before)
         after_emojis = set(after)
         added_emojis = after_emojis - before_emojis
@@ -662,119 +834,131 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
         updated_emojis = {emoji for emoji in before_emojis & after_emojis if emoji.name != next(e.name for e in after if e.id == emoji.id)}
 
         for emoji in added_emojis:
-            entry = await guild.audit_logs(action=discord.AuditLogAction.emoji_create, limit=1).get()
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.emoji_create, emoji.id)
             description = (
                 f"**Emoji Added:** {emoji} ({emoji.name})\n"
                 f"**Emoji ID:** {emoji.id}\n"
-                f"**Added By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Added By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "emoji", "Emoji Added", description, discord.Color.green(), entry.user)
+            await self.log_event(guild, "emoji", "Emoji Added", description, discord.Color.green(), entry.user if entry else None)
 
         for emoji in removed_emojis:
-            entry = await guild.audit_logs(action=discord.AuditLogAction.emoji_delete, limit=1).get()
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.emoji_delete, emoji.id)
             description = (
                 f"**Emoji Removed:** {emoji} ({emoji.name})\n"
-                f"**Removed By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Removed By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "emoji", "Emoji Removed", description, discord.Color.red(), entry.user)
+            await self.log_event(guild, "emoji", "Emoji Removed", description, discord.Color.red(), entry.user if entry else None)
 
         for emoji in updated_emojis:
-            entry = await guild.audit_logs(action=discord.AuditLogAction.emoji_update, limit=1).get()
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.emoji_update, emoji.id)
             description = (
                 f"**Emoji Updated:** {emoji} ({emoji.name})\n"
                 f"**Emoji ID:** {emoji.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "emoji", "Emoji Updated", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "emoji", "Emoji Updated", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_invite_create(self, invite):
         guild = invite.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.invite_create, limit=1).get()
+        if not self.is_logging(guild, "invite"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.invite_create)
         description = (
             f"**Invite Created:**\n"
             f"**Code:** {invite.code}\n"
             f"**Channel:** {invite.channel.mention}\n"
-            f"**Inviter:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Inviter:** {format_moderator(entry)}\n"
             f"**Max Uses:** {invite.max_uses}\n"
             f"**Max Age:** {invite.max_age}\n"
             f"**Temporary:** {invite.temporary}\n"
             f"**Created At:** <t:{int(invite.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "invite", "Invite Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "invite", "Invite Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_invite_delete(self, invite):
         guild = invite.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.invite_delete, limit=1).get()
+        if not self.is_logging(guild, "invite"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.invite_delete)
         description = (
             f"**Invite Deleted:**\n"
             f"**Code:** {invite.code}\n"
             f"**Channel:** {invite.channel.mention}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Max Uses:** {invite.max_uses}\n"
             f"**Max Age:** {invite.max_age}\n"
             f"**Temporary:** {invite.temporary}\n"
             f"**Created At:** <t:{int(invite.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "invite", "Invite Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "invite", "Invite Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_integration_create(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_create, limit=1).get()
+        if not self.is_logging(guild, "integration"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_create, integration.id)
         description = (
             f"**Integration Created:**\n"
             f"**Name:** {integration.name}\n"
             f"**Type:** {integration.type}\n"
             f"**Enabled:** {integration.enabled}\n"
             f"**Account:** {integration.account.name}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Created At:** <t:{int(integration.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "integration", "Integration Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "integration", "Integration Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_integration_update(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_update, limit=1).get()
+        if not self.is_logging(guild, "integration"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_update, integration.id)
         description = (
             f"**Integration Updated:**\n"
             f"**Name:** {integration.name}\n"
             f"**Type:** {integration.type}\n"
             f"**Enabled:** {integration.enabled}\n"
             f"**Account:** {integration.account.name}\n"
-            f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Updated By:** {format_moderator(entry)}\n"
             f"**Updated At:** <t:{int(integration.updated_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "integration", "Integration Updated", description, discord.Color.blue(), entry.user)
+        await self.log_event(guild, "integration", "Integration Updated", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_integration_delete(self, integration):
         guild = integration.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.integration_delete, limit=1).get()
+        if not self.is_logging(guild, "integration"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.integration_delete, integration.id)
         description = (
             f"**Integration Deleted:**\n"
             f"**Name:** {integration.name}\n"
             f"**Type:** {integration.type}\n"
             f"**Enabled:** {integration.enabled}\n"
             f"**Account:** {integration.account.name}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Deleted At:** <t:{int(integration.deleted_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "integration", "Integration Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "integration", "Integration Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_typing(self, channel, user, when):
         if user.bot:
             return
         guild = channel.guild
+        if not self.is_logging(guild, "typing"):
+            return
         description = (
             f"**User Typing:** {user.mention}\n"
             f"**Channel:** {channel.mention}\n"
@@ -786,165 +970,189 @@ class AdvancedLogger(DashboardIntegration, commands.Cog):  # Subclass ``Dashboar
     @commands.Cog.listener()
     async def on_thread_create(self, thread):
         guild = thread.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.thread_create, limit=1).get()
+        if not self.is_logging(guild, "thread"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.thread_create, thread.id)
         description = (
             f"**Thread Created:** {thread.mention} ({thread.name})\n"
             f"**Thread ID:** {thread.id}\n"
             f"**Parent Channel:** {thread.parent.mention}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(thread.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "thread", "Thread Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "thread", "Thread Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_thread_delete(self, thread):
         guild = thread.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.thread_delete, limit=1).get()
+        if not self.is_logging(guild, "thread"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.thread_delete, thread.id)
         description = (
             f"**Thread Deleted:** {thread.name}\n"
             f"**Thread ID:** {thread.id}\n"
             f"**Parent Channel:** {thread.parent.mention}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "thread", "Thread Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "thread", "Thread Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_thread_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.thread_update, limit=1).get()
+        if not self.is_logging(guild, "thread"):
+            return
         if before.name != after.name:
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.thread_update, before.id)
             description = (
                 f"**Thread Renamed:** {before.name} -> {after.name}\n"
                 f"**Thread ID:** {before.id}\n"
                 f"**Parent Channel:** {before.parent.mention}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "thread", "Thread Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "thread", "Thread Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_sticker_create(self, sticker):
         guild = sticker.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.sticker_create, limit=1).get()
+        if not self.is_logging(guild, "sticker"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.sticker_create, sticker.id)
         description = (
             f"**Sticker Created:** {sticker.name}\n"
             f"**Sticker ID:** {sticker.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(sticker.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "sticker", "Sticker Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "sticker", "Sticker Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_sticker_delete(self, sticker):
         guild = sticker.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.sticker_delete, limit=1).get()
+        if not self.is_logging(guild, "sticker"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.sticker_delete, sticker.id)
         description = (
             f"**Sticker Deleted:** {sticker.name}\n"
             f"**Sticker ID:** {sticker.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "sticker", "Sticker Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "sticker", "Sticker Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_sticker_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.sticker_update, limit=1).get()
+        if not self.is_logging(guild, "sticker"):
+            return
         if before.name != after.name:
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.sticker_update, before.id)
             description = (
                 f"**Sticker Renamed:** {before.name} -> {after.name}\n"
                 f"**Sticker ID:** {before.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "sticker", "Sticker Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "sticker", "Sticker Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_scheduled_event_create(self, event):
         guild = event.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.scheduled_event_create, limit=1).get()
+        if not self.is_logging(guild, "scheduled_event"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.scheduled_event_create, event.id)
         description = (
             f"**Scheduled Event Created:** {event.name}\n"
             f"**Event ID:** {event.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(event.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "scheduled_event", "Scheduled Event Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "scheduled_event", "Scheduled Event Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_scheduled_event_delete(self, event):
         guild = event.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.scheduled_event_delete, limit=1).get()
+        if not self.is_logging(guild, "scheduled_event"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.scheduled_event_delete, event.id)
         description = (
             f"**Scheduled Event Deleted:** {event.name}\n"
             f"**Event ID:** {event.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "scheduled_event", "Scheduled Event Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "scheduled_event", "Scheduled Event Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_scheduled_event_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.scheduled_event_update, limit=1).get()
+        if not self.is_logging(guild, "scheduled_event"):
+            return
         if before.name != after.name:
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.scheduled_event_update, before.id)
             description = (
                 f"**Scheduled Event Renamed:** {before.name} -> {after.name}\n"
                 f"**Event ID:** {before.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "scheduled_event", "Scheduled Event Renamed", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "scheduled_event", "Scheduled Event Renamed", description, discord.Color.blue(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_stage_instance_create(self, stage_instance):
         guild = stage_instance.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.stage_instance_create, limit=1).get()
+        if not self.is_logging(guild, "stage_instance"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.stage_instance_create, stage_instance.id)
         description = (
             f"**Stage Instance Created:** {stage_instance.channel.mention} ({stage_instance.channel.name})\n"
             f"**Topic:** {stage_instance.topic}\n"
             f"**Channel ID:** {stage_instance.channel.id}\n"
-            f"**Created By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Created By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(stage_instance.created_at.timestamp())}:F>"
         )
-        await self.log_event(guild, "stage_instance", "Stage Instance Created", description, discord.Color.green(), entry.user)
+        await self.log_event(guild, "stage_instance", "Stage Instance Created", description, discord.Color.green(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_stage_instance_delete(self, stage_instance):
         guild = stage_instance.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.stage_instance_delete, limit=1).get()
+        if not self.is_logging(guild, "stage_instance"):
+            return
+        entry = await self.audit_log.find(guild, discord.AuditLogAction.stage_instance_delete, stage_instance.id)
         description = (
             f"**Stage Instance Deleted:** {stage_instance.channel.mention} ({stage_instance.channel.name})\n"
             f"**Topic:** {stage_instance.topic}\n"
             f"**Channel ID:** {stage_instance.channel.id}\n"
-            f"**Deleted By:** {entry.user.mention} ({entry.user.id})\n"
+            f"**Deleted By:** {format_moderator(entry)}\n"
             f"**Guild:** {guild.name} ({guild.id})\n"
             f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
         )
-        await self.log_event(guild, "stage_instance", "Stage Instance Deleted", description, discord.Color.red(), entry.user)
+        await self.log_event(guild, "stage_instance", "Stage Instance Deleted", description, discord.Color.red(), entry.user if entry else None)
 
     @commands.Cog.listener()
     async def on_stage_instance_update(self, before, after):
         guild = before.guild
-        entry = await guild.audit_logs(action=discord.AuditLogAction.stage_instance_update, limit=1).get()
+        if not self.is_logging(guild, "stage_instance"):
+            return
         if before.topic != after.topic:
+            entry = await self.audit_log.find(guild, discord.AuditLogAction.stage_instance_update, before.id)
             description = (
                 f"**Stage Instance Topic Updated:** {before.topic} -> {after.topic}\n"
                 f"**Channel:** {before.channel.mention} ({before.channel.name})\n"
                 f"**Channel ID:** {before.channel.id}\n"
-                f"**Updated By:** {entry.user.mention} ({entry.user.id})\n"
+                f"**Updated By:** {format_moderator(entry)}\n"
                 f"**Guild:** {guild.name} ({guild.id})\n"
                 f"**Timestamp:** <t:{int(datetime.utcnow().timestamp())}:F>"
             )
-            await self.log_event(guild, "stage_instance", "Stage Instance Topic Updated", description, discord.Color.blue(), entry.user)
+            await self.log_event(guild, "stage_instance", "Stage Instance Topic Updated", description, discord.Color.blue(), entry.user if entry else None)
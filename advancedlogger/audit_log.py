@@ -0,0 +1,103 @@
+import asyncio
+import datetime
+import logging
+import time
+import typing
+
+import discord
+
+log = logging.getLogger("red.advancedlogger.audit_log")
+
+
+def format_moderator(entry: typing.Optional[discord.AuditLogEntry]) -> str:
+    if entry is None or entry.user is None:
+        return "Unknown"
+    return f"{entry.user.mention} ({entry.user.id})"
+
+
+class _GuildAuditState:
+    def __init__(self):
+        # (action, target_id) -> (entries newest first, time fetched)
+        self.entries: typing.Dict[typing.Tuple[discord.AuditLogAction, typing.Optional[int]], typing.Tuple[typing.List[discord.AuditLogEntry], float]] = {}
+        # IDs of entries already credited to an event -> time they were used.
+        self.used: typing.Dict[int, float] = {}
+        self.fetch_task: typing.Optional[asyncio.Task] = None
+        self.fetch_started: bool = False
+
+
+class AuditLogReader:
+    """Shared audit log reader used to attribute events to moderators.
+
+    Instead of one ``guild.audit_logs(action=..., limit=1)`` request per event, events that
+    arrive within ``delay`` seconds of each other share a single request for the latest
+    ``limit`` entries. Entries are cached for ``ttl`` seconds, keyed by ``(action, target_id)``.
+    Each entry is credited to one event only, and entries older than ``ttl`` are ignored, so a
+    later action on the same target is never attributed to an earlier moderator.
+    """
+
+    def __init__(self, ttl: float = 60.0, delay: float = 1.0, limit: int = 100):
+        self.ttl = ttl
+        self.delay = delay
+        self.limit = limit
+        self._guilds: typing.Dict[int, _GuildAuditState] = {}
+
+    async def find(self, guild: discord.Guild, action: discord.AuditLogAction, target_id: typing.Optional[int] = None) -> typing.Optional[discord.AuditLogEntry]:
+        """Return the most recent entry for ``action`` on ``target_id``, or ``None``.
+
+        With ``target_id=None`` the most recent entry for ``action`` is returned, whatever its target.
+        """
+        state = self._guilds.setdefault(guild.id, _GuildAuditState())
+        entry = self._lookup(state, action, target_id)
+        if entry is None:
+            if state.fetch_task is None or state.fetch_started:
+                # A request that already left may predate this event, so queue a fresh one.
+                state.fetch_task = asyncio.create_task(self._fetch(guild, state))
+                state.fetch_started = False
+            await asyncio.shield(state.fetch_task)
+            entry = self._lookup(state, action, target_id)
+        if entry is not None:
+            state.used[entry.id] = time.monotonic()
+        return entry
+
+    def clear(self, guild_id: typing.Optional[int] = None):
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+
+    def _lookup(self, state: _GuildAuditState, action: discord.AuditLogAction, target_id: typing.Optional[int]) -> typing.Optional[discord.AuditLogEntry]:
+        cached = state.entries.get((action, target_id))
+        if cached is None or time.monotonic() - cached[1] > self.ttl:
+            return None
+        oldest = discord.utils.utcnow() - datetime.timedelta(seconds=self.ttl)
+        for entry in cached[0]:
+            if entry.created_at < oldest:
+                break
+            if entry.id not in state.used:
+                return entry
+        return None
+
+    async def _fetch(self, guild: discord.Guild, state: _GuildAuditState):
+        await asyncio.sleep(self.delay)
+        state.fetch_started = True
+        now = time.monotonic()
+        entries = {}
+        try:
+            async for entry in guild.audit_logs(limit=self.limit):
+                target_id = getattr(entry.target, "id", None)
+                # Entries are returned newest first, and stay in that order per key.
+                entries.setdefault((entry.action, target_id), []).append(entry)
+                if target_id is not None:
+                    entries.setdefault((entry.action, None), []).append(entry)
+        except discord.HTTPException as e:  # Includes ``discord.Forbidden`` without View Audit Log.
+            log.warning("Failed to fetch audit logs in guild %s (%s): %s", guild.name, guild.id, e)
+        finally:
+            if state.fetch_task is asyncio.current_task():
+                state.fetch_task = None
+        state.entries = {
+            key: value for key, value in state.entries.items() if now - value[1] <= self.ttl
+        }
+        state.entries.update({key: (found, now) for key, found in entries.items()})
+        state.used = {
+            entry_id: used_at for entry_id, used_at in state.used.items() if now - used_at <= self.ttl
+        }
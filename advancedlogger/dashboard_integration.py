@@ -58,7 +58,7 @@ class DashboardIntegration:
         if form.validate_on_submit() and await form.validate_dpy_converters():
             log_type = form.log_type.data
             channel = form.channel.data
-            await self.config.guild(guild).set_raw(log_type + "_log_channel", value=channel.id)
+            await self.set_log_channel(guild, log_type, channel.id)
             return {
                 "status": 0,
                 "notifications": [{"message": f"{log_type.capitalize()} logging channel set to {channel.mention}", "category": "success"}],
@@ -0,0 +1,222 @@
+import asyncio
+import json
+import logging
+import pathlib
+import random
+import time
+import typing
+
+import aiohttp
+import discord
+
+log = logging.getLogger("red.advancedlogger.webhook")
+
+MAX_EMBEDS_PER_REQUEST = 10
+MAX_EMBED_CHARS_PER_REQUEST = 6000
+
+
+class _Destination:
+    def __init__(self, url: str, embeds: typing.Optional[typing.List[dict]] = None):
+        self.url = url
+        self.embeds: typing.List[dict] = embeds or []
+        # Number of embeds at the front of ``embeds`` in the request being sent.
+        self.in_flight = 0
+        self.remaining: typing.Optional[int] = None
+        self.reset_at: float = 0.0
+        self.lock = asyncio.Lock()
+
+
+class WebhookSink:
+    """Delivers log embeds through channel webhooks.
+
+    Embeds are queued per destination and packed up to 10 per request. The
+    ``X-RateLimit-*`` headers of each response are tracked per destination so a
+    request is only sent once that webhook has budget left, failed requests are
+    retried with exponential backoff, and everything still pending is kept in a
+    JSON spool file so it survives a restart or a Discord outage.
+
+    When a webhook is deleted or its token revoked, its pending embeds are packed
+    into batches and handed to ``on_gone`` so they can be sent another way.
+    """
+
+    def __init__(
+        self,
+        spool_path: pathlib.Path,
+        flush_interval: float = 2.0,
+        max_retries: int = 5,
+        max_pending: int = 500,
+        on_gone: typing.Optional[typing.Callable[[int, typing.List[typing.List[dict]]], typing.Awaitable[None]]] = None,
+    ):
+        self.spool_path = spool_path
+        self.on_gone = on_gone
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.max_pending = max_pending
+        self.failures = 0
+        self.dropped = 0
+        self._destinations: typing.Dict[int, _Destination] = {}
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._task: typing.Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._dirty = False
+
+    @property
+    def pending(self) -> int:
+        return sum(len(destination.embeds) for destination in self._destinations.values())
+
+    async def start(self):
+        self._session = aiohttp.ClientSession()
+        await self._load_spool()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self._write_spool()
+        if self._session is not None:
+            await self._session.close()
+
+    def put(self, destination_id: int, url: str, embed: discord.Embed):
+        destination = self._destinations.get(destination_id)
+        if destination is None or destination.url != url:
+            destination = self._destinations[destination_id] = _Destination(url, destination.embeds if destination else None)
+        destination.embeds.append(embed.to_dict())
+        if len(destination.embeds) > self.max_pending:
+            # Drop the oldest entry that is not part of the request being sent.
+            del destination.embeds[destination.in_flight]
+            self.dropped += 1
+        self._dirty = True
+        if len(destination.embeds) >= MAX_EMBEDS_PER_REQUEST:
+            self._wakeup.set()
+
+    def forget(self, destination_id: int):
+        """Drop a destination, for example after its webhook was deleted."""
+        if self._destinations.pop(destination_id, None) is not None:
+            self._dirty = True
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await asyncio.gather(
+                    *(self._flush(destination_id, destination) for destination_id, destination in list(self._destinations.items()) if destination.embeds)
+                )
+                if self._dirty:
+                    await self._write_spool()
+            except Exception:
+                log.exception("Unexpected error in the webhook log sink.")
+
+    async def _flush(self, destination_id: int, destination: _Destination):
+        async with destination.lock:
+            while destination.embeds:
+                batch = self._take_batch(destination.embeds)
+                destination.in_flight = len(batch)
+                try:
+                    status = await self._send(destination, batch)
+                finally:
+                    destination.in_flight = 0
+                if status == "sent":
+                    del destination.embeds[: len(batch)]
+                    self._dirty = True
+                elif status == "gone":
+                    embeds = destination.embeds
+                    self.forget(destination_id)
+                    if self.on_gone is None:
+                        log.warning("Webhook for channel %s no longer exists, discarding %s log entries.", destination_id, len(embeds))
+                        return
+                    log.warning("Webhook for channel %s no longer exists, rerouting %s log entries.", destination_id, len(embeds))
+                    batches = []
+                    while embeds:
+                        batches.append(self._take_batch(embeds))
+                        del embeds[: len(batches[-1])]
+                    await self.on_gone(destination_id, batches)
+                    return
+                else:
+                    # Keep the entries spooled and try again on the next cycle.
+                    return
+
+    @staticmethod
+    def _take_batch(embeds: typing.List[dict]) -> typing.List[dict]:
+        batch = []
+        size = 0
+        for embed in embeds[:MAX_EMBEDS_PER_REQUEST]:
+            embed_size = len(embed.get("title", "")) + len(embed.get("description", ""))
+            if batch and size + embed_size > MAX_EMBED_CHARS_PER_REQUEST:
+                break
+            batch.append(embed)
+            size += embed_size
+        return batch
+
+    async def _send(self, destination: _Destination, batch: typing.List[dict]) -> str:
+        for attempt in range(self.max_retries):
+            if destination.remaining == 0:
+                await asyncio.sleep(max(0.0, destination.reset_at - time.monotonic()))
+            try:
+                async with self._session.post(destination.url, params={"wait": "true"}, json={"embeds": batch}) as response:
+                    self._update_budget(destination, response.headers)
+                    if response.status < 300:
+                        return "sent"
+                    if response.status in (401, 404):
+                        # The webhook was deleted or its token is no longer valid.
+                        return "gone"
+                    if response.status == 429:
+                        data = await response.json(content_type=None)
+                        retry_after = float(data.get("retry_after", 1.0))
+                        log.info("Webhook rate limited, retrying in %.2fs.", retry_after)
+                        await asyncio.sleep(retry_after)
+                        continue
+                    if response.status < 500:
+                        # The payload itself is rejected, retrying would not help.
+                        self.failures += 1
+                        log.error("Webhook rejected %s log entries (%s): %s", len(batch), response.status, await response.text())
+                        return "sent"
+                    reason = f"HTTP {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                reason = repr(e)
+            delay = min(60.0, 2 ** attempt) + random.random()
+            log.warning("Webhook delivery failed (%s), attempt %s/%s, retrying in %.1fs.", reason, attempt + 1, self.max_retries, delay)
+            await asyncio.sleep(delay)
+        self.failures += 1
+        return "failed"
+
+    @staticmethod
+    def _update_budget(destination: _Destination, headers: typing.Mapping[str, str]):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        if remaining is not None:
+            destination.remaining = int(remaining)
+        if reset_after is not None:
+            destination.reset_at = time.monotonic() + float(reset_after)
+
+    async def _load_spool(self):
+        if not self.spool_path.exists():
+            return
+        try:
+            data = json.loads(self.spool_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            log.error("Could not read the webhook log spool: %s", e)
+            return
+        for destination_id, destination in data.items():
+            self._destinations[int(destination_id)] = _Destination(destination["url"], destination["embeds"])
+
+    async def _write_spool(self):
+        data = {
+            str(destination_id): {"url": destination.url, "embeds": destination.embeds}
+            for destination_id, destination in self._destinations.items()
+            if destination.embeds
+        }
+        self._dirty = False
+        await asyncio.get_running_loop().run_in_executor(None, self._write_file, json.dumps(data))
+
+    def _write_file(self, content: str):
+        temp_path = self.spool_path.with_suffix(".tmp")
+        temp_path.write_text(content, encoding="utf-8")
+        temp_path.replace(self.spool_path)
@@ -1,16 +1,137 @@
 import discord
+from discord.ext import tasks
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 from datetime import timedelta, datetime
+from collections import Counter, defaultdict
+import heapq
 import re
 import uuid
 import asyncio
+import logging
+from .warning_index import WarningIndex
+log = logging.getLogger("red.adwarn")
 class AdWarn(commands.Cog):
+    STATS_RETENTION_DAYS = 400  # Daily stats buckets older than this are pruned.
     def __init__(self, bot: Red):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=1234567890)  # Replace with a unique identifier
-        self.config.register_guild(warn_channel=None, tholds={}, warnings_issued={}, mod_warnings={}, softban_duration=120, timeout_duration=120, weekly_stats={}, monthly_stats={})
+        self.config.register_guild(warn_channel=None, tholds={}, warnings_issued={}, mod_warnings={}, softban_duration=120, timeout_duration=120, weekly_stats={}, monthly_stats={}, stats_buckets={})
         self.config.register_member(warnings=[], untimeout_time=None)
+        # Min-heap of (expiry timestamp, guild_id, member_id). Entries superseded by a newer
+        # timeout are skipped lazily by comparing with ``untimeout_times``.
+        self.untimeout_heap = []
+        self.untimeout_times = {}
+        self.untimeout_wakeup = asyncio.Event()
+        self.untimeout_task = None
+        # guild_id -> {"participants": {member_id: member}, "counts": {member_id: int}, "seen": {message_id}}
+        self.active_races = {}
+        # guild_id -> day ("YYYY-MM-DD") -> Counter of moderator_id -> warnings not yet written to Config
+        self.pending_stats = defaultdict(lambda: defaultdict(Counter))
+        self.stats_lock = asyncio.Lock()
+        self.warning_indexes = defaultdict(WarningIndex)  # guild_id -> WarningIndex
+    async def cog_load(self):
+        all_members = await self.config.all_members()
+        for guild_id, members in all_members.items():
+            for member_id, data in members.items():
+                for warning in data["warnings"]:
+                    self.warning_indexes[guild_id].add(member_id, warning)
+                if data["untimeout_time"]:
+                    expiry = datetime.fromisoformat(data["untimeout_time"]).timestamp()
+                    self.untimeout_times[(guild_id, member_id)] = expiry
+                    self.untimeout_heap.append((expiry, guild_id, member_id))
+        heapq.heapify(self.untimeout_heap)
+        for guild_id, data in (await self.config.all_guilds()).items():
+            # mod_warnings is no longer written, but it still holds the history of warnings removed
+            # from members before the index existed. Those are added to the index read-only.
+            index = self.warning_indexes[guild_id]
+            for moderator_id, warnings in data["mod_warnings"].items():
+                moderator_id = int(moderator_id)
+                known = {(member_id, warning["time"]) for member_id, warning in index.moderator_warnings(moderator_id)}
+                for warning in warnings:
+                    if (warning["user"], warning["time"]) not in known:
+                        index.add_history(moderator_id, warning["user"], warning)
+        await self.migrate_stats()
+        self.untimeout_task = asyncio.create_task(self.untimeout_scheduler())
+        self.flush_stats_task.start()
+    async def cog_unload(self):
+        if self.untimeout_task is not None:
+            self.untimeout_task.cancel()
+        # Let a flush in progress finish, then write whatever is left.
+        self.flush_stats_task.stop()
+        await self.flush_stats()
+    @tasks.loop(seconds=60)
+    async def flush_stats_task(self):
+        await self.flush_stats()
+    async def flush_stats(self):
+        """Write the aggregated warning counters to Config, one write per guild."""
+        async with self.stats_lock:
+            pending, self.pending_stats = self.pending_stats, defaultdict(lambda: defaultdict(Counter))
+            oldest_day = (discord.utils.utcnow() - timedelta(days=self.STATS_RETENTION_DAYS)).date().isoformat()
+            try:
+                while pending:
+                    guild_id, days = next(iter(pending.items()))
+                    async with self.config.guild_from_id(guild_id).stats_buckets() as buckets:
+                        for day, counts in days.items():
+                            bucket = buckets.setdefault(day, {})
+                            for moderator_id, count in counts.items():
+                                bucket[moderator_id] = bucket.get(moderator_id, 0) + count
+                        for day in [day for day in buckets if day < oldest_day]:
+                            del buckets[day]
+                    del pending[guild_id]
+            finally:
+                # Counters that were not written go back in the queue for the next flush.
+                for guild_id, days in pending.items():
+                    for day, counts in days.items():
+                        self.pending_stats[guild_id][day].update(counts)
+    async def migrate_stats(self):
+        """Fold the old per-month counters into the daily buckets and clear the old counters.
+
+        The old counters have no dates, so the monthly counts are filed under the first day of the
+        current month. The weekly counters were always a subset of the monthly ones and are dropped.
+        """
+        first_day = discord.utils.utcnow().date().replace(day=1).isoformat()
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if not data["weekly_stats"] and not data["monthly_stats"]:
+                continue
+            guild_config = self.config.guild_from_id(guild_id)
+            async with guild_config.stats_buckets() as buckets:
+                bucket = buckets.setdefault(first_day, {})
+                for moderator_id, count in data["monthly_stats"].items():
+                    bucket[moderator_id] = bucket.get(moderator_id, 0) + count
+            await guild_config.weekly_stats.clear()
+            await guild_config.monthly_stats.clear()
+    def record_stat(self, guild: discord.Guild, moderator_id: int):
+        day = discord.utils.utcnow().date().isoformat()
+        self.pending_stats[guild.id][day][str(moderator_id)] += 1
+    async def get_stats(self, guild: discord.Guild, days: int = None):
+        """Return a Counter of warnings issued per moderator over the last ``days`` days (all time if ``None``)."""
+        first_day = None
+        if days is not None:
+            first_day = (discord.utils.utcnow() - timedelta(days=days - 1)).date().isoformat()
+        totals = Counter()
+        buckets = await self.config.guild(guild).stats_buckets()
+        for source in (buckets, self.pending_stats.get(guild.id, {})):
+            for day, counts in source.items():
+                if first_day is None or day >= first_day:
+                    totals.update(counts)
+        return totals
+    def stats_embed(self, title: str, stats: Counter, empty_message: str, limit: int = None):
+        embed = discord.Embed(
+            title=title,
+            color=discord.Color.blue()
+        )
+        if stats:
+            for rank, (user_id, count) in enumerate(stats.most_common(limit), start=1):
+                user = self.bot.get_user(int(user_id))
+                embed.add_field(
+                    name=f"{rank}. {user} (ID: {user_id})",
+                    value=f"Warnings Issued: {count}",
+                    inline=False
+                )
+        else:
+            embed.add_field(name="No data available", value=empty_message, inline=False)
+        return embed
 
     @commands.command()
     @commands.has_permissions(manage_messages=True)
@@ -21,16 +142,17 @@ class AdWarn(commands.Cog):
             warn_channel = self.bot.get_channel(warn_channel_id)
             if warn_channel:
                 # Store the warning with a UUID
-                warnings = await self.config.member(user).warnings()
+                index = self.warning_indexes[ctx.guild.id]
                 warning_time = discord.utils.utcnow()
                 warning_id = str(uuid.uuid4())
-                warnings.append({
+                index.add(user.id, {
                     "id": warning_id,
                     "reason": reason,
                     "moderator": ctx.author.id,
                     "time": warning_time.isoformat(),
                     "channel": ctx.channel.id
                 })
+                warnings = index.member_warnings(user.id)
                 await self.config.member(user).warnings.set(warnings)
                 # Increment the count of warnings issued by the moderator for the current server
                 warnings_issued = await self.config.guild(ctx.guild).warnings_issued()
@@ -38,17 +160,6 @@ class AdWarn(commands.Cog):
                     warnings_issued[str(ctx.author.id)] = 0
                 warnings_issued[str(ctx.author.id)] += 1
                 await self.config.guild(ctx.guild).warnings_issued.set(warnings_issued)
-                # Store the details of the warning issued by the moderator
-                mod_warnings = await self.config.guild(ctx.guild).mod_warnings()
-                if str(ctx.author.id) not in mod_warnings:
-                    mod_warnings[str(ctx.author.id)] = []
-                mod_warnings[str(ctx.author.id)].append({
-                    "user": user.id,
-                    "reason": reason,
-                    "time": warning_time.isoformat(),
-                    "channel": ctx.channel.id
-                })
-                await self.config.guild(ctx.guild).mod_warnings.set(mod_warnings)
                 # Create the embed message
                 timestamp = int(warning_time.timestamp())
                 embed = discord.Embed(title="New AdWarn", color=discord.Color.red())
@@ -72,6 +183,7 @@ class AdWarn(commands.Cog):
                 confirmation_message = await ctx.send(embed=confirmation_embed)
                 await confirmation_message.delete(delay=3)
 
+                self.record_race_warning(ctx.message)
                 # Check thresholds and take action if necessary
                 await self.check_thresholds(ctx, user, len(warnings))
             else:
@@ -125,32 +237,62 @@ class AdWarn(commands.Cog):
         if duration:
             timeout_until = discord.utils.utcnow() + timedelta(minutes=duration)
             await user.edit(timed_out_until=timeout_until, reason="Reached warning threshold")
-            await self.config.member(user).untimeout_time.set(timeout_until.isoformat())
+            await self.set_untimeout_time(user, timeout_until)
     async def schedule_untimeout(self, ctx, user, duration):
         untimeout_time = discord.utils.utcnow() + timedelta(minutes=duration)
+        await self.set_untimeout_time(user, untimeout_time)
+    async def set_untimeout_time(self, user: discord.Member, untimeout_time: datetime):
+        """Persist the expiry and add it to the scheduler's heap."""
         await self.config.member(user).untimeout_time.set(untimeout_time.isoformat())
-    @commands.Cog.listener()
-    async def on_ready(self):
-        await self.check_untimeout_times()
-    async def check_untimeout_times(self):
-        for guild in self.bot.guilds:
-            for member in guild.members:
-                untimeout_time = await self.config.member(member).untimeout_time()
-                if untimeout_time:
-                    untimeout_time = datetime.fromisoformat(untimeout_time)
-                    if discord.utils.utcnow() >= untimeout_time:
-                        await self.untimeout_user(member)
-                        await self.config.member(member).untimeout_time.clear()
+        expiry = untimeout_time.timestamp()
+        self.untimeout_times[(user.guild.id, user.id)] = expiry
+        heapq.heappush(self.untimeout_heap, (expiry, user.guild.id, user.id))
+        self.untimeout_wakeup.set()
+    async def untimeout_scheduler(self):
+        """Sleep until the next timeout expires and lift it, for as long as the cog is loaded."""
+        await self.bot.wait_until_red_ready()
+        while True:
+            self.untimeout_wakeup.clear()
+            delay = None
+            if self.untimeout_heap:
+                delay = self.untimeout_heap[0][0] - discord.utils.utcnow().timestamp()
+            if delay is None or delay > 0:
+                try:
+                    await asyncio.wait_for(self.untimeout_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            expiry, guild_id, member_id = heapq.heappop(self.untimeout_heap)
+            if self.untimeout_times.get((guild_id, member_id)) != expiry:
+                continue  # Superseded by a later timeout.
+            del self.untimeout_times[(guild_id, member_id)]
+            try:
+                await self.expire_untimeout(guild_id, member_id)
+            except Exception as e:
+                log.warning("Failed to lift timeout for member %s in guild %s: %s", member_id, guild_id, e)
+    async def expire_untimeout(self, guild_id: int, member_id: int):
+        await self.config.member_from_ids(guild_id, member_id).untimeout_time.clear()
+        guild = self.bot.get_guild(guild_id)
+        if guild is None:
+            return
+        member = guild.get_member(member_id)
+        if member is None:
+            try:
+                member = await guild.fetch_member(member_id)
+            except discord.NotFound:
+                return
+        await self.untimeout_user(member)
     async def untimeout_user(self, user: discord.Member):
         await user.edit(timed_out_until=None, reason="Timeout duration expired")
     @commands.command()
     @commands.has_permissions(manage_messages=True)
     async def removewarn(self, ctx, user: discord.Member, warning_id: str):
         """Remove a specific warning from a user by its UUID."""
-        warnings = await self.config.member(user).warnings()
-        warning_to_remove = next((warning for warning in warnings if warning["id"] == warning_id), None)
+        index = self.warning_indexes[ctx.guild.id]
+        warning_to_remove = index.get(warning_id, user.id)
         if warning_to_remove:
-            warnings.remove(warning_to_remove)
+            index.remove(warning_id)
+            warnings = index.member_warnings(user.id)
             await self.config.member(user).warnings.set(warnings)
             warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
             if warn_channel_id:
@@ -190,7 +332,7 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def warncount(self, ctx, user: discord.Member):
         """Get the total number of warnings a user has."""
-        warnings = await self.config.member(user).warnings()
+        warnings = self.warning_indexes[ctx.guild.id].member_warnings(user.id)
         embed = discord.Embed(
             title="Warning Count",
             description=f"{user.mention} has {len(warnings)} warnings.",
@@ -210,6 +352,7 @@ class AdWarn(commands.Cog):
     async def clearwarns(self, ctx, user: discord.User):
         """Clear all warnings for a user."""
         await self.config.member_from_ids(ctx.guild.id, user.id).warnings.set([])
+        self.warning_indexes[ctx.guild.id].clear_member(user.id)
         warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
         if (warn_channel_id):
             warn_channel = self.bot.get_channel(warn_channel_id)
@@ -240,9 +383,10 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def unadwarn(self, ctx, user: discord.Member):
         """Clear the most recent warning for a user."""
-        warnings = await self.config.member(user).warnings()
+        index = self.warning_indexes[ctx.guild.id]
+        warnings = index.member_warnings(user.id)
         if warnings:
-            removed_warning = warnings.pop()
+            removed_warning = index.remove(warnings.pop()["id"])
             await self.config.member(user).warnings.set(warnings)
             warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
             if warn_channel_id:
@@ -282,10 +426,11 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def editaw(self, ctx, user: discord.Member, warning_id: str, *, new_reason: str):
         """Edit a specific warning by its UUID."""
-        warnings = await self.config.member(user).warnings()
-        warning_to_edit = next((warning for warning in warnings if warning["id"] == warning_id), None)
+        index = self.warning_indexes[ctx.guild.id]
+        warning_to_edit = index.get(warning_id, user.id)
         if warning_to_edit:
             warning_to_edit["reason"] = new_reason
+            warnings = index.member_warnings(user.id)
             await self.config.member(user).warnings.set(warnings)
             warn_channel_id = await self.config.guild(ctx.guild).warn_channel()
             if warn_channel_id:
@@ -323,8 +468,25 @@ class AdWarn(commands.Cog):
             await ctx.send(embed=error_embed)
     @commands.command()
     @commands.has_permissions(manage_messages=True)
-    async def topwarners(self, ctx):
-        """Show the top 5 users who have issued the most warnings in the current server."""
+    async def topwarners(self, ctx, days: int = None):
+        """Show the top 5 users who have issued the most warnings in the current server.
+
+        Pass a number of days to only count warnings issued in that window.
+        """
+        if days is not None:
+            if days <= 0:
+                error_embed = discord.Embed(
+                    title="Error",
+                    description="The number of days must be a positive number.",
+                    color=discord.Color.red()
+                )
+                await ctx.send(embed=error_embed)
+                return
+            stats = await self.get_stats(ctx.guild, days=days)
+            embed = self.stats_embed(f"Top 5 Warners (last {days} days)", stats, "No warnings have been issued in that period.", limit=5)
+            embed.color = discord.Color.gold()
+            await ctx.send(embed=embed)
+            return
         warnings_issued = await self.config.guild(ctx.guild).warnings_issued()
         sorted_users = sorted(warnings_issued.items(), key=lambda item: item[1], reverse=True)
         embed = discord.Embed(
@@ -346,19 +508,19 @@ class AdWarn(commands.Cog):
     @commands.has_permissions(manage_messages=True)
     async def modwarns(self, ctx, moderator: discord.Member):
         """Show the number of warnings issued by a moderator and who they have warned in the current server."""
-        mod_warnings = await self.config.guild(ctx.guild).mod_warnings()
-        if str(moderator.id) in mod_warnings:
-            warnings = mod_warnings[str(moderator.id)]
+        warnings = self.warning_indexes[ctx.guild.id].moderator_warnings(moderator.id)
+        if warnings:
             embed = discord.Embed(
                 title=f"Warnings Issued by {moderator}",
                 color=discord.Color.blue()
             )
             embed.add_field(name="Total Warnings Issued", value=len(warnings), inline=False)
-            for warning in warnings:
-                warned_user = self.bot.get_user(warning["user"])
+            # Embeds are limited to 25 fields, show the most recent warnings.
+            for user_id, warning in warnings[-24:]:
+                warned_user = self.bot.get_user(user_id)
                 timestamp = int(datetime.fromisoformat(warning['time']).timestamp())
                 embed.add_field(
-                    name=f"<:user:1268083437768671303> | User Warned: {warned_user} (ID: {warning['user']})",
+                    name=f"<:user:1268083437768671303> | User Warned: {warned_user} (ID: {user_id})",
                     value=f"<:reason:1270075201694203956> | Reason: {warning['reason']}\n<:time:1273366594877259858> | Time: <t:{timestamp}:F>\n<:channel:1270075226566295623> | Channel: <#{warning['channel']}>",
                     inline=False
                 )
@@ -466,137 +628,122 @@ class AdWarn(commands.Cog):
         await ctx.send(f"Timeout duration set to {minutes} minutes.")
     @commands.command()
     @commands.has_permissions(manage_messages=True)
-    async def adrace(self, ctx, duration: int):
-        """Start an adwarn race that lasts for a configurable amount of time."""
-        custom_emoji = "<a:winner:1269746569872412785>"  # Custom emoji
-        join_end_time = discord.utils.utcnow() + timedelta(seconds=60)
-        join_end_timestamp = int(join_end_time.timestamp())
+    async def adrace(self, ctx, duration: int, update_interval: int = 30):
+        """Start an adwarn race that lasts for a configurable amount of time.
 
-        embed = discord.Embed(
-            title="AdWarn Race Join",
-            description=f"React with the custom emoji to join the AdWarn race!\n To join, click the reaction <t:{join_end_timestamp}:R>.",
-            color=discord.Color.gold()
-        )
-        join_message = await ctx.send(embed=embed)
-        await join_message.add_reaction(custom_emoji)
-        def check(reaction, user):
-            return (
-                str(reaction.emoji) == custom_emoji
-                and reaction.message.id == join_message.id
-                and user != self.bot.user
-            )
-        participants = []
-        participants_mentions = ""
-        # Countdown for 1 minute
-        while discord.utils.utcnow() < join_end_time:
-            try:
-                remaining = (join_end_time - discord.utils.utcnow()).total_seconds()
-                reaction, user = await self.bot.wait_for("reaction_add", timeout=remaining, check=check)
-                if user not in participants:
-                    participants.append(user)
-                    participants_mentions = ", ".join(user.mention for user in participants)
-                    embed.description = f"Participants: {participants_mentions}\nYou have until <t:{join_end_timestamp}:R> to join."
-                    await join_message.edit(embed=embed)
-            except asyncio.TimeoutError:
-                break
-        # Final update to the join message
-        if participants:
-            embed.description = f"Participants: {participants_mentions}\nTime's up! The race is starting now."
-        else:
-            embed.description = "No one joined the race. The race is cancelled."
-        await join_message.clear_reactions()
-        await join_message.edit(embed=embed)
-        if not participants:
+        The race message shows a live leaderboard, refreshed every `update_interval` seconds.
+        """
+        if ctx.guild.id in self.active_races:
+            await ctx.send("An AdWarn race is already running in this server.")
             return
-        race_start_time = discord.utils.utcnow()
-        race_end_time = race_start_time + timedelta(minutes=duration)
-        embed = discord.Embed(
-            title="AdWarn Race Started",
-            color=discord.Color.gold()
-        )
-        embed.add_field(name="Starts", value=f"<t:{int(race_start_time.timestamp())}:R>", inline=True)
-        embed.add_field(name="Ends", value=f"<t:{int(race_end_time.timestamp())}:R>", inline=True)
-        embed.add_field(name="Participants", value=participants_mentions, inline=False)
-        race_message = await ctx.send(embed=embed)
-        await asyncio.sleep(duration * 60)
-        # Compile results as quickly as possible
-        results = {}
-        for participant in participants:
-            warnings = 0
-            for channel in ctx.guild.text_channels:
-                async for message in channel.history(after=race_start_time, limit=None):
-                    if message.author == participant and "adwarn" in message.content:
-                        warnings += 1
-            results[participant] = warnings
-        sorted_results = sorted(results.items(), key=lambda item: item[1], reverse=True)
+        # Reserve the guild before the join phase so a second race cannot start meanwhile.
+        race = {"participants": {}, "counts": {}, "seen": set()}
+        self.active_races[ctx.guild.id] = race
+        try:
+            custom_emoji = "<a:winner:1269746569872412785>"  # Custom emoji
+            join_end_time = discord.utils.utcnow() + timedelta(seconds=60)
+            join_end_timestamp = int(join_end_time.timestamp())
+
+            embed = discord.Embed(
+                title="AdWarn Race Join",
+                description=f"React with the custom emoji to join the AdWarn race!\n To join, click the reaction <t:{join_end_timestamp}:R>.",
+                color=discord.Color.gold()
+            )
+            join_message = await ctx.send(embed=embed)
+            await join_message.add_reaction(custom_emoji)
+            def check(reaction, user):
+                return (
+                    str(reaction.emoji) == custom_emoji
+                    and reaction.message.id == join_message.id
+                    and user != self.bot.user
+                )
+            participants = []
+            participants_mentions = ""
+            # Countdown for 1 minute
+            while discord.utils.utcnow() < join_end_time:
+                try:
+                    remaining = (join_end_time - discord.utils.utcnow()).total_seconds()
+                    reaction, user = await self.bot.wait_for("reaction_add", timeout=remaining, check=check)
+                    if user not in participants:
+                        participants.append(user)
+                        participants_mentions = ", ".join(user.mention for user in participants)
+                        embed.description = f"Participants: {participants_mentions}\nYou have until <t:{join_end_timestamp}:R> to join."
+                        await join_message.edit(embed=embed)
+                except asyncio.TimeoutError:
+                    break
+            # Final update to the join message
+            if participants:
+                embed.description = f"Participants: {participants_mentions}\nTime's up! The race is starting now."
+            else:
+                embed.description = "No one joined the race. The race is cancelled."
+            await join_message.clear_reactions()
+            await join_message.edit(embed=embed)
+            if not participants:
+                return
+            race_start_time = discord.utils.utcnow()
+            race_end_time = race_start_time + timedelta(minutes=duration)
+            # Warnings are counted as they happen by ``record_race_warning``.
+            race["participants"].update({participant.id: participant for participant in participants})
+            race["counts"].update({participant.id: 0 for participant in participants})
+            embed = discord.Embed(
+                title="AdWarn Race Started",
+                color=discord.Color.gold()
+            )
+            embed.add_field(name="Starts", value=f"<t:{int(race_start_time.timestamp())}:R>", inline=True)
+            embed.add_field(name="Ends", value=f"<t:{int(race_end_time.timestamp())}:R>", inline=True)
+            embed.add_field(name="Participants", value=participants_mentions, inline=False)
+            embed.add_field(name="Leaderboard", value=self.format_race_leaderboard(race), inline=False)
+            race_message = await ctx.send(embed=embed)
+            last_leaderboard = None
+            while (remaining := (race_end_time - discord.utils.utcnow()).total_seconds()) > 0:
+                await asyncio.sleep(min(max(update_interval, 5), remaining))
+                leaderboard = self.format_race_leaderboard(race)
+                if leaderboard != last_leaderboard and discord.utils.utcnow() < race_end_time:
+                    embed.set_field_at(3, name="Leaderboard", value=leaderboard, inline=False)
+                    try:
+                        await race_message.edit(embed=embed)
+                    except discord.HTTPException:
+                        pass
+                    last_leaderboard = leaderboard
+        finally:
+            if self.active_races.get(ctx.guild.id) is race:
+                del self.active_races[ctx.guild.id]
+        sorted_results = sorted(race["counts"].items(), key=lambda item: item[1], reverse=True)
         # Edit the race started message to display the results
         embed.title = "AdWarn Race Results"
         embed.description = f"The race lasted for {duration} minutes. Here are the results:"
         embed.clear_fields()
-        for rank, (user, count) in enumerate(sorted_results, start=1):
-            embed.add_field(name=f"{rank}. {user}", value=f"Warnings: {count}", inline=False)
+        for rank, (user_id, count) in enumerate(sorted_results, start=1):
+            embed.add_field(name=f"{rank}. {race['participants'][user_id]}", value=f"Warnings: {count}", inline=False)
         await race_message.edit(embed=embed)
+    def format_race_leaderboard(self, race):
+        sorted_results = sorted(race["counts"].items(), key=lambda item: item[1], reverse=True)
+        return "\n".join(f"{rank}. <@{user_id}>: {count}" for rank, (user_id, count) in enumerate(sorted_results, start=1))
+    def record_race_warning(self, message: discord.Message):
+        """Count a warning towards the active race, if its author is racing."""
+        race = self.active_races.get(message.guild.id)
+        if race is None or message.author.id not in race["counts"] or message.id in race["seen"]:
+            return
+        race["seen"].add(message.id)
+        race["counts"][message.author.id] += 1
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def weeklystats(self, ctx):
-        """Send an embed with the weekly AdWarn stats sorted by per-issuer."""
-        weekly_stats = await self.config.guild(ctx.guild).weekly_stats()
-        sorted_stats = sorted(weekly_stats.items(), key=lambda item: item[1], reverse=True)
-        embed = discord.Embed(
-            title="Weekly AdWarn Stats",
-            color=discord.Color.blue()
-        )
-        if sorted_stats:
-            for rank, (user_id, count) in enumerate(sorted_stats, start=1):
-                user = self.bot.get_user(int(user_id))
-                embed.add_field(
-                    name=f"{rank}. {user} (ID: {user_id})",
-                    value=f"Warnings Issued: {count}",
-                    inline=False
-                )
-        else:
-            embed.add_field(name="No data available", value="No warnings have been issued this week.", inline=False)
-        await ctx.send(embed=embed)
-        # Reset weekly stats
-        await self.config.guild(ctx.guild).weekly_stats.set({})
+        """Send an embed with the AdWarn stats of the last 7 days sorted by per-issuer."""
+        stats = await self.get_stats(ctx.guild, days=7)
+        await ctx.send(embed=self.stats_embed("Weekly AdWarn Stats", stats, "No warnings have been issued this week."))
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def monthlystats(self, ctx):
-        """Send an embed with the monthly AdWarn stats sorted by per-issuer."""
-        monthly_stats = await self.config.guild(ctx.guild).monthly_stats()
-        sorted_stats = sorted(monthly_stats.items(), key=lambda item: item[1], reverse=True)
-        embed = discord.Embed(
-            title="Monthly AdWarn Stats",
-            color=discord.Color.blue()
-        )
-        if sorted_stats:
-            for rank, (user_id, count) in enumerate(sorted_stats, start=1):
-                user = self.bot.get_user(int(user_id))
-                embed.add_field(
-                    name=f"{rank}. {user} (ID: {user_id})",
-                    value=f"Warnings Issued: {count}",
-                    inline=False
-                )
-        else:
-            embed.add_field(name="No data available", value="No warnings have been issued this month.", inline=False)
-        await ctx.send(embed=embed)
-        # Reset monthly stats
-        await self.config.guild(ctx.guild).monthly_stats.set({})
+        """Send an embed with the AdWarn stats of the last 30 days sorted by per-issuer."""
+        stats = await self.get_stats(ctx.guild, days=30)
+        await ctx.send(embed=self.stats_embed("Monthly AdWarn Stats", stats, "No warnings have been issued this month."))
     @commands.Cog.listener()
     async def on_message(self, message):
         """Listener to update weekly and monthly stats."""
-        if message.author.bot:
+        if message.author.bot or message.guild is None:
             return
+        if "adwarn" in message.content:
+            self.record_race_warning(message)
         if message.content.startswith("!adwarn"):
-            author_id = str(message.author.id)
-            weekly_stats = await self.config.guild(message.guild).weekly_stats()
-            monthly_stats = await self.config.guild(message.guild).monthly_stats()
-            if author_id not in weekly_stats:
-                weekly_stats[author_id] = 0
-            if author_id not in monthly_stats:
-                monthly_stats[author_id] = 0
-            weekly_stats[author_id] += 1
-            monthly_stats[author_id] += 1
-
-            await self.config.guild(message.guild).weekly_stats.set(weekly_stats)
-            await self.config.guild(message.guild).monthly_stats.set(monthly_stats)
+            self.record_stat(message.guild, message.author.id)
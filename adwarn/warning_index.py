@@ -0,0 +1,55 @@
+class WarningIndex:
+    """In-memory index of a guild's warnings, kept in sync with the Config member lists.
+
+    Warnings are the same dicts stored in Config and are indexed by warning ID, by
+    warned member and by issuing moderator, so lookups never scan the whole guild.
+    """
+
+    def __init__(self):
+        self.by_id = {}  # warning_id -> (member_id, warning)
+        self.by_member = {}  # member_id -> {warning_id: warning}, in insertion order
+        self.by_moderator = {}  # moderator_id -> {warning_id: warning}, in insertion order
+        # moderator_id -> [(member_id, warning)] only known from the old per-moderator lists,
+        # for example warnings that were removed from the member since.
+        self.history = {}
+
+    def add(self, member_id: int, warning: dict):
+        self.by_id[warning["id"]] = (member_id, warning)
+        self.by_member.setdefault(member_id, {})[warning["id"]] = warning
+        self.by_moderator.setdefault(warning.get("moderator"), {})[warning["id"]] = warning
+
+    def add_history(self, moderator_id: int, member_id: int, warning: dict):
+        self.history.setdefault(moderator_id, []).append((member_id, warning))
+
+    def get(self, warning_id: str, member_id: int = None):
+        entry = self.by_id.get(warning_id)
+        if entry is None or (member_id is not None and entry[0] != member_id):
+            return None
+        return entry[1]
+
+    def remove(self, warning_id: str):
+        member_id, warning = self.by_id.pop(warning_id)
+        self.by_member[member_id].pop(warning_id, None)
+        if not self.by_member[member_id]:
+            del self.by_member[member_id]
+        moderator_warnings = self.by_moderator.get(warning.get("moderator"), {})
+        moderator_warnings.pop(warning_id, None)
+        if not moderator_warnings:
+            self.by_moderator.pop(warning.get("moderator"), None)
+        return warning
+
+    def clear_member(self, member_id: int):
+        for warning_id in list(self.by_member.get(member_id, {})):
+            self.remove(warning_id)
+
+    def member_warnings(self, member_id: int):
+        """Return the member's warnings as the list stored in Config."""
+        return list(self.by_member.get(member_id, {}).values())
+
+    def moderator_warnings(self, moderator_id: int):
+        """Return ``(member_id, warning)`` pairs for the warnings issued by a moderator, oldest first."""
+        warnings = [(self.by_id[warning_id][0], warning) for warning_id, warning in self.by_moderator.get(moderator_id, {}).items()]
+        history = self.history.get(moderator_id)
+        if history:
+            warnings = sorted(history + warnings, key=lambda item: item[1]["time"])
+        return warnings
@@ -7,6 +7,7 @@ import asyncio
 import random
 import string
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 import humanize
 
@@ -49,11 +50,28 @@ class Bumper(commands.Cog):
         self.config.register_global(**default_global)
 
         self.reported_bumps = {}
+        # guild_id -> (bump_channel_id, bump_log_channel_id) for every guild with a bump channel.
+        self.bump_destinations = {}
+        # Bounds the number of bump messages in flight across all bumps.
+        self.send_semaphore = asyncio.Semaphore(10)
+        self.last_bump_stats = None
+
+    async def cog_load(self):
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if data["bump_channel"]:
+                self.bump_destinations[guild_id] = (data["bump_channel"], data["bump_log_channel"])
         self.auto_bump_task.start()
 
     def cog_unload(self):
         self.auto_bump_task.cancel()
 
+    async def refresh_bump_destination(self, guild: discord.Guild):
+        guild_data = await self.config.guild(guild).all()
+        if guild_data["bump_channel"]:
+            self.bump_destinations[guild.id] = (guild_data["bump_channel"], guild_data["bump_log_channel"])
+        else:
+            self.bump_destinations.pop(guild.id, None)
+
     @commands.group()
     @commands.guild_only()
     @commands.admin_or_permissions(manage_guild=True)
@@ -65,6 +83,7 @@ class Bumper(commands.Cog):
     async def channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Set the bump channel."""
         await self.config.guild(ctx.guild).bump_channel.set(channel.id)
+        await self.refresh_bump_destination(ctx.guild)
         await ctx.send(embed=discord.Embed(description=f"Bump channel set to: {channel.mention}", color=discord.Color.green()))
         await self.log_new_server_bump(ctx.guild)
 
@@ -117,6 +136,7 @@ class Bumper(commands.Cog):
     async def bump_log_channel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Set the channel where bump logs are sent."""
         await self.config.guild(ctx.guild).bump_log_channel.set(channel.id)
+        await self.refresh_bump_destination(ctx.guild)
         await ctx.send(embed=discord.Embed(description=f"Bump log channel set to: {channel.mention}", color=discord.Color.green()))
 
     @bumpowner.command()
@@ -125,6 +145,22 @@ class Bumper(commands.Cog):
         await self.config.guild(ctx.guild).config_log_channel.set(channel.id)
         await ctx.send(embed=discord.Embed(description=f"Configuration log channel set to: {channel.mention}", color=discord.Color.green()))
 
+    @bumpowner.command()
+    async def stats(self, ctx: commands.Context):
+        """Show statistics about the last auto bump cycle."""
+        stats = self.last_bump_stats
+        if stats is None:
+            await ctx.send(embed=discord.Embed(description="No auto bump cycle has finished yet.", color=discord.Color.red()))
+            return
+        embed = discord.Embed(title="Last Auto Bump Cycle", color=discord.Color.blue())
+        embed.add_field(name="Finished", value=f"<t:{int(stats['finished'].timestamp())}:R>", inline=True)
+        embed.add_field(name="Duration", value=f"{stats['duration']:.2f}s", inline=True)
+        embed.add_field(name="Premium Servers", value=stats["guilds"], inline=True)
+        embed.add_field(name="Bumps Sent", value=stats["sent"], inline=True)
+        embed.add_field(name="Failures", value=stats["failed"], inline=True)
+        embed.add_field(name="Destinations", value=len(self.bump_destinations), inline=True)
+        await ctx.send(embed=embed)
+
     @bumpowner.command()
     async def support_server_invite(self, ctx: commands.Context, invite: str):
         """Set the support server invite link."""
@@ -379,14 +415,53 @@ class Bumper(commands.Cog):
 
         log.info(f"Sending bump from {guild.name} to all configured servers.")
 
-        for g in self.bot.guilds:
-            bump_channel_id = await self.config.guild(g).bump_channel()
-            if bump_channel_id:
-                bump_channel = g.get_channel(bump_channel_id)
-                if bump_channel:
-                    await bump_channel.send(embed=embed, view=view)
-                    log.info(f"Bump sent to {g.name} in channel {bump_channel.name}.")
-                    await self.log_bump(g, guild)
+        start = time.monotonic()
+        log_embed = discord.Embed(
+            title="Server Bumped",
+            description=f"{guild.name} was bumped. This server has been bumped {guild_data['bump_count']} times.",
+            color=discord.Color.green()
+        )
+        results = await asyncio.gather(
+            *(
+                self.deliver_bump(target_guild_id, bump_channel_id, bump_log_channel_id, embed, view, log_embed)
+                for target_guild_id, (bump_channel_id, bump_log_channel_id) in list(self.bump_destinations.items())
+            )
+        )
+        stats = {
+            "guild": guild.name,
+            "duration": time.monotonic() - start,
+            "sent": results.count(True),
+            "failed": results.count(False),
+        }
+        log.info(
+            f"Bump from {guild.name} sent to {stats['sent']} servers in {stats['duration']:.2f}s, {stats['failed']} failed."
+        )
+        return stats
+
+    async def deliver_bump(self, target_guild_id: int, bump_channel_id: int, bump_log_channel_id, embed: discord.Embed, view: discord.ui.View, log_embed: discord.Embed):
+        """Send one bump and its log entry. Returns ``None`` if the target is not reachable, else whether it was sent."""
+        target_guild = self.bot.get_guild(target_guild_id)
+        bump_channel = target_guild.get_channel(bump_channel_id) if target_guild else None
+        if bump_channel is None:
+            return None
+        async with self.send_semaphore:
+            try:
+                await bump_channel.send(embed=embed, view=view)
+            except (discord.Forbidden, discord.NotFound):
+                # The channel is gone or we lost access, stop sending there until it is configured again.
+                self.bump_destinations.pop(target_guild_id, None)
+                log.warning(f"Removed unreachable bump channel {bump_channel_id} in {target_guild.name}.")
+                return False
+            except discord.HTTPException as e:
+                log.warning(f"Failed to send bump to {target_guild.name}: {e}")
+                return False
+            bump_log_channel = target_guild.get_channel(bump_log_channel_id) if bump_log_channel_id else None
+            if bump_log_channel:
+                try:
+                    await bump_log_channel.send(embed=log_embed)
+                except discord.HTTPException as e:
+                    log.warning(f"Failed to send bump log to {target_guild.name}: {e}")
+        return True
 
     @commands.group()
     @commands.is_owner()
@@ -470,12 +545,36 @@ class Bumper(commands.Cog):
     @tasks.loop(hours=2)
     async def auto_bump_task(self):
         await self.bot.wait_until_ready()
-        for guild in self.bot.guilds:
-            if await self.config.guild(guild).premium():
-                log.info(f"Auto bumping for premium guild: {guild.name}")
-                await self.send_bump(guild)
-                await self.config.guild(guild).last_bump.set(datetime.now(timezone.utc).isoformat())
-                await self.increment_bump_count(guild)
+        start = time.monotonic()
+        all_guilds = await self.config.all_guilds()
+        premium_guilds = [
+            guild for guild_id, data in all_guilds.items()
+            if data["premium"] and (guild := self.bot.get_guild(guild_id)) is not None
+        ]
+
+        async def auto_bump(guild: discord.Guild):
+            log.info(f"Auto bumping for premium guild: {guild.name}")
+            stats = await self.send_bump(guild)
+            await self.config.guild(guild).last_bump.set(datetime.now(timezone.utc).isoformat())
+            await self.increment_bump_count(guild)
+            return stats
+
+        # The shared send semaphore keeps the total number of sends in flight bounded.
+        cycle = await asyncio.gather(*(auto_bump(guild) for guild in premium_guilds), return_exceptions=True)
+        errors = [result for result in cycle if isinstance(result, Exception)]
+        for error in errors:
+            log.error("Auto bump failed.", exc_info=error)
+        self.last_bump_stats = {
+            "finished": datetime.now(timezone.utc),
+            "duration": time.monotonic() - start,
+            "guilds": len(premium_guilds),
+            "sent": sum(result["sent"] for result in cycle if isinstance(result, dict)),
+            "failed": sum(result["failed"] for result in cycle if isinstance(result, dict)) + len(errors),
+        }
+        log.info(
+            f"Auto bump cycle for {len(premium_guilds)} guilds finished in {self.last_bump_stats['duration']:.2f}s "
+            f"({self.last_bump_stats['sent']} sent, {self.last_bump_stats['failed']} failed)."
+        )
 
     async def increment_bump_count(self, guild: discord.Guild):
         current_count = await self.config.guild(guild).bump_count()
@@ -490,18 +589,6 @@ class Bumper(commands.Cog):
             )
             await bump_log_channel.send(embed=embed)
 
-    async def log_bump(self, target_guild: discord.Guild, source_guild: discord.Guild):
-        bump_count = await self.config.guild(source_guild).bump_count()
-        bump_log_channel_id = await self.config.guild(target_guild).bump_log_channel()
-        bump_log_channel = target_guild.get_channel(bump_log_channel_id)
-        if bump_log_channel:
-            embed = discord.Embed(
-                title="Server Bumped",
-                description=f"{source_guild.name} was bumped. This server has been bumped {bump_count} times.",
-                color=discord.Color.green()
-            )
-            await bump_log_channel.send(embed=embed)
-
     async def log_new_server_bump(self, guild: discord.Guild):
         config_log_channel_id = await self.config.guild(guild).config_log_channel()
         config_log_channel = guild.get_channel(config_log_channel_id)
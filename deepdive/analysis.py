@@ -0,0 +1,114 @@
+import json
+import re
+from collections import Counter, defaultdict
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from textblob import TextBlob
+
+POSITIVE_KEYWORDS = ['thanks', 'please', 'help', 'support']
+NEGATIVE_KEYWORDS = ['spam', 'scam', 'abuse', 'hate']
+INTENT_KEYWORDS = {
+    'seekingHelp': ['help', 'support', 'assist', 'issue', 'problem'],
+    'offeringHelp': ['assist', 'help', 'support', 'aid', 'offer'],
+    'promotion': ['check out', 'subscribe', 'follow', 'buy', 'join'],
+    'casual': ['hello', 'hi', 'hey', 'lol', 'haha']
+}
+TOP_WORDS = 10
+
+
+def _build_keyword_categories():
+    categories = defaultdict(set)
+    for keyword in POSITIVE_KEYWORDS:
+        categories[keyword].add('positive')
+    for keyword in NEGATIVE_KEYWORDS:
+        categories[keyword].add('negative')
+    for intent, keywords in INTENT_KEYWORDS.items():
+        for keyword in keywords:
+            categories[keyword].add(intent)
+    return dict(categories)
+
+
+KEYWORD_CATEGORIES = _build_keyword_categories()
+# A lookahead finds every keyword occurrence, overlapping ones included, so the single
+# pattern gives the same answers as testing each keyword with ``in``.
+KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword in sorted(KEYWORD_CATEGORIES, key=len, reverse=True)) + '))'
+)
+
+
+def message_record(message):
+    """Reduce a message to the plain, picklable fields the analysis needs."""
+    return (message.content, message.channel.name, [mention.name for mention in message.mentions], message.created_at.hour)
+
+
+def analyze_messages(users, records, guild_name):
+    """Analyze the records of one guild in a single pass and return the result as JSON.
+
+    This runs in a worker process, so it only receives plain data built by ``message_record``.
+    """
+    category_counts = Counter()
+    polarity = 0.0
+    total_length = 0
+    channel_activity = defaultdict(int)
+    mention_activity = defaultdict(int)
+    time_of_day_activity = [0] * 24
+    documents = []
+    for content, channel_name, mentions, hour in records:
+        normalized = content.lower()
+        category_counts.update(
+            {category for match in KEYWORD_PATTERN.finditer(normalized) for category in KEYWORD_CATEGORIES[match.group(1)]}
+        )
+        polarity += TextBlob(content).sentiment.polarity
+        total_length += len(content)
+        channel_activity[channel_name] += 1
+        for mention in mentions:
+            mention_activity[mention] += 1
+        time_of_day_activity[hour] += 1
+        if normalized.strip():
+            documents.append(normalized)
+
+    total_messages = len(records)
+    if not total_messages:
+        trustworthiness = 'Neutral'
+    elif category_counts['negative'] / total_messages > 0.1:
+        trustworthiness = 'Untrustworthy'
+    elif category_counts['positive'] / total_messages > 0.1:
+        trustworthiness = 'Trustworthy'
+    else:
+        trustworthiness = 'Neutral'
+    avg_sentiment = polarity / total_messages if total_messages else 0
+    if avg_sentiment > 0:
+        sentiment_summary = 'Overall Positive'
+    elif avg_sentiment < 0:
+        sentiment_summary = 'Overall Negative'
+    else:
+        sentiment_summary = 'Neutral'
+
+    return json.dumps({
+        'users': users,
+        'servers': [guild_name],
+        'trustworthiness': trustworthiness,
+        'intent_summary': {intent: category_counts[intent] for intent in INTENT_KEYWORDS} if total_messages else {},
+        'sentiment_summary': sentiment_summary,
+        'top_words': get_top_words(documents) if total_messages else '',
+        'avg_message_length': round(total_length / total_messages, 2) if total_messages else 0,
+        'message_count': total_messages,
+        'most_active_channels': channel_activity,
+        'most_mentioned_users': mention_activity,
+        'time_of_day_summary': time_of_day_activity
+    })
+
+
+def get_top_words(documents):
+    if not documents:
+        return 'No significant words found.'
+    # A fresh vectorizer per run, so concurrent analyses never share fitted state.
+    vectorizer = TfidfVectorizer(stop_words='english')
+    try:
+        tfidf_matrix = vectorizer.fit_transform(documents)
+    except ValueError:
+        # Every document only contained stop words.
+        return 'No significant words found.'
+    scores = tfidf_matrix.sum(axis=0).A1
+    feature_names = vectorizer.get_feature_names_out()
+    return ', '.join(feature_names[i] for i in scores.argsort()[::-1][:TOP_WORDS])
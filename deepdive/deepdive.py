@@ -1,25 +1,28 @@
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
-from textblob import TextBlob
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sqlalchemy import create_engine, Column, Integer, String, Text, MetaData, Table, inspect, text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.exc import SQLAlchemyError
+import aiosqlite
 import os
 import asyncio
+import concurrent.futures
 import json
-from collections import defaultdict, Counter
+import logging
+from collections import Counter
 
-Base = declarative_base()
+from .analysis import analyze_messages, message_record, TOP_WORDS
 
-class Result(Base):
-    __tablename__ = 'results'
-    id = Column(Integer, primary_key=True)
-    user_id = Column(String, nullable=False)
-    platform = Column(String, nullable=False)
-    result = Column(Text, nullable=False)
+log = logging.getLogger("red.deepdive")
+
+# Worker processes used for message analysis.
+ANALYSIS_WORKERS = 2
+# Number of guilds searched at the same time, and the minimum delay between progress message edits.
+SEARCH_CONCURRENCY = 25
+PROGRESS_INTERVAL = 2.0
+# Channel histories read at the same time across all searches, messages read per channel,
+# and messages kept per matched user before the remaining channels of a guild are skipped.
+HISTORY_CONCURRENCY = 10
+HISTORY_LIMIT = 100
+MESSAGES_PER_USER = 500
 
 class DeepDive(commands.Cog):
     """Perform a deep dive to find information about a user"""
@@ -27,32 +30,34 @@ class DeepDive(commands.Cog):
         self.bot = bot
         self.config = Config.get_conf(self, identifier=1234567890)
         self.config.register_global(db_path='deepdive_results.sqlite', other_bots=[])
-        self.tfidf_vectorizer = TfidfVectorizer()
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=ANALYSIS_WORKERS)
         self.db_path = None
-        self.engine = None
-        self.Session = None
-        self.metadata = MetaData()
+        self.db = None
+        # Serializes setup and the read-modify-write of summary rows on the shared connection.
+        self.db_lock = asyncio.Lock()
+        self.history_semaphore = asyncio.Semaphore(HISTORY_CONCURRENCY)
+
+    async def cog_unload(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        await self._close_db()
 
     @commands.hybrid_command(name="deepdive")
     async def deepdive(self, ctx: commands.Context, username: str):
         """Perform a deep dive to find information about a user"""
         progress_message = await ctx.send(f"Starting deep dive on {username}...")
         # Setup database
-        self.db_path = await self.config.db_path()
-        self._setup_db()
+        await self._setup_db()
         await progress_message.edit(content=f"Database setup complete for {username}. Notifying other bots...")
         # Notify other bots and perform local deep dive
         await self._notify_other_bots(username, ctx, progress_message)
         await self._perform_local_deep_dive(username, ctx, progress_message)
         await progress_message.edit(content=f"Deep dive in progress for {username}. Fetching results...")
         # Fetch and compile results
-        results = await self._fetch_results(username)
-        aggregated_results = self._aggregate_results(results)
+        summary = await self._fetch_summary(username)
+        aggregated_results = self._aggregate_results(summary)
         embeds = self._create_results_embeds(username, aggregated_results)
         for embed in embeds:
             await ctx.send(embed=embed)
-        # Close the database
-        await self._close_db()
         await progress_message.edit(content=f"Deep dive complete for {username}.")
 
     @commands.hybrid_command(name="addbot")
@@ -88,22 +93,40 @@ class DeepDive(commands.Cog):
                 embed.add_field(name=bot['name'], value=bot['token'], inline=False)
             await ctx.send(embed=embed)
 
-    def _setup_db(self):
-        self.engine = create_engine(f'sqlite:///{self.db_path}')
-        self.Session = sessionmaker(bind=self.engine)
-        inspector = inspect(self.engine)
-        # Create the results table if it doesn't exist
-        if not inspector.has_table('results'):
-            Base.metadata.create_all(self.engine)
-        else:
-            # Check if the existing table has the correct schema
-            with self.engine.connect() as conn:
-                result = conn.execute(text("PRAGMA table_info(results)")).fetchall()
-                columns = [row[1] for row in result]
-                if 'user_id' not in columns:
-                    # Drop the existing table and recreate it
-                    conn.execute(text("DROP TABLE results"))
-                    Base.metadata.create_all(self.engine)
+    async def _setup_db(self):
+        """Open the shared result store connection once and make sure its schema exists."""
+        async with self.db_lock:
+            if self.db is not None:
+                return
+            self.db_path = await self.config.db_path()
+            db = await aiosqlite.connect(self.db_path)
+            # Check if an existing results table has the correct schema
+            async with db.execute("PRAGMA table_info(results)") as cursor:
+                columns = [row[1] for row in await cursor.fetchall()]
+            if columns and 'user_id' not in columns:
+                await db.execute("DROP TABLE results")
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, user_id VARCHAR NOT NULL, platform VARCHAR NOT NULL, result TEXT NOT NULL)"
+            )
+            await db.execute("CREATE INDEX IF NOT EXISTS ix_results_user_id ON results (user_id)")
+            # One pre-aggregated row per user, updated with every saved result.
+            await db.execute("CREATE TABLE IF NOT EXISTS summaries (user_id VARCHAR PRIMARY KEY, summary TEXT NOT NULL)")
+            await self._backfill_summaries(db)
+            await db.commit()
+            self.db = db
+
+    async def _backfill_summaries(self, db):
+        """Build summary rows for results stored before summaries existed."""
+        summaries = {}
+        async with db.execute(
+            "SELECT user_id, result FROM results WHERE user_id NOT IN (SELECT user_id FROM summaries) ORDER BY id"
+        ) as cursor:
+            async for user_id, result in cursor:
+                self._merge_result(summaries.setdefault(user_id, self._empty_summary()), json.loads(result))
+        await db.executemany(
+            "INSERT INTO summaries (user_id, summary) VALUES (?, ?)",
+            [(user_id, json.dumps(summary)) for user_id, summary in summaries.items()]
+        )
 
     async def _notify_other_bots(self, username, ctx, progress_message):
         other_bots = await self.config.other_bots()
@@ -137,20 +160,76 @@ class DeepDive(commands.Cog):
     async def _perform_local_deep_dive(self, username, ctx, progress_message, client=None):
         if client is None:
             client = self.bot
-        total_guilds = len(client.guilds)
-        for i, guild in enumerate(client.guilds, start=1):
-            await self._search_guild(guild, username, ctx)
-            progress = self._create_progress_bar(i, total_guilds)
-            await progress_message.edit(content=f"Deep dive in progress for {username}. Searched {i}/{total_guilds} servers...\n**Progress:** {progress}")
+        guilds = list(client.guilds)
+        total_guilds = len(guilds)
+        searched = 0
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+        async def search(guild):
+            nonlocal searched
+            async with semaphore:
+                try:
+                    await self._search_guild(guild, username, ctx)
+                except Exception:
+                    log.exception("Deep dive for %s failed in guild %s.", username, guild.id)
+            searched += 1
+
+        # Guilds are searched concurrently; the progress message is edited on a timer instead of once per guild.
+        search_task = asyncio.ensure_future(asyncio.gather(*(search(guild) for guild in guilds)))
+        while True:
+            try:
+                await asyncio.wait_for(asyncio.shield(search_task), timeout=PROGRESS_INTERVAL)
+                break
+            except asyncio.TimeoutError:
+                await self._edit_search_progress(progress_message, username, searched, total_guilds)
+        await self._edit_search_progress(progress_message, username, total_guilds, total_guilds)
+
+    async def _edit_search_progress(self, progress_message, username, searched, total_guilds):
+        progress = self._create_progress_bar(searched, total_guilds) if total_guilds else ''
+        try:
+            await progress_message.edit(content=f"Deep dive in progress for {username}. Searched {searched}/{total_guilds} servers...\n**Progress:** {progress}")
+        except discord.HTTPException:
+            pass
 
     async def _search_guild(self, guild, username, ctx):
-        members = [member async for member in guild.fetch_members(limit=None)]
-        users = [member for member in members if self._is_matching_user(member, username)]
+        users = await self._find_members(guild, username)
         if users:
             messages = await self._fetch_user_messages(guild, users)
-            result = self._analyze_messages(users, messages, guild.name)
+            result = await self._analyze_messages(users, messages, guild.name)
             await self._save_result(users[0].id, 'Discord', result)
 
+    async def _find_members(self, guild, username):
+        """Return the members of ``guild`` matching ``username``, using the gateway member cache.
+
+        Guilds that are not fully chunked are asked through a gateway member query instead of
+        paging the whole member list over REST.
+        """
+        user_id = self._parse_user_id(username)
+        if user_id is not None:
+            member = guild.get_member(user_id)
+            if member is not None or guild.chunked:
+                return [member] if member is not None else []
+            query = {'user_ids': [user_id]}
+        else:
+            members = [member for member in guild.members if self._is_matching_user(member, username)]
+            if members or guild.chunked:
+                return members
+            query = {'query': username.split('#')[0], 'limit': 100}
+        try:
+            members = await guild.query_members(**query)
+        except (discord.ClientException, asyncio.TimeoutError):
+            # The members intent is disabled for this client or the gateway did not answer.
+            return []
+        return [member for member in members if self._is_matching_user(member, username)]
+
+    def _parse_user_id(self, username):
+        if username.startswith('<@') and username.endswith('>'):
+            username = username[2:-1].lstrip('!')
+        try:
+            return int(username)
+        except ValueError:
+            return None
+
     def _is_matching_user(self, member, username):
         if username.startswith('<@') and username.endswith('>'):
             username = username[2:-1]
@@ -165,160 +244,90 @@ class DeepDive(commands.Cog):
                     member.mention == username)
 
     async def _fetch_user_messages(self, guild, users):
+        """Collect the messages of ``users`` by reading each readable channel's history once."""
+        target_ids = {user.id for user in users}
+        counts = dict.fromkeys(target_ids, 0)
         messages = []
-        for channel in guild.text_channels:
-            for user in users:
-                async for message in channel.history(limit=100):
-                    if message.author == user:
-                        messages.append(message)
+
+        def budget_reached():
+            return all(count >= MESSAGES_PER_USER for count in counts.values())
+
+        async def collect(channel):
+            async with self.history_semaphore:
+                if budget_reached():
+                    return
+                try:
+                    async for message in channel.history(limit=HISTORY_LIMIT):
+                        author_id = message.author.id
+                        if author_id in target_ids and counts[author_id] < MESSAGES_PER_USER:
+                            counts[author_id] += 1
+                            messages.append(message)
+                            if budget_reached():
+                                return
+                except discord.HTTPException:
+                    pass
+
+        channels = [channel for channel in guild.text_channels if self._can_read_history(channel)]
+        await asyncio.gather(*(collect(channel) for channel in channels))
         return messages
 
-    def _analyze_messages(self, users, messages, guild_name):
-        if not messages:
-            return json.dumps({
-                'users': ', '.join([str(user) for user in users]),
-                'servers': [guild_name],
-                'trustworthiness': 'Neutral',
-                'intent_summary': {},
-                'sentiment_summary': 'Neutral',
-                'top_words': '',
-                'avg_message_length': 0,
-                'most_active_channels': {},
-                'most_mentioned_users': {},
-                'time_of_day_summary': [0] * 24
-            })
-        trustworthiness = self._evaluate_trustworthiness(messages)
-        intent_summary = self._analyze_intent(messages)
-        sentiment_summary = self._analyze_sentiment(messages)
-        top_words = self._get_top_words(messages)
-        avg_message_length = self._calculate_avg_message_length(messages)
-        most_active_channels = self._get_most_active_channels(messages)
-        most_mentioned_users = self._get_most_mentioned_users(messages)
-        time_of_day_summary = self._get_time_of_day_summary(messages)
-        return json.dumps({
-            'users': ', '.join([str(user) for user in users]),
-            'servers': [guild_name],
-            'trustworthiness': trustworthiness,
-            'intent_summary': intent_summary,
-            'sentiment_summary': sentiment_summary,
-            'top_words': top_words,
-            'avg_message_length': avg_message_length,
-            'most_active_channels': most_active_channels,
-            'most_mentioned_users': most_mentioned_users,
-            'time_of_day_summary': time_of_day_summary
-        })
-
-    def _evaluate_trustworthiness(self, messages):
-        positive_keywords = ['thanks', 'please', 'help', 'support']
-        negative_keywords = ['spam', 'scam', 'abuse', 'hate']
-        positive_score = sum(1 for msg in messages if any(kw in msg.content.lower() for kw in positive_keywords))
-        negative_score = sum(1 for msg in messages if any(kw in msg.content.lower() for kw in negative_keywords))
-        total_messages = len(messages)
-        positive_ratio = positive_score / total_messages
-        negative_ratio = negative_score / total_messages
-        if negative_ratio > 0.1:
-            return 'Untrustworthy'
-        elif positive_ratio > 0.1:
-            return 'Trustworthy'
-        else:
-            return 'Neutral'
-
-    def _analyze_sentiment(self, messages):
-        sentiments = [TextBlob(msg.content).sentiment.polarity for msg in messages]
-        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
-        if avg_sentiment > 0:
-            return 'Overall Positive'
-        elif avg_sentiment < 0:
-            return 'Overall Negative'
-        else:
-            return 'Neutral'
-
-    def _analyze_intent(self, messages):
-        intent_keywords = {
-            'seekingHelp': ['help', 'support', 'assist', 'issue', 'problem'],
-            'offeringHelp': ['assist', 'help', 'support', 'aid', 'offer'],
-            'promotion': ['check out', 'subscribe', 'follow', 'buy', 'join'],
-            'casual': ['hello', 'hi', 'hey', 'lol', 'haha']
-        }
-        intents = {intent: 0 for intent in intent_keywords}
-        for msg in messages:
-            for intent, keywords in intent_keywords.items():
-                if any(kw in msg.content.lower() for kw in keywords):
-                    intents[intent] += 1
-        return intents
-
-    def _get_top_words(self, messages):
-        stop_words = self.tfidf_vectorizer.get_stop_words()
-        if stop_words is None:
-            stop_words = []
-
-        filtered_messages = [msg.content for msg in messages if msg.content.strip() and not all(word in stop_words for word in msg.content.split())]
-        if not filtered_messages:
-            return 'No significant words found.'
-
-        tfidf_matrix = self.tfidf_vectorizer.fit_transform(filtered_messages)
-        feature_names = self.tfidf_vectorizer.get_feature_names_out()
-        top_words = [feature_names[i] for i in tfidf_matrix[0].nonzero()[1]]
-        return ', '.join(top_words)
-
-    def _calculate_avg_message_length(self, messages):
-        total_length = sum(len(msg.content) for msg in messages)
-        return round(total_length / len(messages), 2) if messages else 0
-
-    def _get_most_active_channels(self, messages):
-        channel_activity = defaultdict(int)
-        for msg in messages:
-            channel_activity[msg.channel.name] += 1
-        return channel_activity
-
-    def _get_most_mentioned_users(self, messages):
-        mention_activity = defaultdict(int)
-        for msg in messages:
-            for mention in msg.mentions:
-                mention_activity[mention.name] += 1
-        return mention_activity
-
-    def _get_time_of_day_summary(self, messages):
-        time_of_day_activity = [0] * 24
-        for msg in messages:
-            time_of_day_activity[msg.created_at.hour] += 1
-        return time_of_day_activity
-
-    def _aggregate_results(self, results):
-        aggregated = {
+    def _can_read_history(self, channel):
+        permissions = channel.permissions_for(channel.guild.me)
+        return permissions.view_channel and permissions.read_message_history
+
+    async def _analyze_messages(self, users, messages, guild_name):
+        # The analysis is CPU bound, so it runs in a worker process to keep the event loop responsive.
+        records = [message_record(message) for message in messages]
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, analyze_messages, ', '.join([str(user) for user in users]), records, guild_name
+        )
+
+    def _empty_summary(self):
+        return {
             'users': '',
-            'servers': set(),
-            'trustworthiness': defaultdict(int),
-            'intent_summary': defaultdict(int),
-            'sentiment_summary': defaultdict(int),
-            'top_words': [],
-            'avg_message_length': 0,
-            'most_active_channels': defaultdict(int),
-            'most_mentioned_users': defaultdict(int),
+            'servers': [],
+            'trustworthiness': {},
+            'intent_summary': {},
+            'sentiment_summary': {},
+            'top_words': {},
+            'total_length': 0,
+            'message_count': 0,
+            'most_active_channels': {},
+            'most_mentioned_users': {},
             'time_of_day_summary': [0] * 24
         }
-        total_messages = 0
-        for result in results:
-            result_data = json.loads(result.result)
-            aggregated['users'] = result_data['users']
-            aggregated['servers'].update(result_data['servers'])
-            if result_data['trustworthiness']:
-                aggregated['trustworthiness'][result_data['trustworthiness']] += 1
-            for intent, count in result_data['intent_summary'].items():
-                aggregated['intent_summary'][intent] += count
-            aggregated['sentiment_summary'][result_data['sentiment_summary']] += 1
-            aggregated['top_words'].extend(result_data['top_words'].split(', '))
-            aggregated['avg_message_length'] += result_data['avg_message_length'] * len(result_data['top_words'].split(', '))
-            for channel, count in result_data['most_active_channels'].items():
-                aggregated['most_active_channels'][channel] += count
-            for user, count in result_data['most_mentioned_users'].items():
-                aggregated['most_mentioned_users'][user] += count
-            for hour, count in enumerate(result_data['time_of_day_summary']):
-                aggregated['time_of_day_summary'][hour] += count
-            total_messages += len(result_data['top_words'].split(', '))
-        aggregated['avg_message_length'] /= total_messages if total_messages else 1
-        aggregated['top_words'] = ', '.join(self.tfidf_vectorizer.get_feature_names_out()[:10])
-        aggregated['servers'] = ', '.join(aggregated['servers'])
+
+    def _merge_result(self, summary, result_data):
+        """Fold one stored result into a user's summary."""
+        def add(counts, key, count=1):
+            counts[key] = counts.get(key, 0) + count
+
+        summary['users'] = result_data['users']
+        summary['servers'].extend(server for server in result_data['servers'] if server not in summary['servers'])
+        if result_data['trustworthiness']:
+            add(summary['trustworthiness'], result_data['trustworthiness'])
+        for intent, count in result_data['intent_summary'].items():
+            add(summary['intent_summary'], intent, count)
+        add(summary['sentiment_summary'], result_data['sentiment_summary'])
+        if result_data['top_words'] and result_data['top_words'] != 'No significant words found.':
+            for word in result_data['top_words'].split(', '):
+                add(summary['top_words'], word)
+        # Results stored before message counts were recorded fall back to the old estimate.
+        message_count = result_data.get('message_count', len(result_data['top_words'].split(', ')))
+        summary['total_length'] += result_data['avg_message_length'] * message_count
+        summary['message_count'] += message_count
+        for channel, count in result_data['most_active_channels'].items():
+            add(summary['most_active_channels'], channel, count)
+        for user, count in result_data['most_mentioned_users'].items():
+            add(summary['most_mentioned_users'], user, count)
+        for hour, count in enumerate(result_data['time_of_day_summary']):
+            summary['time_of_day_summary'][hour] += count
+
+    def _aggregate_results(self, summary):
+        aggregated = dict(summary)
+        aggregated['avg_message_length'] = summary['total_length'] / (summary['message_count'] or 1)
+        aggregated['top_words'] = ', '.join(word for word, _ in Counter(summary['top_words']).most_common(TOP_WORDS))
+        aggregated['servers'] = ', '.join(summary['servers'])
         return aggregated
 
     def _create_results_embeds(self, username, aggregated_results):
@@ -351,22 +360,24 @@ class DeepDive(commands.Cog):
         return embeds
 
     async def _save_result(self, user_id, platform, result):
-        session = self.Session()
-        new_result = Result(
-            user_id=user_id,
-            platform=platform,
-            result=result
-        )
-        session.add(new_result)
-        session.commit()
-        session.close()
-
-    async def _fetch_results(self, username):
-        session = self.Session()
-        results = session.query(Result).filter(Result.user_id == username).all()
-        session.close()
-        return results
+        user_id = str(user_id)
+        async with self.db_lock:
+            async with self.db.execute("SELECT summary FROM summaries WHERE user_id = ?", (user_id,)) as cursor:
+                row = await cursor.fetchone()
+            summary = json.loads(row[0]) if row else self._empty_summary()
+            self._merge_result(summary, json.loads(result))
+            await self.db.execute("INSERT INTO results (user_id, platform, result) VALUES (?, ?, ?)", (user_id, platform, result))
+            await self.db.execute("INSERT OR REPLACE INTO summaries (user_id, summary) VALUES (?, ?)", (user_id, json.dumps(summary)))
+            await self.db.commit()
+
+    async def _fetch_summary(self, username):
+        user_id = self._parse_user_id(username)
+        key = str(user_id) if user_id is not None else username
+        async with self.db.execute("SELECT summary FROM summaries WHERE user_id = ?", (key,)) as cursor:
+            row = await cursor.fetchone()
+        return json.loads(row[0]) if row else self._empty_summary()
 
     async def _close_db(self):
-        if self.engine:
-            self.engine.dispose()
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
@@ -75,8 +75,7 @@ class DashboardIntegration(commands.Cog):  # Inherit from commands.Cog
       form = kwargs["data"]["form"]
       event = form.get("event")
       channel_id = int(form.get("channel"))
-      async with self.bot.get_cog("EventLogger").config.guild(guild).channels() as channels:
-        channels[event] = channel_id
+      await self.bot.get_cog("EventLogger").set_log_channel(guild, event, channel_id)
       return {
         "status": 0,
         "notifications": [{"message": f"Logging channel for {event} set to <#{channel_id}>", "category": "success"}],
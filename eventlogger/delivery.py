@@ -0,0 +1,191 @@
+import asyncio
+import collections
+import logging
+import time
+import typing
+
+import discord
+
+log = logging.getLogger("red.eventlogger.delivery")
+
+# Discord accepts at most 10 embeds and 6000 embed characters per message.
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+MAX_DESCRIPTION_LENGTH = 4096
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+
+class DeliveryStats:
+  """Counters describing how far behind the delivery engine is."""
+
+  def __init__(self) -> None:
+    self.queued = 0
+    self.sent = 0
+    self.messages = 0
+    self.dropped = 0
+    self.coalesced = 0
+    self.failed = 0
+    self.max_depth = 0
+    self.last_batch_size = 0
+    self.last_latency = 0.0
+    self.total_latency = 0.0
+
+  @property
+  def average_batch_size(self) -> float:
+    return self.sent / self.messages if self.messages else 0.0
+
+  @property
+  def average_latency(self) -> float:
+    return self.total_latency / self.messages if self.messages else 0.0
+
+
+class BatchedEmbedDelivery:
+  """Groups queued embeds per destination channel and sends them in packs of up to 10.
+
+  The queue is bounded by ``max_size`` embeds across all channels. When it is full,
+  ``policy`` decides what happens to a new embed:
+  - ``drop_oldest``: the oldest pending embed for the busiest channel is discarded.
+  - ``drop_newest``: the new embed is discarded.
+  - ``coalesce``: the new embed is folded into the last pending embed for its channel
+    when the description fits, otherwise the oldest pending embed is discarded.
+  """
+
+  def __init__(
+    self,
+    max_size: int = 1000,
+    flush_interval: float = 10.0,
+    policy: str = "drop_oldest",
+  ) -> None:
+    self.max_size = max_size
+    self.flush_interval = flush_interval
+    self.policy = policy
+    self.stats = DeliveryStats()
+    self._channels: typing.Dict[int, discord.abc.Messageable] = {}
+    self._pending: typing.Dict[int, typing.Deque[discord.Embed]] = {}
+    self._depth = 0
+    self._wakeup = asyncio.Event()
+    self._stopping = False
+    self._task: typing.Optional[asyncio.Task] = None
+
+  @property
+  def depth(self) -> int:
+    return self._depth
+
+  def start(self) -> None:
+    if self._task is None or self._task.done():
+      self._stopping = False
+      self._task = asyncio.create_task(self._run())
+
+  async def stop(self) -> None:
+    if self._task is not None:
+      # Let the loop finish the send in progress instead of cancelling it mid-batch.
+      self._stopping = True
+      self._wakeup.set()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+    # Deliver whatever is still pending before the cog goes away.
+    await self.flush()
+
+  def put(self, channel: discord.abc.Messageable, embed: discord.Embed) -> bool:
+    """Queue an embed for ``channel``. Returns ``False`` if it was dropped."""
+    pending = self._pending.setdefault(channel.id, collections.deque())
+    self._channels[channel.id] = channel
+    if self._depth >= self.max_size:
+      if self.policy == "drop_newest":
+        self.stats.dropped += 1
+        return False
+      if self.policy == "coalesce" and pending and self._coalesce(pending[-1], embed):
+        self.stats.coalesced += 1
+        return True
+      self._drop_oldest()
+    pending.append(embed)
+    self._depth += 1
+    self.stats.queued += 1
+    self.stats.max_depth = max(self.stats.max_depth, self._depth)
+    if len(pending) >= MAX_EMBEDS_PER_MESSAGE:
+      # A full batch is ready, no need to wait for the next interval.
+      self._wakeup.set()
+    return True
+
+  async def flush(self) -> None:
+    channel_ids = [channel_id for channel_id, pending in self._pending.items() if pending]
+    if not channel_ids:
+      return
+    await asyncio.gather(*(self._flush_channel(channel_id) for channel_id in channel_ids))
+
+  async def _run(self) -> None:
+    while not self._stopping:
+      try:
+        await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+      except asyncio.TimeoutError:
+        pass
+      self._wakeup.clear()
+      try:
+        await self.flush()
+      except Exception:
+        log.exception("Unexpected error while flushing the event queue.")
+
+  async def _flush_channel(self, channel_id: int) -> None:
+    pending = self._pending.get(channel_id)
+    channel = self._channels.get(channel_id)
+    while pending:
+      batch = self._take_batch(pending)
+      self._depth -= len(batch)
+      start = time.monotonic()
+      try:
+        await channel.send(embeds=batch)
+      except asyncio.CancelledError:
+        # Put the batch back so a later flush can still deliver it.
+        pending.extendleft(reversed(batch))
+        self._depth += len(batch)
+        raise
+      except discord.HTTPException as e:
+        self.stats.failed += len(batch)
+        log.warning("Failed to deliver %s log embeds to channel %s: %s", len(batch), channel_id, e)
+        if isinstance(e, discord.Forbidden) or isinstance(e, discord.NotFound):
+          # The channel is gone or unusable, discard its backlog.
+          self._depth -= len(pending)
+          self.stats.failed += len(pending)
+          pending.clear()
+        continue
+      latency = time.monotonic() - start
+      self.stats.sent += len(batch)
+      self.stats.messages += 1
+      self.stats.last_batch_size = len(batch)
+      self.stats.last_latency = latency
+      self.stats.total_latency += latency
+    self._pending.pop(channel_id, None)
+    self._channels.pop(channel_id, None)
+
+  @staticmethod
+  def _take_batch(pending: typing.Deque[discord.Embed]) -> typing.List[discord.Embed]:
+    batch = [pending.popleft()]
+    size = len(batch[0])
+    while pending and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+      next_size = len(pending[0])
+      if size + next_size > MAX_EMBED_CHARS_PER_MESSAGE:
+        break
+      batch.append(pending.popleft())
+      size += next_size
+    return batch
+
+  def _drop_oldest(self) -> None:
+    busiest = max(self._pending.values(), key=len, default=None)
+    if busiest:
+      busiest.popleft()
+      self._depth -= 1
+      self.stats.dropped += 1
+
+  @staticmethod
+  def _coalesce(target: discord.Embed, embed: discord.Embed) -> bool:
+    title = embed.title or ""
+    addition = f"\n\n**{title}**\n{embed.description or ''}"
+    description = target.description or ""
+    if len(description) + len(addition) > MAX_DESCRIPTION_LENGTH:
+      return False
+    target.description = description + addition
+    return True
@@ -1,134 +1,135 @@
 import discord
 from redbot.core import commands
-from PIL import Image, ImageFilter, ImageOps, ImageEnhance
-import aiohttp
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
 import io
-import legofy
+
+from .pipeline import MAX_ATTACHMENT_SIZE, OperationError, check_chain, parse_chain, process_image
+
+# Worker processes for decoding, transforming and encoding images.
+IMAGE_WORKERS = 2
+# Total size of the cached results, kept in least recently used order.
+CACHE_MAX_BYTES = 64 * 1024 * 1024
 
 class ImageManipulation(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=IMAGE_WORKERS)
+        self.cache = collections.OrderedDict()  # (attachment sha256, chain) -> PNG bytes
+        self.cache_size = 0
+
+    async def cog_unload(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
     async def get_image(self, ctx):
         if not ctx.message.attachments:
             await ctx.send("Please attach an image.")
             return None
         attachment = ctx.message.attachments[0]
-        img_bytes = await attachment.read()
-        return Image.open(io.BytesIO(img_bytes))
+        if attachment.size > MAX_ATTACHMENT_SIZE:
+            await ctx.send(f"Please attach an image smaller than {MAX_ATTACHMENT_SIZE // (1024 * 1024)} MB.")
+            return None
+        return await attachment.read()
+
+    async def run_chain(self, ctx, chain, filename):
+        """Apply a chain of ``(name, args)`` operations to the attached image and send the result."""
+        try:
+            check_chain(chain)
+        except OperationError as e:
+            await ctx.send(str(e))
+            return
+        img_bytes = await self.get_image(ctx)
+        if not img_bytes:
+            return
+        key = (hashlib.sha256(img_bytes).hexdigest(), chain)
+        result = self.cache.get(key)
+        if result is not None:
+            self.cache.move_to_end(key)
+        else:
+            try:
+                async with ctx.typing():
+                    result = await asyncio.get_running_loop().run_in_executor(self.executor, process_image, img_bytes, chain)
+            except OperationError as e:
+                await ctx.send(str(e))
+                return
+            self.cache_result(key, result)
+        await ctx.send(file=discord.File(fp=io.BytesIO(result), filename=filename))
+
+    def cache_result(self, key, result):
+        if len(result) > CACHE_MAX_BYTES:
+            return
+        self.cache[key] = result
+        self.cache_size += len(result)
+        while self.cache_size > CACHE_MAX_BYTES:
+            _, evicted = self.cache.popitem(last=False)
+            self.cache_size -= len(evicted)
 
-    async def send_image(self, ctx, img, filename):
-        with io.BytesIO() as image_binary:
-            img.save(image_binary, 'PNG')
-            image_binary.seek(0)
-            await ctx.send(file=discord.File(fp=image_binary, filename=filename))
+    @commands.command()
+    async def imchain(self, ctx, *, operations: str):
+        """Apply several operations to an image in one go, separated by `|`.
+
+        Example: `imchain resize 512 512 | contrast 1.5 | sharpen 2`
+        """
+        try:
+            chain = parse_chain(operations)
+        except OperationError as e:
+            await ctx.send(str(e))
+            return
+        await self.run_chain(ctx, chain, 'chained.png')
 
     @commands.command()
     async def resize(self, ctx, width: int, height: int):
         """Resize an image to the specified width and height."""
-        img = await self.get_image(ctx)
-        if img:
-            img_resized = img.resize((width, height))
-            await self.send_image(ctx, img_resized, 'resized.png')
+        await self.run_chain(ctx, (("resize", (width, height)),), 'resized.png')
 
     @commands.command()
     async def rotate(self, ctx, degrees: int):
         """Rotate an image by the specified number of degrees."""
-        img = await self.get_image(ctx)
-        if img:
-            img_rotated = img.rotate(degrees)
-            await self.send_image(ctx, img_rotated, 'rotated.png')
+        await self.run_chain(ctx, (("rotate", (degrees,)),), 'rotated.png')
 
     @commands.command()
     async def flip(self, ctx, direction: str):
         """Flip an image. Available directions: horizontal, vertical."""
-        img = await self.get_image(ctx)
-        if img:
-            if direction.lower() == "horizontal":
-                img_flipped = ImageOps.mirror(img)
-            elif direction.lower() == "vertical":
-                img_flipped = ImageOps.flip(img)
-            else:
-                await ctx.send("Invalid direction. Use 'horizontal' or 'vertical'.")
-                return
-            await self.send_image(ctx, img_flipped, 'flipped.png')
+        await self.run_chain(ctx, (("flip", (direction.lower(),)),), 'flipped.png')
 
     @commands.command()
     async def grayscale(self, ctx):
         """Convert an image to grayscale."""
-        img = await self.get_image(ctx)
-        if img:
-            img_gray = ImageOps.grayscale(img)
-            await self.send_image(ctx, img_gray, 'grayscale.png')
+        await self.run_chain(ctx, (("grayscale", ()),), 'grayscale.png')
 
     @commands.command()
     async def invert(self, ctx):
         """Invert the colors of an image."""
-        img = await self.get_image(ctx)
-        if img:
-            img_inverted = ImageOps.invert(img.convert("RGB"))
-            await self.send_image(ctx, img_inverted, 'inverted.png')
+        await self.run_chain(ctx, (("invert", ()),), 'inverted.png')
 
     @commands.command()
     async def contrast(self, ctx, factor: float):
         """Adjust the contrast of an image. Factor > 1 increases contrast, < 1 decreases."""
-        img = await self.get_image(ctx)
-        if img:
-            enhancer = ImageEnhance.Contrast(img)
-            img_contrast = enhancer.enhance(factor)
-            await self.send_image(ctx, img_contrast, 'contrast.png')
+        await self.run_chain(ctx, (("contrast", (factor,)),), 'contrast.png')
 
     @commands.command()
     async def brightness(self, ctx, factor: float):
         """Adjust the brightness of an image. Factor > 1 increases brightness, < 1 decreases."""
-        img = await self.get_image(ctx)
-        if img:
-            enhancer = ImageEnhance.Brightness(img)
-            img_brightness = enhancer.enhance(factor)
-            await self.send_image(ctx, img_brightness, 'brightness.png')
+        await self.run_chain(ctx, (("brightness", (factor,)),), 'brightness.png')
 
     @commands.command()
     async def blur(self, ctx, radius: int):
         """Apply a blur effect to an image."""
-        img = await self.get_image(ctx)
-        if img:
-            img_blurred = img.filter(ImageFilter.GaussianBlur(radius))
-            await self.send_image(ctx, img_blurred, 'blurred.png')
+        await self.run_chain(ctx, (("blur", (radius,)),), 'blurred.png')
 
     @commands.command()
     async def sharpen(self, ctx, factor: float):
         """Sharpen an image. Factor > 1 increases sharpness, < 1 decreases."""
-        img = await self.get_image(ctx)
-        if img:
-            enhancer = ImageEnhance.Sharpness(img)
-            img_sharpen = enhancer.enhance(factor)
-            await self.send_image(ctx, img_sharpen, 'sharpen.png')
+        await self.run_chain(ctx, (("sharpen", (factor,)),), 'sharpen.png')
 
     @commands.command()
     async def imfilter(self, ctx, filter_name: str):
         """Apply a filter to an image. Available filters: BLUR, CONTOUR, DETAIL, EDGE_ENHANCE, EMBOSS, SHARPEN"""
-        img = await self.get_image(ctx)
-        if img:
-            filter_dict = {
-                "BLUR": ImageFilter.BLUR,
-                "CONTOUR": ImageFilter.CONTOUR,
-                "DETAIL": ImageFilter.DETAIL,
-                "EDGE_ENHANCE": ImageFilter.EDGE_ENHANCE,
-                "EMBOSS": ImageFilter.EMBOSS,
-                "SHARPEN": ImageFilter.SHARPEN
-            }
-
-            if filter_name.upper() not in filter_dict:
-                await ctx.send("Invalid filter name. Available filters: BLUR, CONTOUR, DETAIL, EDGE_ENHANCE, EMBOSS, SHARPEN")
-                return
-
-            img_filtered = img.filter(filter_dict[filter_name.upper()])
-            await self.send_image(ctx, img_filtered, 'filtered.png')
+        await self.run_chain(ctx, (("imfilter", (filter_name.upper(),)),), 'filtered.png')
 
     @commands.command()
     async def legofy(self, ctx):
         """Turn an image into a LEGO-style creation."""
-        img = await self.get_image(ctx)
-        if img:
-            legofy.legofy_image(img, img)
-            await self.send_image(ctx, img, 'legofy.png')
+        await self.run_chain(ctx, (("legofy", ()),), 'legofy.png')
@@ -0,0 +1,120 @@
+import io
+import re
+
+import legofy
+from PIL import Image, ImageFilter, ImageOps, ImageEnhance
+
+# Attachments above this size are refused before they are downloaded.
+MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024
+# Images above this many pixels are refused before they are decoded.
+MAX_INPUT_PIXELS = 6000 * 6000
+# Largest side an image may have when it reaches one of the slow operations below.
+HEAVY_MAX_SIDE = 1024
+HEAVY_OPERATIONS = {"blur", "imfilter", "legofy"}
+MAX_RESIZE_SIDE = 4096
+MAX_CHAIN_LENGTH = 10
+
+FILTERS = {
+    "BLUR": ImageFilter.BLUR,
+    "CONTOUR": ImageFilter.CONTOUR,
+    "DETAIL": ImageFilter.DETAIL,
+    "EDGE_ENHANCE": ImageFilter.EDGE_ENHANCE,
+    "EMBOSS": ImageFilter.EMBOSS,
+    "SHARPEN": ImageFilter.SHARPEN
+}
+
+
+class OperationError(ValueError):
+    """Raised for an invalid operation chain or an image that cannot be processed."""
+
+
+def _flip(img, direction):
+    return ImageOps.mirror(img) if direction == "horizontal" else ImageOps.flip(img)
+
+
+def _legofy(img):
+    legofy.legofy_image(img, img)
+    return img
+
+
+# name -> (function, argument types)
+OPERATIONS = {
+    "resize": (lambda img, width, height: img.resize((width, height)), (int, int)),
+    "rotate": (lambda img, degrees: img.rotate(degrees), (int,)),
+    "flip": (_flip, (str,)),
+    "grayscale": (lambda img: ImageOps.grayscale(img), ()),
+    "invert": (lambda img: ImageOps.invert(img.convert("RGB")), ()),
+    "contrast": (lambda img, factor: ImageEnhance.Contrast(img).enhance(factor), (float,)),
+    "brightness": (lambda img, factor: ImageEnhance.Brightness(img).enhance(factor), (float,)),
+    "blur": (lambda img, radius: img.filter(ImageFilter.GaussianBlur(radius)), (int,)),
+    "sharpen": (lambda img, factor: ImageEnhance.Sharpness(img).enhance(factor), (float,)),
+    "imfilter": (lambda img, filter_name: img.filter(FILTERS[filter_name]), (str,)),
+    "legofy": (_legofy, ()),
+}
+
+
+def parse_chain(text):
+    """Parse ``"resize 512 512 | contrast 1.5 | sharpen 2"`` into a chain of ``(name, args)`` steps."""
+    chain = []
+    for step in re.split(r"\s*(?:\||->)\s*", text.strip()):
+        if not step:
+            raise OperationError("Empty operation in the chain, separate operations with a single `|`.")
+        name, *raw_args = step.split()
+        name = name.lower()
+        if name not in OPERATIONS:
+            raise OperationError(f"Unknown operation `{name}`. Available operations: {', '.join(OPERATIONS)}")
+        arg_types = OPERATIONS[name][1]
+        if len(raw_args) != len(arg_types):
+            raise OperationError(f"`{name}` takes {len(arg_types)} argument(s).")
+        try:
+            args = tuple(arg_type(arg) for arg_type, arg in zip(arg_types, raw_args))
+        except ValueError:
+            raise OperationError(f"Invalid arguments for `{name}`.")
+        if name == "imfilter":
+            args = (args[0].upper(),)
+        chain.append((name, args))
+    chain = tuple(chain)
+    check_chain(chain)
+    return chain
+
+
+def check_chain(chain):
+    if not chain or len(chain) > MAX_CHAIN_LENGTH:
+        raise OperationError(f"Chains can have between 1 and {MAX_CHAIN_LENGTH} operations.")
+    for name, args in chain:
+        if name == "flip" and args[0] not in ("horizontal", "vertical"):
+            raise OperationError("Invalid direction. Use 'horizontal' or 'vertical'.")
+        if name == "imfilter" and args[0] not in FILTERS:
+            raise OperationError(f"Invalid filter name. Available filters: {', '.join(FILTERS)}")
+        if name == "resize" and not all(0 < side <= MAX_RESIZE_SIDE for side in args):
+            raise OperationError(f"Width and height must be between 1 and {MAX_RESIZE_SIDE}.")
+
+
+def process_image(data, chain):
+    """Decode ``data``, apply every step of ``chain`` and return the result as PNG bytes.
+
+    This runs in a worker process, so the image is decoded and encoded exactly once per chain.
+    """
+    # Pillow decodes lazily, so a broken or oversized image can fail in any step, not only in ``open``.
+    try:
+        return _run_chain(data, chain)
+    except Image.DecompressionBombError:
+        raise OperationError("That image is too large to process.")
+    except OSError:
+        raise OperationError("That attachment is not an image I can read.")
+
+
+def _run_chain(data, chain):
+    img = Image.open(io.BytesIO(data))
+    if img.width * img.height > MAX_INPUT_PIXELS:
+        raise OperationError("That image is too large to process.")
+    if any(name in HEAVY_OPERATIONS for name, _ in chain):
+        # Lets JPEG decoding skip straight to a reduced size when the image will be shrunk anyway.
+        img.draft(img.mode, (HEAVY_MAX_SIDE, HEAVY_MAX_SIDE))
+    for name, args in chain:
+        if name in HEAVY_OPERATIONS and max(img.size) > HEAVY_MAX_SIDE:
+            img.thumbnail((HEAVY_MAX_SIDE, HEAVY_MAX_SIDE))
+        img = OPERATIONS[name][0](img, *args)
+    with io.BytesIO() as image_binary:
+        img.save(image_binary, 'PNG')
+        return image_binary.getvalue()
@@ -1,7 +1,38 @@
+import asyncio
 import discord
+from collections import defaultdict
 from redbot.core import commands, Config
 from redbot.core.bot import Red
-from datetime import datetime, timedelta
+from redbot.core.data_manager import cog_data_path
+from datetime import datetime, timedelta, timezone
+
+from .store import PresenceStore
+
+FIELDS_PER_PAGE = 20
+
+
+class LazyPages(discord.ui.View):
+    """Previous/next pager that only builds the embed of the page being shown."""
+
+    def __init__(self, author_id, page_count, build_page, timeout=120):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.page_count = page_count
+        self.build_page = build_page
+        self.page = 0
+
+    async def interaction_check(self, interaction: discord.Interaction):
+        return interaction.user.id == self.author_id
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = (self.page - 1) % self.page_count
+        await interaction.response.edit_message(embed=self.build_page(self.page), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = (self.page + 1) % self.page_count
+        await interaction.response.edit_message(embed=self.build_page(self.page), view=self)
 
 class PresenceFetcher(commands.Cog):
     """Cog to fetch and track user presence information."""
@@ -13,6 +44,65 @@ class PresenceFetcher(commands.Cog):
             "presence_changes": {}
         }
         self.config.register_guild(**default_guild)
+        self.store = PresenceStore(cog_data_path(self) / "presence.sqlite3")
+        # Maintained from gateway events so lookups never scan every guild or member.
+        self.member_guilds = defaultdict(set)  # user id -> ids of the guilds the bot shares with them
+        self.presence_snapshots = {}  # user id -> (status text, custom status or None)
+
+    async def cog_load(self):
+        await self.store.open()
+        await self.migrate_config_history()
+        self.bot.loop.create_task(self.build_presence_index())
+
+    async def build_presence_index(self):
+        await self.bot.wait_until_ready()
+        for guild in self.bot.guilds:
+            self.index_guild(guild)
+            # Yield between guilds so building the index never blocks the event loop for long.
+            await asyncio.sleep(0)
+
+    def index_guild(self, guild):
+        for member in guild.members:
+            self.index_member(member)
+
+    def index_member(self, member):
+        self.member_guilds[member.id].add(member.guild.id)
+        custom_status = next((activity for activity in member.activities if isinstance(activity, discord.CustomActivity)), None)
+        self.presence_snapshots[member.id] = (self.get_status_type(member.status), custom_status.name if custom_status else None)
+
+    def unindex_member(self, user_id, guild_id):
+        guild_ids = self.member_guilds.get(user_id)
+        if guild_ids is None:
+            return
+        guild_ids.discard(guild_id)
+        if not guild_ids:
+            del self.member_guilds[user_id]
+            self.presence_snapshots.pop(user_id, None)
+
+    def page_count(self, count):
+        return max(1, -(-count // FIELDS_PER_PAGE))
+
+    async def send_pages(self, ctx, count, build_page):
+        page_count = self.page_count(count)
+        if page_count == 1:
+            await ctx.send(embed=build_page(0))
+        else:
+            await ctx.send(embed=build_page(0), view=LazyPages(ctx.author.id, page_count, build_page))
+
+    async def cog_unload(self):
+        await self.store.close()
+
+    async def migrate_config_history(self):
+        """Move history recorded in the old per-guild Config blob into the store."""
+        for guild_id, data in (await self.config.all_guilds()).items():
+            if not data["presence_changes"]:
+                continue
+            for member_id, changes in data["presence_changes"].items():
+                for change in changes:
+                    timestamp = datetime.fromisoformat(change["timestamp"]).replace(tzinfo=timezone.utc).timestamp()
+                    self.store.append(guild_id, int(member_id), change["status"], change.get("custom_status", "No custom status"), timestamp)
+            await self.store.flush()
+            await self.config.guild_from_id(guild_id).presence_changes.clear()
 
     @commands.group(invoke_without_command=True)
     async def fetch(self, ctx):
@@ -22,31 +112,29 @@ class PresenceFetcher(commands.Cog):
     @fetch.command()
     async def shared(self, ctx, user: discord.User):
         """Fetch and display the user's status across servers shared with the bot."""
-        shared_guilds = [guild for guild in self.bot.guilds if guild.get_member(user.id)]
-        embed = discord.Embed(
-            title=f"Status of {user.display_name} across shared servers",
-            color=discord.Color.blue()
-        )
-
-        if shared_guilds:
-            for guild in shared_guilds:
-                member = guild.get_member(user.id)
-                status_type = self.get_status_type(member.status)
-                custom_status = next((activity for activity in member.activities if isinstance(activity, discord.CustomActivity)), None)
-                status_text = status_type
-                if custom_status:
-                    status_text += f"\nCustom Status: {custom_status.name}"
+        shared_guilds = [guild for guild in map(self.bot.get_guild, self.member_guilds.get(user.id, ())) if guild]
+        status_text = self.format_snapshot(user.id)
+
+        def build_page(page):
+            embed = discord.Embed(
+                title=f"Status of {user.display_name} across shared servers",
+                color=discord.Color.blue()
+            )
+            if not shared_guilds:
+                embed.description = "No shared servers found."
+            for guild in shared_guilds[page * FIELDS_PER_PAGE:(page + 1) * FIELDS_PER_PAGE]:
                 embed.add_field(name=guild.name, value=status_text, inline=False)
-        else:
-            embed.description = "No shared servers found."
+            if len(shared_guilds) > FIELDS_PER_PAGE:
+                embed.set_footer(text=f"Page {page + 1}/{self.page_count(len(shared_guilds))}")
+            return embed
 
-        await ctx.send(embed=embed)
+        await self.send_pages(ctx, len(shared_guilds), build_page)
 
     @fetch.command()
-    async def past(self, ctx, user: discord.User):
-        """Fetch and display the user's past statuses."""
-        presence_changes = await self.config.guild(ctx.guild).presence_changes()
-        changes = presence_changes.get(str(user.id), [])
+    async def past(self, ctx, user: discord.User, days: int = 100):
+        """Fetch and display the user's past statuses from the last `days` days."""
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
+        changes = await self.store.history(ctx.guild.id, user.id, since=since)
 
         embed = discord.Embed(
             title=f"Past Statuses of {user.display_name}",
@@ -54,10 +142,8 @@ class PresenceFetcher(commands.Cog):
         )
 
         if changes:
-            for change in changes:
-                timestamp = datetime.fromisoformat(change["timestamp"])
-                status = change["status"]
-                custom_status = change.get("custom_status", "No custom status")
+            for timestamp, status, custom_status in changes:
+                timestamp = datetime.fromtimestamp(timestamp, timezone.utc)
                 embed.add_field(name=timestamp.strftime("%Y-%m-%d %H:%M:%S"), value=f"Status: {status}\nCustom Status: {custom_status}", inline=False)
         else:
             embed.description = "No past statuses recorded."
@@ -68,20 +154,25 @@ class PresenceFetcher(commands.Cog):
     async def allusers(self, ctx):
         """Fetch and display the statuses of all users in the server."""
         members = ctx.guild.members
-        embed = discord.Embed(
-            title=f"Statuses of All Users in {ctx.guild.name}",
-            color=discord.Color.green()
-        )
 
-        for member in members:
-            status_type = self.get_status_type(member.status)
-            custom_status = next((activity for activity in member.activities if isinstance(activity, discord.CustomActivity)), None)
-            status_text = status_type
-            if custom_status:
-                status_text += f"\nCustom Status: {custom_status.name}"
-            embed.add_field(name=member.display_name, value=status_text, inline=True)
-
-        await ctx.send(embed=embed)
+        def build_page(page):
+            embed = discord.Embed(
+                title=f"Statuses of All Users in {ctx.guild.name}",
+                color=discord.Color.green()
+            )
+            for member in members[page * FIELDS_PER_PAGE:(page + 1) * FIELDS_PER_PAGE]:
+                embed.add_field(name=member.display_name, value=self.format_snapshot(member.id), inline=True)
+            embed.set_footer(text=f"Page {page + 1}/{self.page_count(len(members))}")
+            return embed
+
+        await self.send_pages(ctx, len(members), build_page)
+
+    def format_snapshot(self, user_id):
+        status_type, custom_status = self.presence_snapshots.get(user_id, ("Offline", None))
+        status_text = status_type
+        if custom_status:
+            status_text += f"\nCustom Status: {custom_status}"
+        return status_text
 
     def get_status_type(self, status):
         """Helper method to get the status type as a string."""
@@ -101,17 +192,32 @@ class PresenceFetcher(commands.Cog):
         if before.status != after.status or before.activities != after.activities:
             guild = after.guild
             if guild:
-                async with self.config.guild(guild).presence_changes() as presence_changes:
-                    changes = presence_changes.get(str(after.id), [])
-                    custom_status = next((activity for activity in after.activities if isinstance(activity, discord.CustomActivity)), None)
-                    changes.append({
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "status": self.get_status_type(after.status),
-                        "custom_status": custom_status.name if custom_status else "No custom status"
-                    })
-                    # Keep only the changes from the last 100 days
-                    changes = [change for change in changes if datetime.fromisoformat(change["timestamp"]) > datetime.utcnow() - timedelta(days=100)]
-                    presence_changes[str(after.id)] = changes
+                self.index_member(after)
+                custom_status = next((activity for activity in after.activities if isinstance(activity, discord.CustomActivity)), None)
+                # Buffered and written in batches; changes older than 100 days are compacted away in the background.
+                self.store.append(
+                    guild.id,
+                    after.id,
+                    self.get_status_type(after.status),
+                    custom_status.name if custom_status else "No custom status"
+                )
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.unindex_member(member.id, member.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self.index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        for member in guild.members:
+            self.unindex_member(member.id, guild.id)
 
 def setup(bot: Red):
     bot.add_cog(PresenceFetcher(bot))
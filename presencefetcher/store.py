@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import pathlib
+import time
+from typing import List, Optional, Tuple
+
+import aiosqlite
+
+log = logging.getLogger("red.presencefetcher.store")
+
+
+class PresenceStore:
+    """Append-only presence history kept in SQLite.
+
+    Changes are buffered in memory and inserted in batches every ``flush_interval``
+    seconds. Rows are indexed by ``(guild_id, member_id, timestamp)`` so history
+    lookups are range scans, and rows older than ``retention_days`` are deleted by a
+    periodic compaction instead of on every write.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        retention_days: int = 100,
+        flush_interval: float = 5.0,
+        compact_interval: float = 3600.0,
+    ):
+        self.path = path
+        self.retention_days = retention_days
+        self.flush_interval = flush_interval
+        self.compact_interval = compact_interval
+        self._db: Optional[aiosqlite.Connection] = None
+        self._pending: List[Tuple[int, int, float, str, str]] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def open(self):
+        self._db = await aiosqlite.connect(self.path)
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute(
+            "CREATE TABLE IF NOT EXISTS presence ("
+            "guild_id INTEGER NOT NULL, member_id INTEGER NOT NULL, timestamp REAL NOT NULL, "
+            "status TEXT NOT NULL, custom_status TEXT NOT NULL)"
+        )
+        await self._db.execute("CREATE INDEX IF NOT EXISTS ix_presence_member ON presence (guild_id, member_id, timestamp)")
+        await self._db.execute("CREATE INDEX IF NOT EXISTS ix_presence_timestamp ON presence (timestamp)")
+        await self._db.commit()
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._db is not None:
+            await self.flush()
+            await self._db.close()
+            self._db = None
+
+    def append(self, guild_id: int, member_id: int, status: str, custom_status: str, timestamp: Optional[float] = None):
+        self._pending.append((guild_id, member_id, timestamp if timestamp is not None else time.time(), status, custom_status))
+
+    async def flush(self):
+        async with self._lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            try:
+                await self._db.executemany(
+                    "INSERT INTO presence (guild_id, member_id, timestamp, status, custom_status) VALUES (?, ?, ?, ?, ?)", rows
+                )
+                await self._db.commit()
+            except Exception:
+                # Keep the batch for the next attempt.
+                self._pending[:0] = rows
+                raise
+
+    async def compact(self):
+        cutoff = time.time() - self.retention_days * 86400
+        async with self._lock:
+            await self._db.execute("DELETE FROM presence WHERE timestamp < ?", (cutoff,))
+            await self._db.commit()
+
+    async def history(
+        self, guild_id: int, member_id: int, since: Optional[float] = None, limit: int = 25
+    ) -> List[Tuple[float, str, str]]:
+        """Return the latest ``limit`` changes since ``since``, oldest first, as ``(timestamp, status, custom_status)``."""
+        await self.flush()
+        if since is None:
+            since = time.time() - self.retention_days * 86400
+        async with self._db.execute(
+            "SELECT timestamp, status, custom_status FROM presence "
+            "WHERE guild_id = ? AND member_id = ? AND timestamp >= ? ORDER BY timestamp DESC LIMIT ?",
+            (guild_id, member_id, since, limit),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return rows[::-1]
+
+    async def _run(self):
+        last_compaction = 0.0
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+                if time.monotonic() - last_compaction >= self.compact_interval:
+                    await self.compact()
+                    last_compaction = time.monotonic()
+            except Exception:
+                log.exception("Error while writing presence history.")
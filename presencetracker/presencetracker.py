@@ -1,7 +1,17 @@
+import asyncio
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
 
+class MemberDigest:
+    """Net presence changes of one member during a digest window."""
+
+    def __init__(self, status):
+        self.status_before = status
+        self.status_after = status
+        self.status_changes = 0
+        self.activities = {}  # activity type -> [activity at window start, latest activity]
+
 class PresenceTracker(commands.Cog):
     """Cog to track user presence updates with detailed activity logging and management."""
 
@@ -11,9 +21,36 @@ class PresenceTracker(commands.Cog):
         default_guild = {
             "log_channel": None,
             "tracked_games": [],
-            "ignored_users": []
+            "ignored_users": [],
+            "digest_window": 0
         }
         self.config.register_guild(**default_guild)
+        # In-memory copy of each guild's settings, refreshed whenever a command changes them.
+        self.guild_settings = {}
+        self.digests = {}  # guild_id -> {member_id: MemberDigest}
+        self.digest_tasks = {}  # guild_id -> task posting the guild's digest at the end of the window
+
+    async def cog_load(self):
+        for guild_id, data in (await self.config.all_guilds()).items():
+            self.guild_settings[guild_id] = self.build_settings(data)
+
+    async def cog_unload(self):
+        for guild_id, task in list(self.digest_tasks.items()):
+            task.cancel()
+            await self.flush_digest(guild_id)
+
+    @staticmethod
+    def build_settings(data):
+        return {
+            "log_channel": data["log_channel"],
+            # Sets make the per-event ignore and tracked game checks O(1).
+            "ignored_users": set(data["ignored_users"]),
+            "tracked_games": {game.casefold() for game in data["tracked_games"]},
+            "digest_window": data["digest_window"]
+        }
+
+    async def refresh_settings(self, guild: discord.Guild):
+        self.guild_settings[guild.id] = self.build_settings(await self.config.guild(guild).all())
 
     @commands.group(aliases=["pt"])
     async def presence(self, ctx: commands.Context):
@@ -25,6 +62,7 @@ class PresenceTracker(commands.Cog):
     async def setlogchannel(self, ctx: commands.Context, channel: discord.TextChannel):
         """Set the channel where presence updates will be logged."""
         await self.config.guild(ctx.guild).log_channel.set(channel.id)
+        await self.refresh_settings(ctx.guild)
         await ctx.send(f"Log channel set to {channel.mention}")
 
     @presence.command()
@@ -37,6 +75,7 @@ class PresenceTracker(commands.Cog):
                 await ctx.send(f"Game '{game_name}' added to the tracking list.")
             else:
                 await ctx.send(f"Game '{game_name}' is already being tracked.")
+        await self.refresh_settings(ctx.guild)
 
     @presence.command()
     @commands.has_permissions(manage_guild=True)
@@ -48,6 +87,7 @@ class PresenceTracker(commands.Cog):
                 await ctx.send(f"Game '{game_name}' removed from the tracking list.")
             else:
                 await ctx.send(f"Game '{game_name}' is not being tracked.")
+        await self.refresh_settings(ctx.guild)
 
     @presence.command()
     async def ignore(self, ctx: commands.Context):
@@ -59,6 +99,21 @@ class PresenceTracker(commands.Cog):
             else:
                 ignored_users.append(ctx.author.id)
                 await ctx.send("You have been added to the tracking ignore list.")
+        await self.refresh_settings(ctx.guild)
+
+    @presence.command()
+    @commands.has_permissions(manage_guild=True)
+    async def digest(self, ctx: commands.Context, seconds: int):
+        """Post presence changes as one digest every `seconds` seconds. Use 0 to log every change as it happens."""
+        if seconds < 0 or seconds > 3600:
+            await ctx.send("The digest window must be between 0 and 3600 seconds.")
+            return
+        await self.config.guild(ctx.guild).digest_window.set(seconds)
+        await self.refresh_settings(ctx.guild)
+        if seconds:
+            await ctx.send(f"Presence changes will be posted as a digest every {seconds} seconds.")
+        else:
+            await ctx.send("Presence changes will be posted as they happen.")
 
     @presence.command()
     async def mystatus(self, ctx: commands.Context):
@@ -103,18 +158,24 @@ class PresenceTracker(commands.Cog):
         embed.set_footer(text=f"User ID: {member.id}")
         await ctx.send(embed=embed)
 
+    def is_tracked(self, activity, settings):
+        return not settings["tracked_games"] or str(activity.name).casefold() in settings["tracked_games"]
+
     @commands.Cog.listener()
     async def on_presence_update(self, before: discord.Member, after: discord.Member):
-        log_channel_id = await self.config.guild(after.guild).log_channel()
-        if not log_channel_id:
+        settings = self.guild_settings.get(after.guild.id)
+        if not settings or not settings["log_channel"]:
             return
 
-        log_channel = after.guild.get_channel(log_channel_id)
+        log_channel = after.guild.get_channel(settings["log_channel"])
         if not log_channel:
             return
 
-        ignored_users = await self.config.guild(after.guild).ignored_users()
-        if after.id in ignored_users:
+        if after.id in settings["ignored_users"]:
+            return
+
+        if settings["digest_window"]:
+            self.record_digest(before, after, settings)
             return
 
         if before.status != after.status:
@@ -129,11 +190,11 @@ class PresenceTracker(commands.Cog):
             await log_channel.send(embed=embed)
 
         if before.activities != after.activities:
-            await self.log_activity_update(before, after, log_channel)
+            await self.log_activity_update(before, after, log_channel, settings)
 
-    async def log_activity_update(self, before: discord.Member, after: discord.Member, log_channel: discord.TextChannel):
-        before_activities = {type(activity): activity for activity in before.activities}
-        after_activities = {type(activity): activity for activity in after.activities}
+    async def log_activity_update(self, before: discord.Member, after: discord.Member, log_channel: discord.TextChannel, settings):
+        before_activities = {type(activity): activity for activity in before.activities if self.is_tracked(activity, settings)}
+        after_activities = {type(activity): activity for activity in after.activities if self.is_tracked(activity, settings)}
 
         for activity_type, activity in before_activities.items():
             if activity_type not in after_activities:
@@ -145,6 +206,92 @@ class PresenceTracker(commands.Cog):
             elif activity != before_activities[activity_type]:
                 await self.send_activity_log(after, activity, "updated", log_channel)
 
+    def record_digest(self, before: discord.Member, after: discord.Member, settings):
+        guild_digest = self.digests.setdefault(after.guild.id, {})
+        entry = guild_digest.get(after.id)
+        if entry is None:
+            entry = guild_digest[after.id] = MemberDigest(before.status)
+        if before.status != after.status:
+            entry.status_after = after.status
+            entry.status_changes += 1
+        if before.activities != after.activities:
+            before_activities = {type(activity): activity for activity in before.activities if self.is_tracked(activity, settings)}
+            after_activities = {type(activity): activity for activity in after.activities if self.is_tracked(activity, settings)}
+            for activity_type in before_activities.keys() | after_activities.keys():
+                state = entry.activities.setdefault(activity_type, [before_activities.get(activity_type), None])
+                state[1] = after_activities.get(activity_type)
+        if after.guild.id not in self.digest_tasks:
+            self.digest_tasks[after.guild.id] = asyncio.create_task(self.post_digest_later(after.guild.id, settings["digest_window"]))
+
+    async def post_digest_later(self, guild_id: int, window: int):
+        await asyncio.sleep(window)
+        await self.flush_digest(guild_id)
+
+    async def flush_digest(self, guild_id: int):
+        """Post one digest of the net changes collected for the guild since the window opened."""
+        self.digest_tasks.pop(guild_id, None)
+        entries = self.digests.pop(guild_id, {})
+        guild = self.bot.get_guild(guild_id)
+        settings = self.guild_settings.get(guild_id)
+        if not entries or not guild or not settings or not settings["log_channel"]:
+            return
+        log_channel = guild.get_channel(settings["log_channel"])
+        if not log_channel:
+            return
+
+        fields = []
+        for member_id, entry in entries.items():
+            lines = []
+            # Flapping collapses into the net change: a member who ends where they started is not reported.
+            if entry.status_before != entry.status_after:
+                line = f"Status: {str(entry.status_before).capitalize()} → {str(entry.status_after).capitalize()}"
+                if entry.status_changes > 1:
+                    line += f" ({entry.status_changes} changes)"
+                lines.append(line)
+            for first, last in entry.activities.values():
+                if first is None and last is not None:
+                    lines.append(f"Started {self.describe_activity(last)}")
+                elif first is not None and last is None:
+                    lines.append(f"Stopped {self.describe_activity(first)}")
+                elif first is not None and first != last:
+                    lines.append(f"Updated {self.describe_activity(last)}")
+            if lines:
+                member = guild.get_member(member_id)
+                name = member.display_name if member else str(member_id)
+                fields.append((f"{name} ({member_id})", "\n".join(lines)[:1024]))
+
+        # Discord allows 25 fields per embed, and 10 embeds with 6000 characters in total per message.
+        messages = [[]]
+        message_size = 0
+        embed = None
+        for name, value in fields:
+            field_size = len(name) + len(value)
+            if embed is None or len(embed.fields) == 25 or message_size + field_size > 5900:
+                if message_size + field_size > 5900 or len(messages[-1]) == 10:
+                    messages.append([])
+                    message_size = 0
+                embed = discord.Embed(title="Presence Digest", color=discord.Color.blue())
+                messages[-1].append(embed)
+                message_size += len(embed.title)
+            embed.add_field(name=name, value=value, inline=False)
+            message_size += field_size
+        for embeds in messages:
+            if not embeds:
+                continue
+            try:
+                await log_channel.send(embeds=embeds)
+            except discord.HTTPException:
+                return
+
+    def describe_activity(self, activity):
+        if isinstance(activity, discord.Game):
+            return f"Playing: {activity.name}"
+        elif isinstance(activity, discord.Streaming):
+            return f"Streaming: {activity.name}"
+        elif isinstance(activity, discord.Spotify):
+            return f"Listening to: {activity.title} by {', '.join(activity.artists)}"
+        return f"{type(activity).__name__}: {activity.name}"
+
     async def send_activity_log(self, member: discord.Member, activity: discord.Activity, action: str, log_channel: discord.TextChannel):
         activity_type = type(activity).__name__
         embed = discord.Embed(
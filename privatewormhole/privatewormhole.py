@@ -1,8 +1,23 @@
 
+import asyncio
+import collections
 import discord
-import os
+import io
+import logging
+import re
+import time
 from redbot.core import commands, Config
 
+log = logging.getLogger("red.privatewormhole")
+
+# How many relayed messages are remembered for edits and deletes, and for how long.
+RELAY_MAP_SIZE = 5000
+RELAY_MAP_TTL = 24 * 60 * 60
+# Discord accepts at most 10 files per message; further attachments are relayed as links.
+MAX_RELAYED_FILES = 10
+# Room kept for attachment links at the end of a relayed message.
+MAX_LINKS_LENGTH = 1000
+
 class PrivateWormHole(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -12,6 +27,30 @@ class PrivateWormHole(commands.Cog):
             global_blacklist=[],
             word_filters=[]
         )  # Initialize the configuration
+        # In-memory copies of the configuration, rebuilt by the commands that change it.
+        self.channel_routes = {}  # channel id -> ids of the channels it relays to
+        self.global_blacklist = set()
+        self.word_filter = None  # compiled pattern matching any filtered word, or None
+        # origin message id -> (expires at, rendered prefix, [(channel id, relayed message id, attachment links), ...]), oldest first
+        self.relayed = collections.OrderedDict()
+
+    async def cog_load(self):
+        await self.refresh_routes()
+        await self.refresh_filters()
+
+    async def refresh_routes(self):
+        routes = {}
+        for wormhole_data in (await self.config.private_wormholes()).values():
+            channels = wormhole_data["channels"]
+            for channel_id in channels:
+                destinations = routes.setdefault(channel_id, [])
+                destinations.extend(other_id for other_id in channels if other_id != channel_id and other_id not in destinations)
+        self.channel_routes = routes
+
+    async def refresh_filters(self):
+        self.global_blacklist = set(await self.config.global_blacklist())
+        word_filters = await self.config.word_filters()
+        self.word_filter = re.compile("|".join(map(re.escape, word_filters))) if word_filters else None
 
     async def send_status_message(self, message, channel, wormhole_key):
         wormhole_data = await self.config.private_wormholes.get_raw(wormhole_key, default={})
@@ -35,6 +74,7 @@ class PrivateWormHole(commands.Cog):
         if name not in private_wormholes:
             private_wormholes[name] = {"password": password, "channels": [ctx.channel.id]}
             await self.config.private_wormholes.set(private_wormholes)
+            await self.refresh_routes()
             await ctx.send(f"Private wormhole `{name}` created with the provided password.")
         else:
             await ctx.send("A private wormhole with this name already exists.")
@@ -48,6 +88,7 @@ class PrivateWormHole(commands.Cog):
                 if ctx.channel.id not in private_wormholes[name]["channels"]:
                     private_wormholes[name]["channels"].append(ctx.channel.id)
                     await self.config.private_wormholes.set(private_wormholes)
+                    await self.refresh_routes()
                     await ctx.send(f"This channel has joined the private wormhole `{name}`.")
                     await self.send_status_message(f"A faint signal was picked up from {ctx.channel.mention}, connection has been established.", ctx.channel, name)
                 else:
@@ -66,12 +107,17 @@ class PrivateWormHole(commands.Cog):
             if not private_wormholes[name]["channels"]:
                 del private_wormholes[name]
             await self.config.private_wormholes.set(private_wormholes)
+            await self.refresh_routes()
             await ctx.send(f"This channel has left the private wormhole `{name}`.")
         else:
             await ctx.send("This channel is not part of the private wormhole with this name.")
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
+        # Most messages are not in a wormhole; reject them before doing any other work.
+        destinations = self.channel_routes.get(message.channel.id)
+        if not destinations:
+            return
         if not message.guild:  # Don't allow in DMs
             return
         if message.author.bot or not message.channel.permissions_for(message.guild.me).send_messages:
@@ -79,67 +125,169 @@ class PrivateWormHole(commands.Cog):
         if isinstance(message.channel, discord.TextChannel) and message.content.startswith(commands.when_mentioned(self.bot, message)[0]):
             return  # Ignore bot commands
 
+        if message.author.id in self.global_blacklist:
+            return  # Author is globally blacklisted
+
         # Check if the message is a bot command
         ctx = await self.bot.get_context(message)
         if ctx.valid:
             return  # Ignore bot commands
 
-        global_blacklist = await self.config.global_blacklist()
-        word_filters = await self.config.word_filters()
-        private_wormholes = await self.config.private_wormholes()
+        if self.word_filter is not None and self.word_filter.search(message.content):
+            await message.channel.send("That word is not allowed.")
+            await message.delete()
+            return  # Message contains a filtered word, notify user and delete it
 
-        if message.author.id in global_blacklist:
-            return  # Author is globally blacklisted
+        if message.channel.is_nsfw():
+            await message.channel.send("NSFW content is not allowed in the wormhole.")
+            await message.delete()
+            return  # Delete NSFW messages
 
-        # Check if the message is in a private wormhole channel
-        for name, wormhole_data in private_wormholes.items():
-            channels = wormhole_data["channels"]
-            if message.channel.id in channels:
-                if any(word in message.content for word in word_filters):
-                    await message.channel.send("That word is not allowed.")
-                    await message.delete()
-                    return  # Message contains a filtered word, notify user and delete it
-
-                if message.channel.is_nsfw():
-                    await message.channel.send("NSFW content is not allowed in the wormhole.")
-                    await message.delete()
-                    return  # Delete NSFW messages
-
-                display_name = message.author.display_name if message.author.display_name else message.author.name
-
-                for channel_id in channels:
-                    if channel_id != message.channel.id:
-                        channel = self.bot.get_channel(channel_id)
-                        if channel:
-                            if message.attachments:
-                                for attachment in message.attachments:
-                                    await channel.send(f"**{message.guild.name} - {display_name}:** {message.content}")
-                                    await attachment.save(f"temp_{attachment.filename}")
-                                    with open(f"temp_{attachment.filename}", "rb") as file:
-                                        await channel.send(file=discord.File(file))
-                                    os.remove(f"temp_{attachment.filename}")
-                            else:
-                                await channel.send(f"**{message.guild.name} - {display_name}:** {message.content}")
+        display_name = message.author.display_name if message.author.display_name else message.author.name
+        prefix = f"**{message.guild.name} - {display_name}:** "
+        await self.relay_message(message, prefix, destinations)
+
+    async def relay_message(self, message: discord.Message, prefix: str, destinations):
+        """Send the message to every destination at once and remember where each copy went.
+
+        Attachments that cannot be uploaded are relayed as links instead.
+        """
+
+        async def download(attachment):
+            try:
+                return await attachment.read()
+            except discord.HTTPException as e:
+                log.warning("Failed to download attachment %s of message %s: %s", attachment.id, message.id, e)
+                return None
+
+        # Each attachment is downloaded once and kept in memory for all destinations.
+        uploads = message.attachments[:MAX_RELAYED_FILES]
+        downloads = await asyncio.gather(*(download(attachment) for attachment in uploads))
+        files = [(attachment.filename, data) for attachment, data in zip(uploads, downloads) if data is not None]
+        links = self.attachment_links(
+            [attachment for attachment, data in zip(uploads, downloads) if data is None] + message.attachments[MAX_RELAYED_FILES:]
+        )
+
+        async def relay_to(channel_id):
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                return None
+            copy_links = links
+            try:
+                try:
+                    relayed = await channel.send(
+                        self.render_relay(prefix, message.content, copy_links),
+                        files=[discord.File(io.BytesIO(data), filename=filename) for filename, data in files],
+                    )
+                except discord.HTTPException as e:
+                    if e.status != 413 or not files:
+                        raise
+                    # The files are over the destination's upload limit, link every attachment instead.
+                    copy_links = self.attachment_links(message.attachments)
+                    relayed = await channel.send(self.render_relay(prefix, message.content, copy_links))
+            except discord.HTTPException as e:
+                log.warning("Failed to relay message %s to channel %s: %s", message.id, channel_id, e)
+                return None
+            return channel_id, relayed.id, copy_links
+
+        results = await asyncio.gather(*(relay_to(channel_id) for channel_id in destinations))
+        self.remember_relay(message.id, prefix, [result for result in results if result])
+
+    @staticmethod
+    def attachment_links(attachments) -> str:
+        """Return the URLs of ``attachments``, one per line, keeping as many as fit in ``MAX_LINKS_LENGTH``."""
+        links = []
+        length = 0
+        for attachment in attachments:
+            length += len(attachment.url) + 1
+            if length > MAX_LINKS_LENGTH:
+                break
+            links.append(attachment.url)
+        return "\n".join(links)
+
+    @staticmethod
+    def render_relay(prefix: str, content: str, links: str = "") -> str:
+        """Build the text of a relayed copy, shortening the content so the attachment links are kept."""
+        text = f"{prefix}{content}"
+        if not links:
+            return text[:2000]
+        return f"{text[:2000 - len(links) - 1]}\n{links}"
+
+    def remember_relay(self, message_id: int, prefix: str, copies):
+        now = time.monotonic()
+        self.relayed[message_id] = (now + RELAY_MAP_TTL, prefix, copies)
+        while self.relayed:
+            oldest_id, (expires_at, _, _) = next(iter(self.relayed.items()))
+            if len(self.relayed) <= RELAY_MAP_SIZE and expires_at > now:
+                break
+            del self.relayed[oldest_id]
+
+    def lookup_relay(self, message_id: int, pop: bool = False):
+        entry = self.relayed.pop(message_id, None) if pop else self.relayed.get(message_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry
 
     @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message):
-        if not message.guild:
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        entry = self.lookup_relay(payload.message_id)
+        content = payload.data.get("content")
+        if entry is None or content is None:
+            return
+        # Apply the same checks as ``on_message``; an edit that would not have been relayed takes the copies down.
+        author_id = int(payload.data.get("author", {}).get("id", 0))
+        if author_id in self.global_blacklist:
+            await self.delete_relayed(payload.message_id)
             return
+        if self.word_filter is not None and self.word_filter.search(content):
+            await self.delete_relayed(payload.message_id)
+            channel = self.bot.get_channel(payload.channel_id)
+            if channel:
+                try:
+                    await channel.send("That word is not allowed.")
+                    await channel.get_partial_message(payload.message_id).delete()
+                except discord.HTTPException:
+                    pass
+            return
+        _, prefix, copies = entry
+        await asyncio.gather(
+            *(
+                self.edit_relayed(channel_id, message_id, self.render_relay(prefix, content, links))
+                for channel_id, message_id, links in copies
+            )
+        )
 
-        private_wormholes = await self.config.private_wormholes()
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        await self.delete_relayed(payload.message_id)
 
-        # Check if the message is in a private wormhole channel
-        for name, wormhole_data in private_wormholes.items():
-            channels = wormhole_data["channels"]
-            if message.channel.id in channels:
-                for channel_id in channels:
-                    if channel_id != message.channel.id:
-                        channel = self.bot.get_channel(channel_id)
-                        if channel:
-                            async for msg in channel.history(limit=100):
-                                if msg.content == f"**{message.guild.name} - {message.author.display_name}:** {message.content}":
-                                    await msg.delete()
-                                    break
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        await asyncio.gather(*(self.delete_relayed(message_id) for message_id in payload.message_ids))
+
+    async def edit_relayed(self, channel_id: int, message_id: int, content: str):
+        channel = self.bot.get_channel(channel_id)
+        if channel:
+            try:
+                await channel.get_partial_message(message_id).edit(content=content)
+            except discord.HTTPException:
+                pass
+
+    async def delete_relayed(self, origin_id: int):
+        entry = self.lookup_relay(origin_id, pop=True)
+        if entry is None:
+            return
+        _, _, copies = entry
+
+        async def delete(channel_id, message_id):
+            channel = self.bot.get_channel(channel_id)
+            if channel:
+                try:
+                    await channel.get_partial_message(message_id).delete()
+                except discord.HTTPException:
+                    pass
+
+        await asyncio.gather(*(delete(channel_id, message_id) for channel_id, message_id, _ in copies))
 
     @privatewormhole.command(name="globalblacklist")
     async def privatewormhole_globalblacklist(self, ctx, user: discord.User):
@@ -149,6 +297,7 @@ class PrivateWormHole(commands.Cog):
             if user.id not in global_blacklist:
                 global_blacklist.append(user.id)
                 await self.config.global_blacklist.set(global_blacklist)
+                await self.refresh_filters()
                 await ctx.send(f"{user.display_name} has been added to the global private wormhole blacklist.")
             else:
                 await ctx.send(f"{user.display_name} is already in the global private wormhole blacklist.")
@@ -163,6 +312,7 @@ class PrivateWormHole(commands.Cog):
             if user.id in global_blacklist:
                 global_blacklist.remove(user.id)
                 await self.config.global_blacklist.set(global_blacklist)
+                await self.refresh_filters()
                 await ctx.send(f"{user.display_name} has been removed from the global private wormhole blacklist.")
             else:
                 await ctx.send(f"{user.display_name} is not in the global private wormhole blacklist.")
@@ -177,6 +327,7 @@ class PrivateWormHole(commands.Cog):
             if word not in word_filters:
                 word_filters.append(word)
                 await self.config.word_filters.set(word_filters)
+                await self.refresh_filters()
                 await ctx.send(f"`{word}` has been added to the private wormhole word filter.")
             else:
                 await ctx.send(f"`{word}` is already in the private wormhole word filter.")
@@ -189,6 +340,7 @@ class PrivateWormHole(commands.Cog):
             if word in word_filters:
                 word_filters.remove(word)
                 await self.config.word_filters.set(word_filters)
+                await self.refresh_filters()
                 await ctx.send(f"`{word}` has been removed from the private wormhole word filter.")
             else:
                 await ctx.send(f"`{word}` is not in the private wormhole word filter.")
@@ -0,0 +1,263 @@
+import asyncio
+import concurrent.futures
+import email
+import imaplib
+import logging
+import smtplib
+import time
+import typing
+from email.message import Message
+
+log = logging.getLogger("red.relay.mail")
+
+
+class SMTPOutbox:
+    """Queued email sender that keeps one SMTP session open between messages.
+
+    smtplib is blocking, so the session lives on a dedicated worker thread and the event
+    loop only awaits the queued sends. Temporary failures reconnect and retry with
+    exponential backoff; permanent (5xx) rejections fail the message immediately.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        starttls: bool = True,
+        max_retries: int = 3,
+        idle_timeout: float = 60.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.max_retries = max_retries
+        self.idle_timeout = idle_timeout
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="relay-smtp")
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._smtp: typing.Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._task: typing.Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("The outbox was closed before the email was sent."))
+        await self._call(self._close)
+        self._executor.shutdown(wait=False)
+
+    def send(self, message: Message) -> asyncio.Future:
+        """Queue ``message`` and return a future resolved once it has been sent."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, future))
+        return future
+
+    async def _run(self):
+        while True:
+            message, future = await self._queue.get()
+            if future.done():
+                continue
+            try:
+                await self._deliver(message)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    async def _deliver(self, message: Message):
+        for attempt in range(self.max_retries):
+            try:
+                await self._call(self._send, message)
+                return
+            except smtplib.SMTPResponseException as e:
+                if e.smtp_code >= 500:
+                    raise
+                error = e
+            except (smtplib.SMTPException, OSError) as e:
+                error = e
+            await self._call(self._close)
+            if attempt + 1 == self.max_retries:
+                raise error
+            delay = 2 ** attempt
+            log.warning("Sending email failed (%r), attempt %s/%s, retrying in %ss.", error, attempt + 1, self.max_retries, delay)
+            await asyncio.sleep(delay)
+
+    def _call(self, func, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _send(self, message: Message):
+        smtp = self._connect()
+        smtp.send_message(message)
+        self._last_used = time.monotonic()
+
+    def _connect(self) -> smtplib.SMTP:
+        if self._smtp is not None:
+            if time.monotonic() - self._last_used < self.idle_timeout:
+                return self._smtp
+            # The server may have dropped an idle session, check before reusing it.
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close()
+        smtp = smtplib.SMTP(self.host, self.port, timeout=30)
+        if self.starttls:
+            smtp.starttls()
+        if self.username:
+            smtp.login(self.username, self.password)
+        self._smtp = smtp
+        self._last_used = time.monotonic()
+        return smtp
+
+    def _close(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+
+
+class IMAPPoller:
+    """Watches a mailbox over one reused IMAP session.
+
+    Each poll only asks for UIDs above the highest one already seen and fetches the new
+    messages in batched ``UID FETCH`` commands, handing each to ``on_message``. Messages
+    already in the mailbox when polling starts are not reported.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        on_message: typing.Callable[[Message], typing.Awaitable[None]],
+        use_ssl: bool = True,
+        mailbox: str = "INBOX",
+        interval: float = 60.0,
+        batch_size: int = 25,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.on_message = on_message
+        self.use_ssl = use_ssl
+        self.mailbox = mailbox
+        self.interval = interval
+        self.batch_size = batch_size
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="relay-imap")
+        self._imap: typing.Optional[imaplib.IMAP4] = None
+        self._uidvalidity: typing.Optional[bytes] = None
+        self._last_uid: typing.Optional[int] = None
+        self._task: typing.Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self._call(self._close)
+        self._executor.shutdown(wait=False)
+
+    async def fetch_unseen(self) -> typing.List[Message]:
+        """Fetch the unread messages of the mailbox, marking them as read."""
+        return await self._call(self._fetch_unseen)
+
+    async def _run(self):
+        while True:
+            try:
+                for message in await self._call(self._poll):
+                    await self.on_message(message)
+            except (imaplib.IMAP4.error, OSError) as e:
+                log.warning("Polling the mailbox failed: %r", e)
+                await self._call(self._close)
+            except Exception:
+                log.exception("Unexpected error while polling the mailbox.")
+            await asyncio.sleep(self.interval)
+
+    def _call(self, func, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _poll(self) -> typing.List[Message]:
+        imap = self._connect()
+        imap.select(self.mailbox, readonly=True)
+        uidvalidity = imap.response("UIDVALIDITY")[1][0]
+        if self._last_uid is None or uidvalidity != self._uidvalidity:
+            # Start from the current end of the mailbox; UIDs from another UIDVALIDITY are meaningless.
+            self._uidvalidity = uidvalidity
+            _, data = imap.uid("SEARCH", None, "ALL")
+            self._last_uid = max((int(uid) for uid in data[0].split()), default=0)
+            return []
+        _, data = imap.uid("SEARCH", None, f"UID {self._last_uid + 1}:*")
+        # ``n:*`` always matches the newest message, even when its UID is below ``n``.
+        uids = [int(uid) for uid in data[0].split() if int(uid) > self._last_uid]
+        if not uids:
+            return []
+        messages = self._fetch(imap, uids, "(BODY.PEEK[])")
+        self._last_uid = max(uids)
+        return messages
+
+    def _fetch_unseen(self) -> typing.List[Message]:
+        imap = self._connect()
+        imap.select(self.mailbox)
+        _, data = imap.uid("SEARCH", None, "UNSEEN")
+        return self._fetch(imap, [int(uid) for uid in data[0].split()], "(RFC822)")
+
+    def _fetch(self, imap: imaplib.IMAP4, uids: typing.List[int], parts: str) -> typing.List[Message]:
+        messages = []
+        for start in range(0, len(uids), self.batch_size):
+            uid_set = ",".join(str(uid) for uid in uids[start:start + self.batch_size])
+            _, data = imap.uid("FETCH", uid_set, parts)
+            messages.extend(email.message_from_bytes(item[1]) for item in data if isinstance(item, tuple))
+        return messages
+
+    def _connect(self) -> imaplib.IMAP4:
+        if self._imap is not None:
+            try:
+                self._imap.noop()
+                return self._imap
+            except (imaplib.IMAP4.error, OSError):
+                self._close()
+        imap_class = imaplib.IMAP4_SSL if self.use_ssl else imaplib.IMAP4
+        # Without a timeout a stalled server would block the worker thread, and ``stop`` with it.
+        imap = imap_class(self.host, self.port, timeout=30)
+        imap.login(self.username, self.password)
+        self._imap = imap
+        return imap
+
+    def _close(self):
+        if self._imap is None:
+            return
+        try:
+            self._imap.logout()
+        except (imaplib.IMAP4.error, OSError):
+            pass
+        self._imap = None
@@ -1,13 +1,12 @@
 import discord
 from redbot.core import commands, Config
 from redbot.core.bot import Red
-import smtplib
-import imaplib
-import email
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from twilio.rest import Client
 
+from .mail import IMAPPoller, SMTPOutbox
+
 class SMTPConfigModal(discord.ui.Modal):
     def __init__(self, cog: commands.Cog):
         super().__init__(title="Set SMTP Configuration")
@@ -25,6 +24,7 @@ class SMTPConfigModal(discord.ui.Modal):
 
         for key, value in config_data.items():
             await self.cog.config.set_raw(key, value=value)
+        await self.cog.configure_mail()
 
         embed = discord.Embed(
             title="SMTP Configuration Set",
@@ -48,6 +48,7 @@ class IMAPConfigModal(discord.ui.Modal):
 
         for key, value in config_data.items():
             await self.cog.config.set_raw(key, value=value)
+        await self.cog.configure_mail()
 
         embed = discord.Embed(
             title="IMAP Configuration Set",
@@ -119,11 +120,70 @@ class Relay(commands.Cog):
             email_password="",
             imap_server="",
             imap_port=993,
+            imap_channel=None,
+            imap_poll_interval=60,
             twilio_account_sid="",
             twilio_auth_token="",
             twilio_phone_number="",
             user_phone_number=""
         )
+        self.outbox = None
+        self.poller = None
+
+    async def cog_load(self):
+        await self.configure_mail()
+
+    async def cog_unload(self):
+        await self.stop_mail()
+
+    async def stop_mail(self):
+        if self.outbox is not None:
+            await self.outbox.stop()
+            self.outbox = None
+        if self.poller is not None:
+            await self.poller.stop()
+            self.poller = None
+
+    async def configure_mail(self):
+        """(Re)create the mail transports from the current configuration."""
+        await self.stop_mail()
+        config = await self.config.all()
+        if config['smtp_server']:
+            self.outbox = SMTPOutbox(config['smtp_server'], int(config['smtp_port']), config['email_address'], config['email_password'])
+            self.outbox.start()
+        if config['imap_server']:
+            self.poller = IMAPPoller(
+                config['imap_server'],
+                int(config['imap_port']),
+                config['email_address'],
+                config['email_password'],
+                on_message=self.post_email,
+                interval=config['imap_poll_interval']
+            )
+            if config['imap_channel']:
+                self.poller.start()
+
+    async def post_email(self, msg):
+        channel = self.bot.get_channel(await self.config.imap_channel())
+        if channel is not None:
+            await channel.send(embed=self.email_embed(msg))
+
+    @staticmethod
+    def email_embed(msg):
+        body = ""
+        if msg.is_multipart():
+            for part in msg.walk():
+                if part.get_content_type() == "text/plain":
+                    body = part.get_payload(decode=True).decode(errors="replace")
+                    break
+        else:
+            body = msg.get_payload(decode=True).decode(errors="replace")
+        description = f"From: {msg['from']}\nSubject: {msg['subject']}\n\n{body}"
+        return discord.Embed(
+            title="New Email",
+            description=description[:4096],
+            color=discord.Color.blue()
+        )
 
     @commands.group()
     async def emailrelay(self, ctx):
@@ -139,20 +199,22 @@ class Relay(commands.Cog):
 
         Sends an email to the specified recipient with the given subject and body.
         """
-        config = await self.config.all()
+        if self.outbox is None:
+            embed = discord.Embed(
+                title="Error",
+                description="SMTP is not configured.",
+                color=discord.Color.red()
+            )
+            await ctx.send(embed=embed)
+            return
         msg = MIMEMultipart()
-        msg['From'] = config['email_address']
+        msg['From'] = await self.config.email_address()
         msg['To'] = to
         msg['Subject'] = subject
         msg.attach(MIMEText(body, 'plain'))
 
         try:
-            server = smtplib.SMTP(config['smtp_server'], config['smtp_port'])
-            server.starttls()
-            server.login(config['email_address'], config['email_password'])
-            text = msg.as_string()
-            server.sendmail(config['email_address'], to, text)
-            server.quit()
+            await self.outbox.send(msg)
             embed = discord.Embed(
                 title="Email Sent",
                 description="Email sent successfully.",
@@ -176,16 +238,18 @@ class Relay(commands.Cog):
 
         Checks for new unread emails in the inbox and displays them.
         """
-        config = await self.config.all()
+        if self.poller is None:
+            embed = discord.Embed(
+                title="Error",
+                description="IMAP is not configured.",
+                color=discord.Color.red()
+            )
+            await ctx.send(embed=embed)
+            return
         try:
-            mail = imaplib.IMAP4_SSL(config['imap_server'], config['imap_port'])
-            mail.login(config['email_address'], config['email_password'])
-            mail.select('inbox')
+            messages = await self.poller.fetch_unseen()
 
-            status, messages = mail.search(None, 'UNSEEN')
-            email_ids = messages[0].split()
-
-            if not email_ids:
+            if not messages:
                 embed = discord.Embed(
                     title="No New Emails",
                     description="There are no new emails.",
@@ -194,29 +258,8 @@ class Relay(commands.Cog):
                 await ctx.send(embed=embed)
                 return
 
-            for email_id in email_ids:
-                status, msg_data = mail.fetch(email_id, '(RFC822)')
-                msg = email.message_from_bytes(msg_data[0][1])
-                subject = msg['subject']
-                from_ = msg['from']
-                body = ""
-
-                if msg.is_multipart():
-                    for part in msg.walk():
-                        if part.get_content_type() == "text/plain":
-                            body = part.get_payload(decode=True).decode()
-                            break
-                else:
-                    body = msg.get_payload(decode=True).decode()
-
-                embed = discord.Embed(
-                    title="New Email",
-                    description=f"From: {from_}\nSubject: {subject}\n\n{body}",
-                    color=discord.Color.blue()
-                )
-                await ctx.send(embed=embed)
-
-            mail.logout()
+            for msg in messages:
+                await ctx.send(embed=self.email_embed(msg))
         except Exception as e:
             embed = discord.Embed(
                 title="Error",
@@ -225,6 +268,28 @@ class Relay(commands.Cog):
             )
             await ctx.send(embed=embed)
 
+    @emailrelay.command()
+    async def pollchannel(self, ctx, channel: discord.TextChannel = None):
+        """Post new emails to a channel as they arrive.
+
+        Usage:
+        [p]emailrelay pollchannel #channel
+
+        Polls the inbox for new emails and posts them in the given channel. Run without a channel to stop.
+        """
+        await self.config.imap_channel.set(channel.id if channel else None)
+        await self.configure_mail()
+        if channel:
+            description = f"New emails will be posted in {channel.mention}."
+        else:
+            description = "New emails will no longer be posted."
+        embed = discord.Embed(
+            title="Email Polling Updated",
+            description=description,
+            color=discord.Color.green()
+        )
+        await ctx.send(embed=embed)
+
     @commands.command()
     async def relaycall(self, ctx, to: str, message: str):
         """Relay a call from Discord to a phone number.
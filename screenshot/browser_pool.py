@@ -0,0 +1,87 @@
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, Callable, Optional
+
+log = logging.getLogger("star.screenshot.pool")
+
+
+class _Session:
+    def __init__(self):
+        self.driver: Optional[Any] = None
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    A fixed number of reusable browser sessions shared by queued jobs.
+
+    Browsers are started lazily by ``factory`` and kept warm between jobs. Jobs wait in
+    FIFO order for an idle session and run on a worker thread with a timeout. A session
+    is replaced after ``max_uses`` jobs, or as soon as a job fails or times out, since the
+    browser may be left in an unknown state.
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 2, max_uses: int = 50, timeout: float = 60.0):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.timeout = timeout
+        self.jobs = 0
+        self.recycled = 0
+        self.timeouts = 0
+        # Spare threads so a job stuck past its timeout does not starve the replacement session.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=size * 2, thread_name_prefix="screenshot")
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(_Session())
+        self._closed = False
+
+    async def run(self, job: Callable[[Any], Any]) -> Any:
+        """Run ``job(driver)`` on the next idle session and return its result."""
+        if self._closed:
+            raise RuntimeError("The browser pool is closed.")
+        session = await self._idle.get()
+        loop = asyncio.get_running_loop()
+        healthy = False
+        try:
+            if session.driver is None:
+                session.driver = await loop.run_in_executor(self._executor, self.factory)
+            session.uses += 1
+            self.jobs += 1
+            result = await asyncio.wait_for(loop.run_in_executor(self._executor, job, session.driver), timeout=self.timeout)
+            healthy = True
+            return result
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            if not healthy or session.uses >= self.max_uses:
+                self._retire(session)
+            self._idle.put_nowait(session)
+
+    async def close(self):
+        """Stop accepting jobs and close every browser, waiting for running jobs to finish."""
+        self._closed = True
+        for _ in range(self.size):
+            try:
+                session = await asyncio.wait_for(self._idle.get(), timeout=self.timeout)
+            except asyncio.TimeoutError:
+                break
+            self._retire(session)
+        self._executor.shutdown(wait=False)
+
+    def _retire(self, session: _Session):
+        if session.driver is None:
+            return
+        self.recycled += 1
+        self._executor.submit(self._quit, session.driver)
+        session.driver = None
+        session.uses = 0
+
+    @staticmethod
+    def _quit(driver: Any):
+        try:
+            driver.quit()
+        except Exception as e:
+            log.debug(f"Error closing browser session: {e}")
@@ -2,8 +2,8 @@ import io
 import logging
 import platform
 import subprocess
-import asyncio
-from typing import List
+import time
+from typing import Dict, Optional, Tuple
 
 import discord
 from redbot.core import commands
@@ -16,8 +16,18 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 
+from .browser_pool import BrowserPool
+
 log = logging.getLogger("star.screenshot")
 
+# Warm browser sessions, jobs per session before it is replaced, and seconds allowed per screenshot.
+POOL_SIZE = 2
+SESSION_MAX_USES = 50
+JOB_TIMEOUT = 60.0
+# Screenshots are reused for the same URL and viewport for this many seconds.
+CACHE_TTL = 300.0
+CACHE_MAX_ENTRIES = 32
+
 class Screenshot(Cog):
     """
     A cog for taking detailed screenshots of websites.
@@ -26,12 +36,17 @@ class Screenshot(Cog):
     def __init__(self, bot):
         self.bot = bot
         self.ensure_chrome_installed()
+        self.chromedriver_path: Optional[str] = None
+        self.pool = BrowserPool(self.create_driver, size=POOL_SIZE, max_uses=SESSION_MAX_USES, timeout=JOB_TIMEOUT)
+        # (url, width, height) -> (expires at, site name, screenshot)
+        self.cache: Dict[Tuple[str, int, int], Tuple[float, str, bytes]] = {}
         # Save the old screenshot command if it exists
         self.old_screenshot = self.bot.get_command("screenshot")
         if self.old_screenshot:
             self.bot.remove_command("screenshot")
 
-    def cog_unload(self):
+    async def cog_unload(self):
+        await self.pool.close()
         # Restore the old screenshot command if it existed
         if self.old_screenshot:
             try:
@@ -72,17 +87,18 @@ class Screenshot(Cog):
     @commands.is_owner()
     @commands.bot_has_permissions(embed_links=True, attach_files=True)
     @commands.command(name="screenshot", aliases=["ss"])
-    async def screenshot(self, ctx: commands.Context, url: str):
+    async def screenshot(self, ctx: commands.Context, url: str, width: int = 1920, height: int = 1080):
         """
-        Takes a screenshot of the specified URL.
+        Takes a screenshot of the specified URL, optionally with a custom viewport size.
         """
         # Ensure the URL starts with http:// or https://
         if not url.startswith(("http://", "https://")):
             url = "https://" + url
+        width = max(320, min(width, 3840))
+        height = max(240, min(height, 2160))
 
         async with ctx.typing():
-            loop = asyncio.get_event_loop()
-            site_name, screenshot = await loop.run_in_executor(None, self.take_screenshot, url)
+            site_name, screenshot = await self.get_screenshot(url, width, height)
 
             if screenshot is None:
                 await ctx.send("An error occurred while taking the screenshot.")
@@ -100,10 +116,31 @@ class Screenshot(Cog):
 
             await ctx.send(embed=embed, file=file)
 
-    def take_screenshot(self, url: str):
+    async def get_screenshot(self, url: str, width: int, height: int):
         """
-        Takes a screenshot of the given URL using Selenium.
+        Returns a cached screenshot of the URL and viewport, or takes one on a pooled browser.
+        """
+        key = (url, width, height)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        try:
+            site_name, screenshot = await self.pool.run(lambda driver: self.take_screenshot(driver, url, width, height))
+        except Exception as e:
+            log.error(f"Error during screenshot: {e!r}")
+            return None, None
+        self.cache.pop(key, None)
+        self.cache[key] = (time.monotonic() + CACHE_TTL, site_name, screenshot)
+        while len(self.cache) > CACHE_MAX_ENTRIES:
+            del self.cache[next(iter(self.cache))]
+        return site_name, screenshot
+
+    def create_driver(self):
         """
+        Starts a headless Chrome session for the browser pool.
+        """
+        if self.chromedriver_path is None:
+            self.chromedriver_path = ChromeDriverManager().install()
         chrome_options = Options()
         chrome_options.add_argument("--headless")
         chrome_options.add_argument("--no-sandbox")
@@ -116,22 +153,19 @@ class Screenshot(Cog):
         chrome_options.add_argument("--ignore-certificate-errors")
         chrome_options.add_argument("--disable-software-rasterizer")
 
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()), options=chrome_options
-        )
+        return webdriver.Chrome(service=ChromeService(self.chromedriver_path), options=chrome_options)
 
-        try:
-            driver.get(url)
-            self.handle_cookies(driver)
-            self.wait_for_dynamic_content(driver)
-            site_name = driver.title
-            screenshot = driver.get_screenshot_as_png()
-            return site_name, screenshot
-        except Exception as e:
-            log.error(f"Error during screenshot: {e}")
-            return None, None
-        finally:
-            driver.quit()
+    def take_screenshot(self, driver, url: str, width: int, height: int):
+        """
+        Takes a screenshot of the given URL using a pooled Selenium session.
+        """
+        driver.set_window_size(width, height)
+        driver.get(url)
+        self.handle_cookies(driver)
+        self.wait_for_dynamic_content(driver)
+        site_name = driver.title
+        screenshot = driver.get_screenshot_as_png()
+        return site_name, screenshot
 
     def handle_cookies(self, driver):
         """
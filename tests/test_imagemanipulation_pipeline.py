@@ -0,0 +1,45 @@
+import io
+
+import pytest
+
+pytest.importorskip("redbot")
+pytest.importorskip("legofy")
+Image = pytest.importorskip("PIL.Image")
+
+from imagemanipulation.pipeline import OperationError, parse_chain, process_image  # noqa: E402
+
+
+def _png(size=(8, 8)):
+    with io.BytesIO() as buffer:
+        Image.new("RGB", size, "red").save(buffer, "PNG")
+        return buffer.getvalue()
+
+
+def test_parse_chain():
+    assert parse_chain("resize 512 512 | contrast 1.5 -> sharpen 2") == (
+        ("resize", (512, 512)),
+        ("contrast", (1.5,)),
+        ("sharpen", (2.0,)),
+    )
+
+
+@pytest.mark.parametrize("text", ["", "   ", "resize 1 1 |", "| grayscale", "grayscale || invert"])
+def test_parse_chain_rejects_empty_steps(text):
+    with pytest.raises(OperationError):
+        parse_chain(text)
+
+
+def test_parse_chain_normalizes_filter_names():
+    assert parse_chain("imfilter blur") == (("imfilter", ("BLUR",)),)
+
+
+def test_process_image():
+    result = process_image(_png(), parse_chain("resize 4 2 | grayscale"))
+    assert Image.open(io.BytesIO(result)).size == (4, 2)
+
+
+def test_process_image_truncated_data():
+    # The header is intact, so ``Image.open`` succeeds and the decode fails inside the chain.
+    data = _png((256, 256))
+    with pytest.raises(OperationError):
+        process_image(data[: len(data) // 2], parse_chain("grayscale"))
@@ -0,0 +1,268 @@
+import asyncio
+import email
+import smtplib
+import socketserver
+import threading
+from email.message import EmailMessage
+
+import pytest
+
+pytest.importorskip("redbot")
+
+from relay.mail import IMAPPoller, SMTPOutbox  # noqa: E402
+
+
+def _message(subject):
+    message = EmailMessage()
+    message["From"] = "bot@localhost"
+    message["To"] = "someone@localhost"
+    message["Subject"] = subject
+    message.set_content(f"Body of {subject}")
+    return message
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, handler):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.connections = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO, MAIL, RCPT, DATA, RSET, NOOP and QUIT."""
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 localhost ready")
+        for line in self.rfile:
+            command = line.decode().strip().split(" ", 1)[0].split(":", 1)[0].upper()
+            if command == "EHLO":
+                self.reply("250 localhost")
+            elif command == "MAIL":
+                if server.reject_code:
+                    self.reply(f"{server.reject_code} rejected")
+                    if server.reject_code < 500:
+                        server.reject_code = None
+                else:
+                    self.reply("250 OK")
+            elif command == "RCPT":
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 end with .")
+                lines = []
+                for data_line in self.rfile:
+                    if data_line == b".\r\n":
+                        break
+                    lines.append(data_line)
+                server.received.append(email.message_from_bytes(b"".join(lines)))
+                self.reply("250 queued")
+            elif command in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+    def reply(self, text):
+        self.wfile.write(f"{text}\r\n".encode())
+
+
+class _IMAPHandler(socketserver.StreamRequestHandler):
+    """Just enough IMAP for imaplib over one mailbox held by the server."""
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self.untagged("OK IMAP4rev1 ready")
+        for line in self.rfile:
+            tag, command, *args = line.decode().strip().split(" ")
+            command = command.upper()
+            if command == "UID":
+                command = f"UID {args.pop(0).upper()}"
+            if command == "CAPABILITY":
+                self.untagged("CAPABILITY IMAP4rev1")
+            elif command in ("SELECT", "EXAMINE"):
+                self.untagged(f"{len(server.mailbox)} EXISTS")
+                self.untagged(f"OK [UIDVALIDITY {server.uidvalidity}] UIDs valid")
+            elif command == "UID SEARCH":
+                self.untagged(" ".join(["SEARCH", *(str(uid) for uid in self.search(args))]))
+            elif command == "UID FETCH":
+                uids = {int(uid) for uid in args[0].split(",")}
+                for number, (uid, body, _) in enumerate(server.mailbox, start=1):
+                    if uid in uids:
+                        self.wfile.write(f"* {number} FETCH (UID {uid} BODY[] {{{len(body)}}}\r\n".encode() + body + b")\r\n")
+                        if "(RFC822)" in args:
+                            server.mailbox[number - 1] = (uid, body, True)
+            elif command == "LOGOUT":
+                self.untagged("BYE")
+                self.tagged(tag)
+                return
+            self.tagged(tag)
+
+    def search(self, args):
+        mailbox = self.server.mailbox
+        if args[-1] == "UNSEEN":
+            return [uid for uid, _, seen in mailbox if not seen]
+        if args[-1] == "ALL":
+            return [uid for uid, _, _ in mailbox]
+        # ``n:*`` always includes the newest message, as on a real server.
+        start = int(args[-1].split(":")[0])
+        return sorted({uid for uid, _, _ in mailbox if uid >= start} | {mailbox[-1][0]}) if mailbox else []
+
+    def untagged(self, text):
+        self.wfile.write(f"* {text}\r\n".encode())
+
+    def tagged(self, tag):
+        self.wfile.write(f"{tag} OK done\r\n".encode())
+
+
+@pytest.fixture
+def smtp_server():
+    server = _Server(_SMTPHandler)
+    server.received = []
+    server.reject_code = None
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def imap_server():
+    server = _Server(_IMAPHandler)
+    server.uidvalidity = 1
+    server.mailbox = []  # (uid, raw message, seen)
+    server.add = lambda uid, subject: server.mailbox.append((uid, _message(subject).as_bytes(), False))
+    yield server
+    server.stop()
+
+
+def _outbox(server, **kwargs):
+    return SMTPOutbox("127.0.0.1", server.port, "", "", starttls=False, **kwargs)
+
+
+def test_outbox_reuses_one_session(smtp_server):
+    async def run():
+        outbox = _outbox(smtp_server)
+        outbox.start()
+        try:
+            await asyncio.gather(*(outbox.send(_message(f"message {i}")) for i in range(3)))
+        finally:
+            await outbox.stop()
+
+    asyncio.run(run())
+    assert [message["Subject"] for message in smtp_server.received] == ["message 0", "message 1", "message 2"]
+    assert smtp_server.connections == 1
+
+
+def test_outbox_retries_temporary_failures(smtp_server):
+    smtp_server.reject_code = 451
+
+    async def run():
+        outbox = _outbox(smtp_server)
+        outbox.start()
+        try:
+            await outbox.send(_message("retried"))
+        finally:
+            await outbox.stop()
+
+    asyncio.run(run())
+    assert [message["Subject"] for message in smtp_server.received] == ["retried"]
+    assert smtp_server.connections == 2
+
+
+def test_outbox_fails_permanent_rejections(smtp_server):
+    smtp_server.reject_code = 550
+
+    async def run():
+        outbox = _outbox(smtp_server)
+        outbox.start()
+        try:
+            with pytest.raises(smtplib.SMTPResponseException):
+                await outbox.send(_message("rejected"))
+        finally:
+            await outbox.stop()
+
+    asyncio.run(run())
+    assert smtp_server.received == []
+    assert smtp_server.connections == 1
+
+
+def _poller(server, on_message):
+    return IMAPPoller("127.0.0.1", server.port, "user", "password", on_message, use_ssl=False, interval=0.05, batch_size=2)
+
+
+def test_poller_reports_only_new_uids(imap_server):
+    imap_server.add(1, "already there")
+
+    async def run():
+        received = asyncio.Queue()
+        poller = _poller(imap_server, received.put)
+        poller.start()
+        try:
+            # The first poll only records where the mailbox ends.
+            await asyncio.sleep(0.2)
+            assert received.empty()
+            for uid in (2, 3, 4):
+                imap_server.add(uid, f"new {uid}")
+            subjects = [(await asyncio.wait_for(received.get(), timeout=5))["Subject"] for _ in range(3)]
+            await asyncio.sleep(0.2)
+            assert received.empty()
+            return subjects
+        finally:
+            await poller.stop()
+
+    assert asyncio.run(run()) == ["new 2", "new 3", "new 4"]
+    assert imap_server.connections == 1
+
+
+def test_poller_restarts_on_uidvalidity_change(imap_server):
+    imap_server.add(5, "old")
+
+    async def run():
+        received = asyncio.Queue()
+        poller = _poller(imap_server, received.put)
+        poller.start()
+        try:
+            await asyncio.sleep(0.2)
+            # The mailbox was rebuilt: UIDs restart and the old ones mean nothing anymore.
+            imap_server.uidvalidity = 2
+            imap_server.mailbox[:] = []
+            imap_server.add(1, "before the new baseline")
+            await asyncio.sleep(0.2)
+            assert received.empty()
+            imap_server.add(2, "after the new baseline")
+            return (await asyncio.wait_for(received.get(), timeout=5))["Subject"]
+        finally:
+            await poller.stop()
+
+    assert asyncio.run(run()) == "after the new baseline"
+
+
+def test_fetch_unseen(imap_server):
+    imap_server.add(1, "unread")
+
+    async def run():
+        poller = _poller(imap_server, None)
+        try:
+            first = await poller.fetch_unseen()
+            second = await poller.fetch_unseen()
+        finally:
+            await poller.stop()
+        return [message["Subject"] for message in first], second
+
+    assert asyncio.run(run()) == (["unread"], [])
@@ -1,9 +1,15 @@
+import asyncio
+import itertools
+import logging
 import discord 
+from discord.ext import tasks
 from redbot.core import commands
 from utils.classes import Colors, Emojis
 from discord.ui import Modal
 from cogs.events import blacklist, commandhelp, noperms
 
+log = logging.getLogger("red.voicemeister")
+
 class vcModal(Modal, title="rename your voice channel"):
        name = discord.ui.TextInput(
         label="voice channel name",
@@ -26,11 +32,17 @@ class vmbuttons(discord.ui.View):
     def __init__(self):
         super().__init__(timeout=None)
 
+    async def interaction_check(self, interaction: discord.Interaction):
+        # The buttons read the VoiceMaster caches, wait until they are loaded.
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+            await vm.loaded.wait()
+            return vm.load_error is None
+        return True
+
     @discord.ui.button(label="", emoji="<:icons_lock:1067625900851613727>", style=discord.ButtonStyle.gray, custom_id="persistent_view:lock")    
     async def lock(self, interaction: discord.Interaction, button: discord.ui.Button):
-         async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+         if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -45,8 +57,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -58,9 +69,8 @@ class vmbuttons(discord.ui.View):
 
     @discord.ui.button(label="", emoji="<:icons_unlock:1067625896585990264>", style=discord.ButtonStyle.gray, custom_id="persistent_view:unlock")
     async def unlock(self, interaction: discord.Interaction, button: discord.ui.Button):   
-        async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -75,8 +85,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -88,9 +97,8 @@ class vmbuttons(discord.ui.View):
 
     @discord.ui.button(label="", emoji="<:reveal:1067625891452162089>", style=discord.ButtonStyle.gray, custom_id="persistent_view:reveal")
     async def reveal(self, interaction: discord.Interaction, button: discord.ui.Button):
-        async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -105,8 +113,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -118,9 +125,8 @@ class vmbuttons(discord.ui.View):
       
     @discord.ui.button(label="", emoji="<:hide:1067625888654573669> ", style=discord.ButtonStyle.gray, custom_id="persistent_view:hide")
     async def hide(self, interaction: discord.Interaction, button: discord.ui.Button):
-        async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -135,8 +141,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -148,9 +153,8 @@ class vmbuttons(discord.ui.View):
 
     @discord.ui.button(label="", emoji="<:rename:1067625914407596052>", style=discord.ButtonStyle.gray, custom_id="persistent_view:rename")
     async def rename(self, interaction: discord.Interaction, button: discord.ui.Button): 
-       async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+       if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -165,8 +169,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -177,9 +180,8 @@ class vmbuttons(discord.ui.View):
     
     @discord.ui.button(label="", emoji="<:increase:1067625931205771355>", style=discord.ButtonStyle.gray, custom_id="persistent_view:increase")
     async def increase(self, interaction: discord.Interaction, button: discord.ui.Button):
-        async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -194,8 +196,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -214,9 +215,8 @@ class vmbuttons(discord.ui.View):
 
     @discord.ui.button(label="", emoji="<:decrease:1067625923920265247>", style=discord.ButtonStyle.gray, custom_id="persistent_view:decrease")
     async def decrease(self, interaction: discord.Interaction, button: discord.ui.Button):
-        async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -231,8 +231,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: You don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
@@ -251,9 +250,8 @@ class vmbuttons(discord.ui.View):
     
     @discord.ui.button(label="", emoji="<:claim:1067625919155544128>", style=discord.ButtonStyle.gray, custom_id="persistent_view:claim")
     async def claim(self, interaction: discord.Interaction, button: discord.ui.Button):
-         async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+         if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -268,8 +266,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {}".format(interaction.user.voice.channel.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id)
              if che is not None:
                 memberid = che[0]   
                 member = interaction.guild.get_member(memberid)
@@ -277,16 +274,14 @@ class vmbuttons(discord.ui.View):
                     embed = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: the owner is still in the voice channel")
                     await interaction.response.send_message(embed=embed, ephemeral=True, view=None)
                 else:
-                    await cursor.execute(f"UPDATE vcs SET user_id = {interaction.user.id} WHERE voice = {interaction.user.voice.channel.id}")
-                    await interaction.client.db.commit()
+                    vm.set_owner(interaction.user.voice.channel.id, interaction.user.id)
                     embed = discord.Embed(color=Colors.green, description=f"{Emojis.check} {interaction.user.mention}: you own {interaction.user.voice.channel.mention}")
                     await interaction.response.send_message(embed=embed, view=None, ephemeral=True)        
     
     @discord.ui.button(label="", emoji="<:info:1067625909902917734>", style=discord.ButtonStyle.gray, custom_id="persistent_view:info")
     async def info(self, interaction: discord.Interaction, button: discord.ui.Button):
-        async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+        if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -301,8 +296,7 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {}".format(interaction.user.voice.channel.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id)
              if che is not None:
                 memberid = che[0]   
                 member = interaction.guild.get_member(memberid)
@@ -313,9 +307,8 @@ class vmbuttons(discord.ui.View):
     
     @discord.ui.button(label="", emoji="<:delete:1067625906174173265>", style=discord.ButtonStyle.gray, custom_id="persistent_view:delete")
     async def delete(self, interaction: discord.Interaction, button: discord.ui.Button):
-     async with interaction.client.db.cursor() as cursor: 
-          await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(interaction.guild.id)) 
-          check = await cursor.fetchone()
+     if (vm := interaction.client.get_cog("VoiceMaster")) is not None:
+          check = vm.hub_row(interaction.guild.id)
           if check is not None:     
              channeid = check[1]
              voicechannel = interaction.guild.get_channel(channeid)
@@ -330,15 +323,13 @@ class vmbuttons(discord.ui.View):
                     await interaction.response.send_message(embed=emb, view=None, ephemeral=True) 
                     return
 
-             await cursor.execute("SELECT * FROM vcs WHERE voice = {} AND user_id = {}".format(interaction.user.voice.channel.id, interaction.user.id))
-             che = await cursor.fetchone()
+             che = vm.owner_row(interaction.user.voice.channel.id, interaction.user.id)
              if che is None:
                 embe = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {interaction.user.mention}: you don't own this voice channel")
                 await interaction.response.send_message(embed=embe, view=None, ephemeral=True)
                 return
              elif che is not None: 
-              await cursor.execute("DELETE FROM vcs WHERE voice = {}".format(interaction.user.voice.channel.id))
-              await interaction.client.db.commit()               
+              vm.remove_temp_channel(interaction.user.voice.channel.id)
               await interaction.user.voice.channel.delete() 
               embed = discord.Embed(color=Colors.green, description=f"{Emojis.check} {interaction.user.mention}: deleted the channel")
               await interaction.response.send_message(embed=embed, view=None, ephemeral=True)        
@@ -346,67 +337,159 @@ class vmbuttons(discord.ui.View):
 class VoiceMaster(commands.Cog): 
    def __init__(self, bot: commands.AutoShardedBot): 
         self.bot = bot 
-   
-   @commands.Cog.listener()
-   async def on_ready(self): 
+        # In-memory copies of the voicemaster and vcs tables, consulted on every voice state update.
+        self.hubs = {}  # guild_id -> (vc, interface)
+        self.temp_channels = {}  # voice channel id -> owner user id
+        # Parameterized statements waiting to be written in one transaction by ``flush_writes``.
+        self.pending_writes = []
+        self.write_lock = asyncio.Lock()
+        # Set once ``initialize`` is over, whether it succeeded or not; ``load_error`` tells which.
+        self.loaded = asyncio.Event()
+        self.load_error = None
+        self.init_task = None
+
+   async def cog_load(self):
+        self.init_task = self.bot.loop.create_task(self.initialize())
+
+   async def cog_unload(self):
+        if self.init_task is not None:
+            self.init_task.cancel()
+        # Let a write in progress finish, then write whatever is left.
+        self.flush_task.stop()
+        if self.load_error is None and self.loaded.is_set():
+            await self.flush_writes()
+
+   async def initialize(self):
+    try:
+      await self.load_caches()
+    except asyncio.CancelledError as e:
+      self.load_error = e
+      raise
+    except Exception as e:
+      self.load_error = e
+      log.exception("Failed to load the VoiceMaster tables.")
+    else:
+      self.flush_task.start()
+    finally:
+      self.loaded.set()
+
+   async def load_caches(self):
+    await self.bot.wait_until_ready()
     async with self.bot.db.cursor() as cursor: 
       await cursor.execute("CREATE TABLE IF NOT EXISTS voicemaster (guild_id INTEGER, vc INTEGER, interface INTEGER)")
       await cursor.execute("CREATE TABLE IF NOT EXISTS vcs (user_id INTEGER, voice INTEGER)") 
+      await cursor.execute("CREATE INDEX IF NOT EXISTS voicemaster_guild_id ON voicemaster (guild_id)")
+      await cursor.execute("CREATE INDEX IF NOT EXISTS vcs_voice ON vcs (voice)")
+      await cursor.execute("SELECT guild_id, vc, interface FROM voicemaster")
+      for guild_id, vc, interface in await cursor.fetchall():
+        self.hubs[guild_id] = (vc, interface)
+      await cursor.execute("SELECT user_id, voice FROM vcs")
+      for user_id, voice in await cursor.fetchall():
+        self.temp_channels[voice] = user_id
     await self.bot.db.commit()        
 
+   def hub_row(self, guild_id: int):
+    """Return the guild's ``voicemaster`` row as ``(guild_id, vc, interface)``, or ``None``."""
+    hub = self.hubs.get(guild_id)
+    return (guild_id, *hub) if hub is not None else None
+
+   def owner_row(self, voice_id: int, user_id: int = None):
+    """Return the ``vcs`` row ``(user_id, voice)`` of a temporary channel, optionally only if ``user_id`` owns it."""
+    owner = self.temp_channels.get(voice_id)
+    if owner is None or (user_id is not None and owner != user_id):
+        return None
+    return (owner, voice_id)
+
+   async def remove_hub(self, guild_id: int):
+    self.hubs.pop(guild_id, None)
+    self.pending_writes.append(("DELETE FROM voicemaster WHERE guild_id = ?", (guild_id,)))
+    await self.flush_writes()
+
+   def add_temp_channel(self, voice_id: int, owner_id: int):
+    self.temp_channels[voice_id] = owner_id
+    self.pending_writes.append(("INSERT INTO vcs VALUES (?,?)", (owner_id, voice_id)))
+
+   def set_owner(self, voice_id: int, owner_id: int):
+    self.temp_channels[voice_id] = owner_id
+    self.pending_writes.append(("UPDATE vcs SET user_id = ? WHERE voice = ?", (owner_id, voice_id)))
+
+   def remove_temp_channel(self, voice_id: int):
+    self.temp_channels.pop(voice_id, None)
+    self.pending_writes.append(("DELETE FROM vcs WHERE voice = ?", (voice_id,)))
+
+   async def cog_before_invoke(self, ctx: commands.Context):
+    await self.loaded.wait()
+    if self.load_error is not None:
+      raise commands.UserFeedbackCheckFailure("VoiceMaster could not load its data, check the logs.")
+
+   @tasks.loop(seconds=5)
+   async def flush_task(self):
+    try:
+      await self.flush_writes()
+    except Exception:
+      log.exception("Failed to write VoiceMaster changes, retrying on the next run.")
+
+   async def flush_writes(self):
+    """Write the queued statements in a single transaction, grouping runs of the same statement."""
+    async with self.write_lock:
+      if not self.pending_writes:
+        return
+      writes, self.pending_writes = self.pending_writes, []
+      try:
+        async with self.bot.db.cursor() as cursor:
+          for statement, group in itertools.groupby(writes, key=lambda write: write[0]):
+            await cursor.executemany(statement, [params for _, params in group])
+        await self.bot.db.commit()
+      except Exception:
+        # Keep the batch, in order, for the next attempt.
+        self.pending_writes[:0] = writes
+        await self.bot.db.rollback()
+        raise
+
    @commands.Cog.listener() 
    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
-     async with self.bot.db.cursor() as cursor: 
-      await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(member.guild.id))
-      check = await cursor.fetchone()
-      if check is not None:
-       chan = check[1]
+      await self.loaded.wait()
+      if self.load_error is not None:
+        return
+      hub = self.hubs.get(member.guild.id)
+      if hub is not None:
+       chan = hub[0]
        if (after.channel is not None and before.channel is None) or (after.channel is not None and before.channel is not None):
         if after.channel.id == int(chan) and before.channel is None:     
           channel = await member.guild.create_voice_channel(f"{member.name}'s channel", category=after.channel.category)
           await member.move_to(channel)
-          await cursor.execute("INSERT INTO vcs VALUES (?,?)", (member.id, after.channel.id))
-          await self.bot.db.commit()
+          self.add_temp_channel(channel.id, member.id)
         elif before.channel is not None and after.channel is not None:
-         await cursor.execute("SELECT * FROM vcs WHERE voice = {}".format(before.channel.id))
-         chek = await cursor.fetchone()
-         if (chek is not None) and (before.channel is not None and after.channel.id == int(chan)):
+         chek = before.channel.id in self.temp_channels
+         if chek and (before.channel is not None and after.channel.id == int(chan)):
           if before.channel.category == after.channel.category: 
            if before.channel.id == after.channel.id: return  
            await before.channel.delete()
-           await cursor.execute("DELETE FROM vcs WHERE voice = {}".format(before.channel.id))
-           await self.bot.db.commit() 
+           self.remove_temp_channel(before.channel.id)
            await member.move_to(channel=None)
           else: 
             chane = await member.guild.create_voice_channel(f"{member.name}'s channel", category=after.channel.category)
             await member.move_to(chane)
-            await cursor.execute("INSERT INTO vcs VALUES (?,?)", (member.id, chane.id))
-            await self.bot.db.commit()   
-         elif (chek is not None) and (before.channel is not None and after.channel.id != int(chan)):
+            self.add_temp_channel(chane.id, member.id)
+         elif chek and (before.channel is not None and after.channel.id != int(chan)):
             if before.channel.category == after.channel.category: 
              if before.channel.id == after.channel.id: return    
              await before.channel.delete()
-             await cursor.execute("DELETE FROM vcs WHERE voice = {}".format(before.channel.id))
-             await self.bot.db.commit() 
+             self.remove_temp_channel(before.channel.id)
             elif after.channel.category != before.channel.category: 
                  if before.channel.id == int(chan): return
                  channel = before.channel  
                  members = channel.members
                  if len(members) == 0:
-                  await cursor.execute("DELETE FROM vcs WHERE voice = {}".format(before.channel.id))
-                  await self.bot.db.commit()
+                  self.remove_temp_channel(before.channel.id)
                   await channel.delete() 
                   
        elif before.channel is not None and after.channel is None: 
-         async with self.bot.db.cursor() as curs: 
-            await curs.execute("SELECT * FROM vcs WHERE voice = {}".format(before.channel.id))
-            cheki = await curs.fetchone() 
-            if cheki is not None:  
+            if before.channel.id in self.temp_channels:  
                channel = before.channel  
                members = channel.members
                if len(members) == 0:
-                await curs.execute("DELETE FROM vcs WHERE voice = {}".format(before.channel.id))
-                await self.bot.db.commit()
+                self.remove_temp_channel(before.channel.id)
                 await channel.delete()   
            
    @commands.command(aliases=["vm"], help="sets voicemaster module for your server", description="config", usage="[subcommand]", brief="voicemaster set - sets voicemaster\nvoicemaster unset - unsets voice master")
@@ -421,9 +504,7 @@ class VoiceMaster(commands.Cog):
         await commandhelp(self, ctx, ctx.command.name) 
         return  
     elif option == "set":
-     async with self.bot.db.cursor() as cursor: 
-      await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(ctx.guild.id))
-      check = await cursor.fetchone() 
+      check = self.hub_row(ctx.guild.id)
       if check is not None:
             em = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {ctx.author.mention}: voice master is already set")
             await ctx.reply(embed=em, mention_author=False)
@@ -437,14 +518,13 @@ class VoiceMaster(commands.Cog):
         text = await ctx.guild.create_text_channel("panel", category=category, overwrites=overwrite)
         vc = await ctx.guild.create_voice_channel("j2c", category=category)
         await text.send(embed=em, view=vmbuttons())
-        await cursor.execute("INSERT INTO voicemaster VALUES (?,?,?)", (ctx.guild.id, vc.id, text.id))
-        await self.bot.db.commit()
+        self.hubs[ctx.guild.id] = (vc.id, text.id)
+        self.pending_writes.append(("INSERT INTO voicemaster VALUES (?,?,?)", (ctx.guild.id, vc.id, text.id)))
+        await self.flush_writes()
         e = discord.Embed(color=Colors.green, description=f"{Emojis.check} {ctx.author.mention}: configured the voice master interface")
         await ctx.reply(embed=e, mention_author=False)               
     elif option == "unset":
-      async with self.bot.db.cursor() as cursor: 
-         await cursor.execute("SELECT * FROM voicemaster WHERE guild_id = {}".format(ctx.guild.id))
-         check = await cursor.fetchone() 
+         check = self.hub_row(ctx.guild.id)
          if check is None:
             em = discord.Embed(color=Colors.yellow, description=f"{Emojis.warning} {ctx.author.mention}: voice master module isn't set")
             await ctx.reply(embed=em, mention_author=False)
@@ -465,15 +545,13 @@ class VoiceMaster(commands.Cog):
 
              await category.delete()    
              await channel2.delete()      
-             await cursor.execute("DELETE FROM voicemaster WHERE guild_id = {}".format(ctx.guild.id))
-             await self.bot.db.commit()
+             await self.remove_hub(ctx.guild.id)
              embed = discord.Embed(color=Colors.green, description=f"{Emojis.check} {ctx.author.mention}: voice master module has been disabled")
              await ctx.reply(embed=embed, mention_author=False) 
              return
             except:
              
-             await cursor.execute("DELETE FROM voicemaster WHERE guild_id = {}".format(ctx.guild.id))
-             await self.bot.db.commit()
+             await self.remove_hub(ctx.guild.id)
              embed = discord.Embed(color=Colors.green, description=f"{Emojis.check} {ctx.author.mention}: voice master module has been disabled")
              await ctx.reply(embed=embed, mention_author=False)  
     else: